@@ -0,0 +1,180 @@
+"""
+Process-local parquet cache shared by the check_* diagnostic scripts.
+
+Several checks open the same data lake file (usually fact_price.parquet) more
+than once per run. This module keeps the parsed footer and any decoded result
+around for the lifetime of the process, keyed by path and mtime so a file
+rewritten mid-session is picked up on the next call. Collected slices are
+also persisted across runs through _slice_cache.
+"""
+
+import hashlib
+import os
+from typing import Dict, Optional, Sequence, Tuple
+
+import polars as pl
+import pyarrow.parquet as pq
+
+from _slice_cache import load_or_compute, slice_key
+
+_META_CACHE: Dict[Tuple[str, int], pq.ParquetFile] = {}
+_SCAN_CACHE: Dict[Tuple, object] = {}
+
+
+def _file_key(path) -> Tuple[str, int]:
+    """(absolute path, mtime_ns) identifying one version of a file."""
+    p = os.path.abspath(os.fspath(path))
+    return p, os.stat(p).st_mtime_ns
+
+
+def _predicate_key(filters: Optional[pl.Expr]) -> Optional[str]:
+    """
+    Stable identity of a Polars predicate.
+
+    str(expr) abbreviates long literals (e.g. is_in lists print as
+    ["A0", "A1", … "A49"]), so distinct predicates can share a repr; hash
+    the full serialized expression instead.
+    """
+    if filters is None:
+        return None
+    return hashlib.sha256(filters.meta.serialize(format="json").encode()).hexdigest()
+
+
+def open_meta(path) -> pq.ParquetFile:
+    """Return a cached pq.ParquetFile (footer parsed once per file version)."""
+    key = _file_key(path)
+    pf = _META_CACHE.get(key)
+    if pf is None:
+        pf = pq.ParquetFile(key[0])
+        _META_CACHE[key] = pf
+    return pf
+
+
+def scan(
+    path,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[pl.Expr] = None,
+) -> pl.DataFrame:
+    """
+    Lazily scan a parquet file and memoize the collected result.
+
+    Args:
+        path: Parquet file path
+        columns: Optional column projection
+        filters: Optional Polars predicate applied during the scan
+
+    Returns:
+        Collected DataFrame (shared between callers; do not mutate in place)
+    """
+    file_key = _file_key(path)
+    key = (
+        file_key,
+        tuple(columns) if columns is not None else None,
+        _predicate_key(filters),
+    )
+    df = _SCAN_CACHE.get(key)
+    if df is None:
+        def compute() -> pl.DataFrame:
+            lf = pl.scan_parquet(file_key[0])
+            if filters is not None:
+                lf = lf.filter(filters)
+            if columns is not None:
+                lf = lf.select(list(columns))
+            return lf.collect()
+
+        df = load_or_compute(slice_key("scan", *key), compute)
+        _SCAN_CACHE[key] = df
+    return df
+
+
+def unique_values(path, column: str) -> list:
+    """Distinct values of one column (memoized per file version)."""
+    key = (_file_key(path), column, "unique")
+    values = _SCAN_CACHE.get(key)
+    if values is None:
+        values = (
+            pl.scan_parquet(key[0][0])
+            .select(column)
+            .unique(maintain_order=True)
+            .collect()[column]
+            .to_list()
+        )
+        _SCAN_CACHE[key] = values
+    return values
+
+
+def _stats_overlap(row_group, col_idx: int, lo, hi) -> bool:
+    """False only when the row group's min/max statistics exclude [lo, hi]."""
+    stats = row_group.column(col_idx).statistics
+    if stats is None or not stats.has_min_max:
+        return True
+    return stats.min <= hi and stats.max >= lo
+
+
+def read_date_range(
+    path,
+    start,
+    end,
+    asset_id: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> pl.DataFrame:
+    """
+    Read rows with start <= date <= end (and optionally one asset_id).
+
+    Row groups whose footer min/max statistics on `date` / `asset_id` cannot
+    match are skipped without being decoded; the surviving groups are filtered
+    exactly in memory. Results are memoized like scan().
+
+    Args:
+        path: Parquet file path with `date` (and `asset_id` if filtering on it)
+        start: First date (inclusive)
+        end: Last date (inclusive)
+        asset_id: Optional single asset to keep
+        columns: Optional column projection
+
+    Returns:
+        Collected DataFrame (shared between callers; do not mutate in place)
+    """
+    file_key = _file_key(path)
+    key = (file_key, "date_range", start, end, asset_id, tuple(columns) if columns is not None else None)
+    df = _SCAN_CACHE.get(key)
+    if df is None:
+        df = load_or_compute(
+            slice_key(*key),
+            lambda: _read_date_range(path, start, end, asset_id, columns),
+        )
+        _SCAN_CACHE[key] = df
+    return df
+
+
+def _read_date_range(path, start, end, asset_id, columns) -> pl.DataFrame:
+    """Uncached body of read_date_range()."""
+    pf = open_meta(path)
+    md = pf.metadata
+    names = md.schema.names
+    date_idx = names.index("date")
+    asset_idx = names.index("asset_id") if asset_id is not None else None
+    keep = [
+        i for i in range(md.num_row_groups)
+        if _stats_overlap(md.row_group(i), date_idx, start, end)
+        and (asset_idx is None or _stats_overlap(md.row_group(i), asset_idx, asset_id, asset_id))
+    ]
+
+    # Filter columns must be decoded even if the caller did not project them
+    read_cols = None
+    if columns is not None:
+        read_cols = list(dict.fromkeys(list(columns) + ["date"] + (["asset_id"] if asset_id is not None else [])))
+    if keep:
+        table = pf.read_row_groups(keep, columns=read_cols)
+    else:
+        table = pf.schema_arrow.empty_table()
+        if read_cols is not None:
+            table = table.select(read_cols)
+
+    predicate = pl.col("date").is_between(start, end)
+    if asset_id is not None:
+        predicate = predicate & (pl.col("asset_id") == asset_id)
+    df = pl.from_arrow(table).filter(predicate)
+    if columns is not None:
+        df = df.select(list(columns))
+    return df
@@ -0,0 +1,79 @@
+"""
+Persistent on-disk cache for filtered parquet slices used by the check_* scripts.
+
+The ETH/BTC diagnostics re-read the same (file, filter) slice of the data lake
+on every invocation during a debugging session. Each slice is stored once as a
+small parquet file under .cache/slices/, named by a hash of the source path,
+its mtime and the query, so rewriting the source file invalidates it. At most
+MAX_ENTRIES slices are kept; the least recently used ones are evicted.
+
+Set CHECK_SLICE_CACHE=0 to bypass the cache.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Callable
+
+import polars as pl
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "slices"
+
+# Slices kept on disk; each hit refreshes an entry's mtime (LRU order)
+MAX_ENTRIES = 64
+
+
+def _enabled() -> bool:
+    return os.environ.get("CHECK_SLICE_CACHE", "1").strip() != "0"
+
+
+def slice_key(*parts) -> str:
+    """
+    Stable hash of the source file version and query description.
+
+    Every part must have a complete, deterministic repr; pass Polars
+    predicates through their serialized form, not str(expr).
+    """
+    return hashlib.sha256(repr(parts).encode()).hexdigest()[:16]
+
+
+def load_or_compute(key: str, compute: Callable[[], pl.DataFrame]) -> pl.DataFrame:
+    """Return the cached slice for `key`, computing and storing it on a miss."""
+    if not _enabled():
+        return compute()
+
+    path = CACHE_DIR / f"{key}.parquet"
+    if path.exists():
+        try:
+            df = pl.read_parquet(path)
+            os.utime(path)
+            return df
+        except Exception:
+            pass  # Truncated/corrupt entry: recompute and overwrite
+
+    df = compute()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        df.write_parquet(tmp_path)
+        os.replace(tmp_path, path)
+        _evict()
+    except OSError:
+        pass  # Read-only checkout etc.: caching is best-effort
+    return df
+
+
+def _evict() -> None:
+    """Delete the least recently used slices beyond MAX_ENTRIES."""
+    entries = []
+    for entry in CACHE_DIR.glob("*.parquet"):
+        try:
+            entries.append((entry.stat().st_mtime_ns, entry))
+        except OSError:
+            continue  # Removed by a concurrent run
+    entries.sort(reverse=True)
+    for _, entry in entries[MAX_ENTRIES:]:
+        try:
+            entry.unlink()
+        except OSError:
+            pass
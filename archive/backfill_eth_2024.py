@@ -7,8 +7,10 @@ This script:
 3. Converts and appends to fact_price.parquet
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import date
+import numpy as np
 import pandas as pd
 
 sys.path.insert(0, str(Path(__file__).parent))
@@ -24,7 +26,7 @@ print("=" * 80)
 # Basic plan allows 2 years historical, so we can query 2024 directly
 # But to be safe and respect rate limits, we'll query in chunks
 print("\n[Step 1] Downloading ETH data for 2024 from CoinGecko...")
-print("  Note: Respecting 250 calls/min rate limit (0.25s between calls)")
+print("  Note: Respecting 250 calls/min rate limit (shared token bucket in the provider)")
 
 # Basic plan allows "within the past 2 years" - as of 2026-01-27, that's from ~2024-01-27
 # The fetch_price_history function uses offset_days=-2, so we need to account for that
@@ -53,7 +55,6 @@ for chunk_start, chunk_end in chunks:
         coingecko_id="ethereum",
         start_date=chunk_start,
         end_date=chunk_end,
-        sleep_seconds=0.25,  # Respect 250 calls/min rate limit
     )
     
     if prices:
@@ -124,10 +125,18 @@ else:
     volumes_wide = eth_volumes_df
 
 # Save updated wide format
+# Parquet encoding/compression runs in Arrow C++ and releases the GIL, so the
+# three independent writes overlap instead of running back to back.
+def write_parquet_parallel(jobs, **kwargs):
+    with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+        list(ex.map(lambda job: job[0].to_parquet(job[1], **kwargs), jobs))
+
 prices_path.parent.mkdir(parents=True, exist_ok=True)
-prices_wide.to_parquet(prices_path)
-mcaps_wide.to_parquet(mcaps_path)
-volumes_wide.to_parquet(volumes_path)
+write_parquet_parallel([
+    (prices_wide, prices_path),
+    (mcaps_wide, mcaps_path),
+    (volumes_wide, volumes_path),
+])
 print(f"  Updated prices_daily.parquet: {len(prices_wide)} days, {len(prices_wide.columns)} coins")
 print(f"  Updated marketcap_daily.parquet: {len(mcaps_wide)} days, {len(mcaps_wide.columns)} coins")
 print(f"  Updated volume_daily.parquet: {len(volumes_wide)} days, {len(volumes_wide.columns)} coins")
@@ -189,7 +198,7 @@ if not existing_fact_price.empty:
     combined_price = combined_price.drop_duplicates(subset=['asset_id', 'date'], keep='last')
     combined_price = combined_price.sort_values(['date', 'asset_id'])
 else:
-    combined_price = eth_fact_price
+    combined_price = eth_fact_price.sort_values(['date', 'asset_id'])
 
 if not existing_fact_mcap.empty:
     eth_2024_dates = set(eth_fact_mcap['date'].unique())
@@ -201,7 +210,7 @@ if not existing_fact_mcap.empty:
     combined_mcap = combined_mcap.drop_duplicates(subset=['asset_id', 'date'], keep='last')
     combined_mcap = combined_mcap.sort_values(['date', 'asset_id'])
 else:
-    combined_mcap = eth_fact_mcap
+    combined_mcap = eth_fact_mcap.sort_values(['date', 'asset_id'])
 
 if not existing_fact_volume.empty:
     eth_2024_dates = set(eth_fact_volume['date'].unique())
@@ -213,24 +222,28 @@ if not existing_fact_volume.empty:
     combined_volume = combined_volume.drop_duplicates(subset=['asset_id', 'date'], keep='last')
     combined_volume = combined_volume.sort_values(['date', 'asset_id'])
 else:
-    combined_volume = eth_fact_volume
+    combined_volume = eth_fact_volume.sort_values(['date', 'asset_id'])
 
 # Save updated fact tables
 data_lake_dir.mkdir(parents=True, exist_ok=True)
-combined_price.to_parquet(fact_price_path, index=False)
-combined_mcap.to_parquet(fact_mcap_path, index=False)
-combined_volume.to_parquet(fact_volume_path, index=False)
+write_parquet_parallel([
+    (combined_price, fact_price_path),
+    (combined_mcap, fact_mcap_path),
+    (combined_volume, fact_volume_path),
+], index=False)
 
 print(f"  Updated fact_price.parquet: {len(combined_price)} rows (+{len(eth_fact_price)} ETH rows)")
 print(f"  Updated fact_marketcap.parquet: {len(combined_mcap)} rows (+{len(eth_fact_mcap)} ETH rows)")
 print(f"  Updated fact_volume.parquet: {len(combined_volume)} rows (+{len(eth_fact_volume)} ETH rows)")
 
 # Verify
-eth_in_fact = combined_price[combined_price['asset_id'] == 'ETH']
-eth_2024_in_fact = eth_in_fact[
-    (eth_in_fact['date'] >= date(2024, 1, 1)) & 
-    (eth_in_fact['date'] <= date(2024, 12, 31))
-]
+# combined_price is sorted by (date, asset_id), so the ETH subset is date-sorted
+# and the 2024 window can be sliced with a binary search instead of a mask.
+eth_in_fact = combined_price[combined_price['asset_id'] == 'ETH'].reset_index(drop=True)
+eth_dates = eth_in_fact['date'].values
+lo = np.searchsorted(eth_dates, date(2024, 1, 1), side='left')
+hi = np.searchsorted(eth_dates, date(2024, 12, 31), side='right')
+eth_2024_in_fact = eth_in_fact.iloc[lo:hi]
 print(f"\n[Verification] ETH in fact_price for 2024: {len(eth_2024_in_fact)} rows")
 if len(eth_2024_in_fact) > 0:
     print(f"  Date range: {eth_2024_in_fact['date'].min()} to {eth_2024_in_fact['date'].max()}")
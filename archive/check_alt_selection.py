@@ -1,6 +1,5 @@
 """Check what ALT selection criteria are being used and what ALTs are selected."""
 
-import polars as pl
 import yaml
 from pathlib import Path
 
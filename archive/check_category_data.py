@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 """Check category data structure and see if we have asset mappings."""
 
-import polars as pl
 from pathlib import Path
-import json
 
 data_lake_dir = Path("data/curated/data_lake")
+category_files = [
+    "dim_categories.parquet",
+    "fact_category_market.parquet",
+    "dim_asset.parquet",
+    "fact_markets_snapshot.parquet",
+]
+# polars is only needed when at least one file exists; skip its import cost otherwise.
+if any((data_lake_dir / name).exists() for name in category_files):
+    import polars as pl
 
 print("=" * 80)
 print("CATEGORY DATA STRUCTURE CHECK")
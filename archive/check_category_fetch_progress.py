@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Check progress of category mapping fetch."""
 
-import polars as pl
 from pathlib import Path
 from datetime import datetime
 
@@ -14,6 +13,8 @@ print("=" * 80)
 print()
 
 if mapping_file.exists():
+    import polars as pl
+
     df = pl.read_parquet(str(mapping_file))
     
     # Get file modification time
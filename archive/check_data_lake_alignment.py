@@ -1,18 +1,51 @@
 """Check which parquet files are aligned to the standardized data lake format."""
 
-import pandas as pd
+import io
+import sys
+import pyarrow.parquet as pq
 from pathlib import Path
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+
+
+class Category(IntEnum):
+    """Summary bucket for a checked file; values index the bucket list in main()."""
+    FACT = 0
+    DIM = 1
+    MAP = 2
+    OUTPUT = 3
+    LEGACY_OUTPUT = 4
+    WIDE = 5
+    OTHER = 6
+    UNKNOWN = 7
+    ERROR = 8
+
+
+FORMAT_CATEGORY = {
+    'data_lake_fact': Category.FACT,
+    'data_lake_dimension': Category.DIM,
+    'data_lake_mapping': Category.MAP,
+    'data_lake_output': Category.OUTPUT,
+    'legacy_output': Category.LEGACY_OUTPUT,
+    'wide': Category.WIDE,
+    'other': Category.OTHER,
+}
+
 
 def check_file_alignment(file_path: Path, expected_format: str):
     """Check if a file is aligned to data lake format."""
     try:
-        df = pd.read_parquet(file_path)
-        cols = df.columns.tolist()
+        # Footer only: column names and row count need no column data
+        pf = pq.ParquetFile(file_path)
+        schema = pf.schema_arrow
+        # Match pd.read_parquet: stored pandas index columns are not data columns
+        pandas_meta = schema.pandas_metadata or {}
+        index_cols = {c for c in pandas_meta.get('index_columns', []) if isinstance(c, str)}
+        cols = [c for c in schema.names if c not in index_cols]
         
         info = {
             'file': str(file_path),
-            'rows': len(df),
+            'rows': pf.metadata.num_rows,
             'columns': cols,
             'format': 'unknown'
         }
@@ -98,32 +131,47 @@ def main():
         ('data/curated/perp_listings_binance_aligned.parquet', 'other'),
     ]
     
-    results = defaultdict(list)
+    buckets = [[] for _ in Category]
     
     print("Checking files...")
     print()
     
-    for file_path_str, expected_format in files_to_check:
+    def check_one(entry):
+        """Check one file and render its report block into a private buffer."""
+        file_path_str, expected_format = entry
         file_path = repo_root / file_path_str
+        buf = io.StringIO()
         if not file_path.exists():
-            print(f"[SKIP] {file_path_str} (not found)")
-            continue
+            buf.write(f"[SKIP] {file_path_str} (not found)\n")
+            return None, buf.getvalue()
         
         info = check_file_alignment(file_path, expected_format)
-        
         if 'error' in info:
-            print(f"[ERROR] {file_path_str}: {info['error']}")
-            results['error'].append(info)
+            buf.write(f"[ERROR] {file_path_str}: {info['error']}\n")
         else:
             status = "OK" if info.get('aligned') else "NOT ALIGNED" if info.get('aligned') == False else "?"
-            print(f"[{status:12}] {file_path_str}")
-            print(f"           Format: {info['format']}, Rows: {info['rows']:,}, Columns: {len(info['columns'])}")
+            buf.write(f"[{status:12}] {file_path_str}\n")
+            buf.write(f"           Format: {info['format']}, Rows: {info['rows']:,}, Columns: {len(info['columns'])}\n")
             if 'asset_id' in info['columns']:
-                print(f"           Has asset_id: YES")
+                buf.write(f"           Has asset_id: YES\n")
             if 'instrument_id' in info['columns']:
-                print(f"           Has instrument_id: YES")
-            print()
-            results[info['format']].append(info)
+                buf.write(f"           Has instrument_id: YES\n")
+            buf.write("\n")
+        return info, buf.getvalue()
+    
+    # Footer reads are independent and release the GIL inside Arrow, so issue
+    # them concurrently; map() keeps results in files_to_check order for printing.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        checked = list(executor.map(check_one, files_to_check))
+    
+    # One write per file block keeps each report contiguous
+    for info, text in checked:
+        sys.stdout.write(text)
+        if info is None:
+            continue
+        category = Category.ERROR if 'error' in info else FORMAT_CATEGORY.get(info['format'], Category.UNKNOWN)
+        buckets[category].append(info)
+    sys.stdout.flush()
     
     print("=" * 80)
     print("Summary")
@@ -131,24 +179,24 @@ def main():
     print()
     
     print("FILES ALIGNED TO DATA LAKE FORMAT:")
-    for info in results.get('data_lake_fact', []) + results.get('data_lake_dimension', []) + results.get('data_lake_mapping', []):
+    for info in buckets[Category.FACT] + buckets[Category.DIM] + buckets[Category.MAP]:
         print(f"  [OK] {Path(info['file']).name}")
     
     print()
     print("OUTPUT FILES (may need alignment):")
-    for info in results.get('data_lake_output', []):
+    for info in buckets[Category.OUTPUT]:
         print(f"  [OK] {Path(info['file']).name} (has asset_id)")
-    for info in results.get('legacy_output', []):
+    for info in buckets[Category.LEGACY_OUTPUT]:
         print(f"  [NEEDS WORK] {Path(info['file']).name} (missing asset_id)")
     
     print()
     print("WIDE FORMAT FILES (legacy, not aligned):")
-    for info in results.get('wide', []):
+    for info in buckets[Category.WIDE]:
         print(f"  [LEGACY] {Path(info['file']).name} (wide format, not normalized)")
     
     print()
     print("OTHER FILES:")
-    for info in results.get('other', []):
+    for info in buckets[Category.OTHER]:
         file_name = Path(info['file']).name
         if 'aligned' in file_name:
             print(f"  [OK] {file_name} (aligned)")
@@ -1,40 +1,73 @@
 import polars as pl
 import numpy as np
+from pathlib import Path
 
-bt = pl.read_csv('reports/majors_alts/bt_daily_pnl.csv').sort('date')
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _equity_and_drawdown(returns):
+    """Compounded equity and drawdown from running peak, in one pass over returns."""
+    equity = np.empty_like(returns)
+    drawdown = np.empty_like(returns)
+    eq = 1.0
+    peak = 1.0
+    for i in range(returns.shape[0]):
+        eq *= 1.0 + returns[i]
+        if i == 0 or eq > peak:
+            peak = eq
+        equity[i] = eq
+        drawdown[i] = (eq - peak) / peak
+    return equity, drawdown
+
+
+if HAS_NUMBA:
+    equity_and_drawdown = njit(cache=True)(_equity_and_drawdown)
+else:
+    def equity_and_drawdown(returns):
+        equity = np.cumprod(1.0 + returns)
+        running_max = np.maximum.accumulate(equity)
+        return equity, (equity - running_max) / running_max
+
+
+BT_COLUMNS = ['date', 'r_ls_net', 'major_gross', 'alt_gross', 'total_gross']
+# Prefer the typed parquet copy written next to the CSV (no text parsing); older
+# report directories only have the CSV
+if Path('reports/majors_alts/bt_daily_pnl.parquet').exists():
+    bt = pl.read_parquet('reports/majors_alts/bt_daily_pnl.parquet', columns=BT_COLUMNS)
+else:
+    bt = pl.read_csv('reports/majors_alts/bt_daily_pnl.csv', columns=BT_COLUMNS)
+bt = bt.sort('date')
 returns = bt['r_ls_net'].to_numpy()
-equity = np.cumprod(1.0 + returns)
 
 # Find periods of significant decline
-running_max = np.maximum.accumulate(equity)
-drawdown = (equity - running_max) / running_max
+equity, drawdown = equity_and_drawdown(returns.astype(np.float64, copy=False))
 
-# Find all drawdowns > 20%
-large_dds = []
-in_dd = False
-dd_start = None
-dd_start_idx = None
+# Find all drawdowns > 20%: locate runs of the mask via its rising/falling edges
+in_dd = drawdown < -0.20
+edges = np.diff(in_dd.astype(np.int8), prepend=0, append=0)
+dd_starts = np.flatnonzero(edges == 1)
+dd_ends = np.flatnonzero(edges == -1) - 1
+# A drawdown still open on the last day has not ended yet; only report recovered ones
+if len(dd_ends) > 0 and dd_ends[-1] == len(drawdown) - 1:
+    dd_starts, dd_ends = dd_starts[:-1], dd_ends[:-1]
 
-for i, dd in enumerate(drawdown):
-    if dd < -0.20:  # > 20% drawdown
-        if not in_dd:
-            in_dd = True
-            dd_start = bt['date'][i]
-            dd_start_idx = i
-    else:
-        if in_dd:
-            in_dd = False
-            dd_end = bt['date'][i-1]
-            dd_end_idx = i-1
-            min_dd = np.min(drawdown[dd_start_idx:dd_end_idx+1])
-            large_dds.append({
-                'start': dd_start,
-                'end': dd_end,
-                'days': dd_end_idx - dd_start_idx + 1,
-                'max_dd': min_dd,
-                'start_equity': equity[dd_start_idx],
-                'trough_equity': equity[np.argmin(drawdown[dd_start_idx:dd_end_idx+1]) + dd_start_idx],
-            })
+# Convert the date column once rather than crossing into Polars per lookup
+dates = bt['date'].to_list()
+large_dds = []
+for dd_start_idx, dd_end_idx in zip(dd_starts, dd_ends):
+    window = drawdown[dd_start_idx:dd_end_idx+1]
+    large_dds.append({
+        'start': dates[dd_start_idx],
+        'end': dates[dd_end_idx],
+        'days': int(dd_end_idx - dd_start_idx + 1),
+        'max_dd': window.min(),
+        'start_equity': equity[dd_start_idx],
+        'trough_equity': equity[dd_start_idx + window.argmin()],
+    })
 
 print("Large Drawdowns (>20%):")
 for i, dd_info in enumerate(large_dds, 1):
@@ -45,20 +78,22 @@ for i, dd_info in enumerate(large_dds, 1):
     print(f"   Trough Equity: {dd_info['trough_equity']:.4f}")
 
 # Check if the issue is the net long exposure in beta-neutral mode
+# Pull the exposure columns out once; every statistic below reuses these arrays
+major_gross = bt['major_gross'].to_numpy()
+alt_gross = bt['alt_gross'].to_numpy()
+net_exposure = major_gross - alt_gross
+
 print(f"\n\nNet Exposure Analysis:")
-print(f"Average net exposure: {(bt['major_gross'].mean() - bt['alt_gross'].mean())*100:.1f}%")
-print(f"Max net exposure: {(bt['major_gross'].max() - bt['alt_gross'].min())*100:.1f}%")
+print(f"Average net exposure: {(major_gross.mean() - alt_gross.mean())*100:.1f}%")
+print(f"Max net exposure: {(major_gross.max() - alt_gross.min())*100:.1f}%")
 
 # Check if losses correlate with net exposure
 print(f"\nCorrelation Analysis:")
-net_exposure = bt['major_gross'] - bt['alt_gross']
-correlation = bt.select([
-    pl.corr('r_ls_net', net_exposure).alias('corr_net_exp_returns')
-]).item()
+correlation = np.corrcoef(returns, net_exposure)[0, 1]
 print(f"  Correlation (net exposure vs returns): {correlation:.4f}")
 
 # Check worst periods by net exposure
-high_net_exp = bt.filter(net_exposure > 0.4)  # > 40% net long
-if len(high_net_exp) > 0:
-    print(f"\n  Days with >40% net long exposure: {len(high_net_exp)}")
-    print(f"  Average return on those days: {high_net_exp['r_ls_net'].mean()*100:.4f}%")
+high_net_exp = net_exposure > 0.4  # > 40% net long
+if high_net_exp.any():
+    print(f"\n  Days with >40% net long exposure: {int(high_net_exp.sum())}")
+    print(f"  Average return on those days: {returns[high_net_exp].mean()*100:.4f}%")
@@ -1,15 +1,13 @@
 import polars as pl
 from datetime import date
 
-# Load price data WITHOUT date filtering
-prices_full = pl.read_parquet('data/curated/data_lake/fact_price.parquet')
+from _parquet_cache import read_date_range
 
-# Check ETH in 2024
-eth_2024 = prices_full.filter(
-    (pl.col('asset_id') == 'ETH') & 
-    (pl.col('date') >= pl.date(2024, 1, 1)) & 
-    (pl.col('date') <= pl.date(2024, 12, 31))
-)
+FACT_PRICE_PATH = 'data/curated/data_lake/fact_price.parquet'
+START_2024, END_2024 = date(2024, 1, 1), date(2024, 12, 31)
+
+# Row groups whose footer date/asset_id statistics rule out ETH in 2024 are never decoded
+eth_2024 = read_date_range(FACT_PRICE_PATH, START_2024, END_2024, asset_id='ETH')
 print(f'ETH rows in 2024: {len(eth_2024)}')
 
 if len(eth_2024) > 0:
@@ -20,19 +18,12 @@ else:
     print('No ETH data in 2024!')
     
 # Check what happens when we filter by date range like the loader does
-prices_filtered = prices_full.filter(
-    (pl.col('date') >= pl.date(2024, 1, 1)) & 
-    (pl.col('date') <= pl.date(2024, 12, 31))
-)
+prices_filtered = read_date_range(FACT_PRICE_PATH, START_2024, END_2024, columns=['asset_id', 'date'])
 eth_in_filtered = prices_filtered.filter(pl.col('asset_id') == 'ETH')
 print(f'\nETH rows in date-filtered dataset (2024-01-01 to 2024-12-31): {len(eth_in_filtered)}')
 
 # Check BTC for comparison
-btc_2024 = prices_full.filter(
-    (pl.col('asset_id') == 'BTC') & 
-    (pl.col('date') >= pl.date(2024, 1, 1)) & 
-    (pl.col('date') <= pl.date(2024, 12, 31))
-)
+btc_2024 = read_date_range(FACT_PRICE_PATH, START_2024, END_2024, asset_id='BTC', columns=['asset_id', 'date'])
 print(f'\nBTC rows in 2024: {len(btc_2024)}')
 if len(btc_2024) > 0:
     print(f'BTC 2024 date range: {btc_2024["date"].min()} to {btc_2024["date"].max()}')
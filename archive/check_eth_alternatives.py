@@ -3,14 +3,19 @@ from datetime import date
 import sys
 import io
 
+from _parquet_cache import scan, unique_values
+
 # Fix encoding for Windows console
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
-# Load price data
-prices = pl.read_parquet('data/curated/data_lake/fact_price.parquet')
+FACT_PRICE_PATH = 'data/curated/data_lake/fact_price.parquet'
+# asset_id is low-cardinality: substring-match the distinct ids once, then
+# filter rows by set membership instead of scanning every row's string
+ETH_LIKE_IDS = [a for a in unique_values(FACT_PRICE_PATH, 'asset_id') if a is not None and 'ETH' in a]
+ETH_LIKE = pl.col('asset_id').is_in(ETH_LIKE_IDS)
 
 # Check dim_asset for ETH
-dim_asset = pl.read_parquet('data/curated/data_lake/dim_asset.parquet')
+dim_asset = scan('data/curated/data_lake/dim_asset.parquet')
 eth_in_dim = dim_asset.filter(
     (pl.col('asset_id') == 'ETH') | 
     (pl.col('symbol') == 'ETH') |
@@ -20,22 +25,27 @@ print('ETH in dim_asset:')
 print(eth_in_dim.select(['asset_id', 'symbol']).head(10))
 
 # Check all ETH-like assets in 2024
-eth_like_2024 = prices.filter(
-    (pl.col('asset_id').str.contains('ETH', literal=True)) &
-    (pl.col('date') >= pl.date(2024, 1, 1)) & 
-    (pl.col('date') <= pl.date(2024, 12, 31))
+eth_like_2024 = scan(
+    FACT_PRICE_PATH,
+    columns=['asset_id', 'date'],
+    filters=ETH_LIKE & pl.col('date').is_between(date(2024, 1, 1), date(2024, 12, 31)),
 )
 print(f'\nETH-like assets in 2024: {eth_like_2024["asset_id"].unique().to_list()}')
 
 # Check earliest date for any ETH-like asset
-eth_like_all = prices.filter(pl.col('asset_id').str.contains('ETH', literal=True))
+eth_like_all = scan(FACT_PRICE_PATH, columns=['asset_id', 'date'], filters=ETH_LIKE)
 if len(eth_like_all) > 0:
     print(f'\nEarliest date for any ETH-like asset: {eth_like_all["date"].min()}')
     print(f'Latest date for any ETH-like asset: {eth_like_all["date"].max()}')
     
     # Group by asset_id and show date ranges
     print('\nETH-like assets date ranges:')
-    for asset_id in eth_like_all["asset_id"].unique().to_list()[:10]:
-        asset_data = eth_like_all.filter(pl.col('asset_id') == asset_id)
-        if len(asset_data) > 0:
-            print(f'  {asset_id}: {asset_data["date"].min()} to {asset_data["date"].max()} ({len(asset_data)} rows)')
+    summary = eth_like_all.group_by('asset_id').agg([
+        pl.col('date').min().alias('min_date'),
+        pl.col('date').max().alias('max_date'),
+        pl.len().alias('rows'),
+    ]).head(10)
+    lines = summary.select(
+        pl.format('  {}: {} to {} ({} rows)', 'asset_id', 'min_date', 'max_date', 'rows').alias('line')
+    )['line']
+    sys.stdout.write('\n'.join(lines.to_list()) + '\n')
@@ -1,23 +1,24 @@
 import polars as pl
 from datetime import date
 
-# Load price data
-prices = pl.read_parquet('data/curated/data_lake/fact_price.parquet')
+from _parquet_cache import scan, unique_values
 
-# Check ETH
-eth_data = prices.filter(pl.col('asset_id') == 'ETH')
-print(f'ETH rows: {len(eth_data)}')
+FACT_PRICE_PATH = 'data/curated/data_lake/fact_price.parquet'
 
-if len(eth_data) > 0:
-    print(f'ETH date range: {eth_data["date"].min()} to {eth_data["date"].max()}')
-    print(f'ETH sample dates (first 10): {eth_data["date"].unique().sort().head(10).to_list()}')
+# Check ETH (asset filter pushed into the parquet scan)
+eth_data = scan(FACT_PRICE_PATH, filters=pl.col('asset_id') == 'ETH')
+# Row count and date bounds in one fused aggregation
+DATE_STATS = [pl.len().alias('n'), pl.col('date').min().alias('dmin'), pl.col('date').max().alias('dmax')]
+eth_n, eth_dmin, eth_dmax = eth_data.select(DATE_STATS).row(0)
+print(f'ETH rows: {eth_n}')
+
+if eth_n > 0:
+    print(f'ETH date range: {eth_dmin} to {eth_dmax}')
+    first_dates = eth_data.lazy().select(pl.col('date').unique().sort().head(10)).collect()['date'].to_list()
+    print(f'ETH sample dates (first 10): {first_dates}')
     
     # Check specific date range
-    eth_jan = prices.filter(
-        (pl.col('asset_id') == 'ETH') & 
-        (pl.col('date') >= pl.date(2024, 1, 8)) & 
-        (pl.col('date') <= pl.date(2024, 1, 15))
-    )
+    eth_jan = eth_data.filter(pl.col('date').is_between(date(2024, 1, 8), date(2024, 1, 15)))
     print(f'\nETH data for 2024-01-08 to 2024-01-15: {len(eth_jan)} rows')
     if len(eth_jan) > 0:
         print(eth_jan)
@@ -25,12 +26,14 @@ else:
     print('No ETH data found!')
     
 # Check all asset_ids containing ETH
-eth_like = prices.filter(pl.col('asset_id').str.contains('ETH', literal=True))
-if len(eth_like) > 0:
-    print(f'\nAll asset_ids containing ETH: {eth_like["asset_id"].unique().to_list()}')
+# (substring test runs over the distinct ids only, not every row)
+eth_like_ids = [a for a in unique_values(FACT_PRICE_PATH, 'asset_id') if a is not None and 'ETH' in a]
+if len(eth_like_ids) > 0:
+    print(f'\nAll asset_ids containing ETH: {eth_like_ids}')
 
 # Check BTC for comparison
-btc_data = prices.filter(pl.col('asset_id') == 'BTC')
-print(f'\nBTC rows: {len(btc_data)}')
-if len(btc_data) > 0:
-    print(f'BTC date range: {btc_data["date"].min()} to {btc_data["date"].max()}')
+btc_data = scan(FACT_PRICE_PATH, columns=['asset_id', 'date'], filters=pl.col('asset_id') == 'BTC')
+btc_n, btc_dmin, btc_dmax = btc_data.select(DATE_STATS).row(0)
+print(f'\nBTC rows: {btc_n}')
+if btc_n > 0:
+    print(f'BTC date range: {btc_dmin} to {btc_dmax}')
@@ -2,19 +2,34 @@
 Check if we can manually download ETH data for 2024.
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import date
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.providers.coingecko import fetch_price_history
 
+# Half-year chunks fetched concurrently. Each chunk stays above CoinGecko's
+# 90-day threshold so the API keeps returning daily (not hourly) points, and
+# fetch_price_history's shared token bucket keeps the pair under the rate limit.
+CHUNKS = [
+    (date(2024, 1, 1), date(2024, 6, 30)),
+    (date(2024, 7, 1), date(2024, 12, 31)),
+]
+
 # Try to fetch ETH data for 2024
 print("Attempting to fetch ETH data for 2024 from CoinGecko...")
-prices, mcaps, volumes = fetch_price_history(
-    coingecko_id="ethereum",
-    start_date=date(2024, 1, 1),
-    end_date=date(2024, 12, 31),
-)
+with ThreadPoolExecutor(max_workers=len(CHUNKS)) as executor:
+    results = list(executor.map(
+        lambda chunk: fetch_price_history(coingecko_id="ethereum", start_date=chunk[0], end_date=chunk[1]),
+        CHUNKS,
+    ))
+
+prices, mcaps, volumes = {}, {}, {}
+for chunk_prices, chunk_mcaps, chunk_volumes in results:
+    prices.update(chunk_prices)
+    mcaps.update(chunk_mcaps)
+    volumes.update(chunk_volumes)
 
 print(f"\nETH 2024 data from CoinGecko:")
 print(f"  Prices: {len(prices)} days")
@@ -1,6 +1,11 @@
 import polars as pl
+from pathlib import Path
 
-bt = pl.read_csv('reports/majors_alts/bt_daily_pnl.csv')
+# Prefer the typed parquet copy; fall back to the CSV for older report directories
+if Path('reports/majors_alts/bt_daily_pnl.parquet').exists():
+    bt = pl.read_parquet('reports/majors_alts/bt_daily_pnl.parquet')
+else:
+    bt = pl.read_csv('reports/majors_alts/bt_daily_pnl.csv')
 
 print("Gross exposure stats:")
 print(f"  ALT gross: mean={bt['alt_gross'].mean():.3f}, max={bt['alt_gross'].max():.3f}")
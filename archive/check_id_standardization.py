@@ -4,13 +4,35 @@ Examines ID columns and compares them across different data sources.
 """
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import json
 import datetime
+import os
+import pickle
 import numpy as np
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _json_default(obj):
+    """JSON fallback for values the encoder does not handle natively."""
+    if isinstance(obj, (pd.Timestamp, datetime.date, datetime.datetime)):
+        return str(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if hasattr(obj, 'item'):  # numpy scalar types
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 def get_parquet_files(base_dir="data"):
     """Find all parquet files in data directory."""
     data_dir = Path(base_dir)
@@ -25,55 +47,135 @@ def get_parquet_files(base_dir="data"):
     
     return sorted(parquet_files)
 
+def _drop_missing(arr):
+    """Drop nulls (and NaN for float columns), matching pandas dropna()."""
+    arr = arr.drop_null()
+    if pa.types.is_floating(arr.type):
+        arr = arr.filter(pc.invert(pc.is_nan(arr)))
+    return arr
+
+def _count_distinct(arr):
+    """Distinct non-missing values; all-null columns (Arrow null type) count 0."""
+    return pc.count_distinct(arr).as_py() if len(arr) > 0 else 0
+
+def _unique_array(uniques):
+    """NumPy view of an Arrow unique array; temporal values stay Python objects."""
+    if pa.types.is_temporal(uniques.type):
+        # to_numpy would give datetime64, whose tolist() turns ns timestamps into ints
+        return pd.Series(uniques.to_pylist(), dtype=object).to_numpy()
+    return uniques.to_numpy(zero_copy_only=False)
+
+def _pandas_dtype_name(empty_df, col, arrow_type, null_count):
+    """dtype pandas would report for `col` when reading the file with pd.read_parquet."""
+    if null_count > 0:
+        # pandas upcasts nullable ints to float64 and nullable bools to object
+        if pa.types.is_integer(arrow_type):
+            return 'float64'
+        if pa.types.is_boolean(arrow_type):
+            return 'object'
+    return str(empty_df[col].dtype)
+
+# Files written by the same pipeline share one schema (e.g. partitioned fact
+# tables). Everything derived from a schema is built once per distinct schema,
+# keyed by a digest of its serialized form.
+_SCHEMA_CACHE = {}
+
+ID_KEYWORDS = [
+    'id', 'asset_id', 'instrument_id', 'canonical',
+    'symbol', 'ticker', 'provider_asset_id', 'provider_instrument_id'
+]
+
+def _schema_info(schema):
+    """Return (key, cached schema info) for an Arrow schema, deduped by fingerprint."""
+    key = hashlib.blake2b(schema.serialize().to_pybytes()).digest()
+    info = _SCHEMA_CACHE.get(key)
+    if info is None:
+        columns = [field.name for field in schema]
+        # pd.read_parquet would turn stored index columns into the index, not data
+        pandas_meta = schema.pandas_metadata or {}
+        info = {
+            'schema': schema,
+            'columns': columns,
+            # Identify ID columns (common patterns)
+            'id_columns': [col for col in columns if any(keyword in col.lower() for keyword in ID_KEYWORDS)],
+            'index_cols': {c for c in pandas_meta.get('index_columns', []) if isinstance(c, str)},
+            'empty_df': schema.empty_table().to_pandas(),
+        }
+        # setdefault keeps one shared entry if two threads race on a new schema
+        info = _SCHEMA_CACHE.setdefault(key, info)
+    return key, info
+
 def analyze_parquet_file(file_path):
     """Analyze a single parquet file and extract ID information."""
     try:
         # Read schema without loading full data
         parquet_file = pq.ParquetFile(file_path)
-        schema = parquet_file.schema_arrow
+        schema_key, schema_info = _schema_info(parquet_file.schema_arrow)
+        columns = schema_info['columns']
+        id_columns = schema_info['id_columns']
         
-        # Get column names
-        columns = [field.name for field in schema]
+        index_cols = schema_info['index_cols']
+        empty_df = schema_info['empty_df']
+        id_fields = [col for col in id_columns if col not in index_cols]
+        # Row count comes from the footer; no page needs decoding for it
+        total_rows = parquet_file.metadata.num_rows
+        sample_rows = min(total_rows, 1000)
+        # Small files are sampled whole: full-file stats are the sample's, so
+        # neither the per-batch uniques nor a separate sample count is needed
+        whole_file_sampled = total_rows <= 1000
         
-        # Identify ID columns (common patterns)
-        id_columns = [col for col in columns if any(
-            keyword in col.lower() for keyword in [
-                'id', 'asset_id', 'instrument_id', 'canonical', 
-                'symbol', 'ticker', 'provider_asset_id', 'provider_instrument_id'
-            ]
-        )]
-        
-        # Read full file to analyze
-        df_full = pd.read_parquet(file_path)
-        df_sample = df_full.head(1000)
+        # Stream the ID columns batch by batch in Arrow: per-batch uniques and
+        # null counts are accumulated so the full columns are never held at
+        # once. The unique sets are kept for find_id_overlaps. The sample is
+        # the head of the first batch: batches span row groups, so it holds
+        # min(num_rows, batch_size) >= sample_rows rows and the sample costs
+        # no decoding beyond the stream itself.
+        unique_parts = {col: [] for col in id_fields}
+        null_counts = dict.fromkeys(id_fields, 0)
+        sample = schema_info['schema'].empty_table().select(id_fields)
+        if id_fields:
+            batches = parquet_file.iter_batches(columns=id_fields, use_threads=True)
+            for i, batch in enumerate(batches):
+                if i == 0:
+                    sample = pa.Table.from_batches([batch.slice(0, sample_rows)])
+                for col in id_fields:
+                    arr = batch.column(col)
+                    null_counts[col] += arr.null_count
+                    if not whole_file_sampled:
+                        unique_parts[col].append(pc.unique(_drop_missing(arr)))
         
         id_info = {}
-        for col in id_columns:
-            if col in df_full.columns:
-                sample_values = df_sample[col].dropna().head(20).tolist()
-                dtype = str(df_full[col].dtype)
-                unique_count_sample = df_sample[col].nunique()
-                unique_count_full = df_full[col].nunique()
-                null_count_sample = df_sample[col].isna().sum()
-                total_count_sample = len(df_sample)
-                total_count_full = len(df_full)
-                
-                id_info[col] = {
-                    'dtype': dtype,
-                    'sample_values': sample_values,
-                    'unique_count_sample': unique_count_sample,
-                    'unique_count_full': unique_count_full,
-                    'null_count_sample': null_count_sample,
-                    'total_count_sample': total_count_sample,
-                    'total_count_full': total_count_full
-                }
+        unique_values = {}
+        for col in id_fields:
+            arrow_type = schema_info['schema'].field(col).type
+            sample_col = sample.column(col)
+            sample_valid = _drop_missing(sample_col)
+            if whole_file_sampled:
+                uniques = pc.unique(sample_valid)
+                unique_count_sample = len(uniques)
+            else:
+                uniques = pc.unique(pa.chunked_array(unique_parts[col], type=arrow_type))
+                unique_count_sample = _count_distinct(sample_valid)
+            unique_values[col] = _unique_array(uniques)
+            
+            id_info[col] = {
+                'dtype': _pandas_dtype_name(empty_df, col, arrow_type, null_counts[col]),
+                'sample_values': sample_valid.slice(0, 20).to_pylist(),
+                'unique_count_sample': unique_count_sample,
+                'unique_count_full': len(uniques),
+                'null_count_sample': len(sample_col) - len(sample_valid),
+                'total_count_sample': sample_rows,
+                'total_count_full': total_rows
+            }
         
         return {
             'file_path': str(file_path),
             'columns': columns,
             'id_columns': id_columns,
             'id_info': id_info,
-            'num_rows_sample': len(df_sample)
+            'num_rows_sample': sample_rows,
+            'schema_key': schema_key.hex(),
+            'unique_values': unique_values,
         }
     
     except Exception as e:
@@ -82,6 +184,58 @@ def analyze_parquet_file(file_path):
             'error': str(e)
         }
 
+# Per-file analysis results (including the unique arrays used by
+# find_id_overlaps) persist across runs, keyed by path, mtime and size, so
+# unchanged files are not re-read. Least recently used entries beyond
+# ID_CACHE_MAX_ENTRIES are evicted. Set CHECK_SLICE_CACHE=0 to bypass it,
+# as for the other check_* caches.
+ID_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "id_overlap"
+ID_CACHE_MAX_ENTRIES = 512
+
+def _id_cache_enabled():
+    return os.environ.get("CHECK_SLICE_CACHE", "1").strip() != "0"
+
+def _id_cache_path(file_path):
+    st = os.stat(file_path)
+    key = f"{os.path.abspath(file_path)}:{st.st_mtime_ns}:{st.st_size}"
+    return ID_CACHE_DIR / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.pkl"
+
+def analyze_parquet_file_cached(file_path):
+    """analyze_parquet_file() backed by the on-disk result cache."""
+    if not _id_cache_enabled():
+        return analyze_parquet_file(file_path)
+    
+    cache_path = _id_cache_path(file_path)
+    try:
+        with open(cache_path, 'rb') as f:
+            result = pickle.load(f)
+        os.utime(cache_path)  # mark as recently used
+        result['file_path'] = str(file_path)
+        return result
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass  # Missing or corrupt entry: recompute and overwrite
+    
+    result = analyze_parquet_file(file_path)
+    if 'error' not in result:
+        try:
+            ID_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.{os.urandom(4).hex()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Read-only checkout etc.: caching is best-effort
+    return result
+
+def evict_id_cache(max_entries=ID_CACHE_MAX_ENTRIES):
+    """Drop the least recently used cache entries beyond max_entries."""
+    try:
+        entries = sorted(ID_CACHE_DIR.glob("*.pkl"), key=lambda p: p.stat().st_mtime_ns, reverse=True)
+        for stale in entries[max_entries:]:
+            stale.unlink()
+    except OSError:
+        pass
+
 def compare_ids_across_files(analysis_results):
     """Compare ID formats and values across files."""
     # Group by ID column name
@@ -135,21 +289,70 @@ def analyze_value_patterns(values):
     if not values:
         return {}
     
+    # Values are partitioned by type once. String checks run as Arrow kernels
+    # over the str subset (a filter of the same array) and are skipped for
+    # non-string columns; lengths are taken over str(v) of every value.
+    is_str = [isinstance(v, str) for v in values]
+    n_str = sum(is_str)
+    texts = pa.array([v if s else str(v) for v, s in zip(values, is_str)], type=pa.large_string())
+    
+    def count(mask):
+        return pc.sum(mask).as_py() or 0
+    
+    string_counts = dict.fromkeys(
+        ['has_underscores', 'has_dashes', 'has_colons', 'is_lowercase', 'is_uppercase', 'is_mixed_case', 'digits'], 0
+    )
+    if n_str:
+        strings = texts if n_str == len(values) else texts.filter(pa.array(is_str))
+        lower = pc.utf8_is_lower(strings)
+        upper = pc.utf8_is_upper(strings)
+        string_counts.update({
+            'has_underscores': count(pc.match_substring(strings, '_')),
+            'has_dashes': count(pc.match_substring(strings, '-')),
+            'has_colons': count(pc.match_substring(strings, ':')),
+            'is_lowercase': count(lower),
+            'is_uppercase': count(upper),
+            'is_mixed_case': n_str - count(pc.or_(lower, upper)),
+            'digits': count(pc.utf8_is_digit(strings)),
+        })
+    numbers = 0
+    if n_str < len(values):
+        numbers = sum(1 for v, s in zip(values, is_str) if not s and isinstance(v, (int, float)))
+    
+    lengths = pc.utf8_length(texts)
+    length_range = pc.min_max(lengths).as_py()
+    
     patterns = {
-        'has_underscores': sum(1 for v in values if isinstance(v, str) and '_' in str(v)),
-        'has_dashes': sum(1 for v in values if isinstance(v, str) and '-' in str(v)),
-        'has_colons': sum(1 for v in values if isinstance(v, str) and ':' in str(v)),
-        'is_lowercase': sum(1 for v in values if isinstance(v, str) and str(v).islower()),
-        'is_uppercase': sum(1 for v in values if isinstance(v, str) and str(v).isupper()),
-        'is_mixed_case': sum(1 for v in values if isinstance(v, str) and not str(v).islower() and not str(v).isupper()),
-        'numeric_only': sum(1 for v in values if isinstance(v, (int, float)) or (isinstance(v, str) and v.isdigit())),
-        'avg_length': sum(len(str(v)) for v in values) / len(values) if values else 0,
-        'min_length': min(len(str(v)) for v in values) if values else 0,
-        'max_length': max(len(str(v)) for v in values) if values else 0,
+        'has_underscores': string_counts['has_underscores'],
+        'has_dashes': string_counts['has_dashes'],
+        'has_colons': string_counts['has_colons'],
+        'is_lowercase': string_counts['is_lowercase'],
+        'is_uppercase': string_counts['is_uppercase'],
+        'is_mixed_case': string_counts['is_mixed_case'],
+        'numeric_only': string_counts['digits'] + numbers,
+        'avg_length': count(lengths) / len(values),
+        'min_length': length_range['min'],
+        'max_length': length_range['max'],
     }
     
     return patterns
 
+def _factorize_ids(arrays):
+    """
+    Codes and representative values for the concatenated unique arrays.
+
+    Values are keyed by 64-bit pandas hashes, so the grouping is a sort over
+    uint64 instead of hashing Python objects. If any two distinct values
+    share a hash, it falls back to exact pd.factorize.
+    """
+    values = np.concatenate(arrays)
+    hashes = np.concatenate([pd.util.hash_array(a) for a in arrays])
+    _, first, codes = np.unique(hashes, return_index=True, return_inverse=True)
+    representatives = values[first]
+    if not (representatives[codes] == values).all():
+        return pd.factorize(values)
+    return codes, representatives
+
 def find_id_overlaps(analysis_results):
     """Find overlapping ID values across different files."""
     id_value_sets = defaultdict(dict)
@@ -159,14 +362,8 @@ def find_id_overlaps(analysis_results):
             continue
         
         file_path = Path(result['file_path']).name
-        for col, info in result['id_info'].items():
-            try:
-                df = pd.read_parquet(result['file_path'])
-                if col in df.columns:
-                    unique_values = set(df[col].dropna().unique())
-                    id_value_sets[col][file_path] = unique_values
-            except Exception as e:
-                print(f"  Warning: Could not load {file_path} for overlap check: {e}")
+        for col, unique_values in result['unique_values'].items():
+            id_value_sets[col][file_path] = unique_values
     
     overlaps = {}
     for col_name, file_value_sets in id_value_sets.items():
@@ -176,24 +373,39 @@ def find_id_overlaps(analysis_results):
         file_names = list(file_value_sets.keys())
         overlaps[col_name] = {}
         
+        # Factorize all files' unique arrays together, then mark which files
+        # hold each value in a membership matrix. Only values present in two
+        # or more files can contribute to an intersection, so the pairwise
+        # intersection counts come from one small matrix product over those rows.
+        arrays = [file_value_sets[f] for f in file_names]
+        codes, values = _factorize_ids(arrays)
+        file_index = np.repeat(np.arange(len(arrays)), [len(a) for a in arrays])
+        membership = np.zeros((len(values), len(arrays)), dtype=bool)
+        membership[codes, file_index] = True
+        file_sizes = membership.sum(axis=0)
+        is_shared = membership.sum(axis=1) >= 2
+        shared = membership[is_shared]
+        shared_values = values[is_shared]
+        shared_counts = shared.T.astype(np.int64) @ shared.astype(np.int64)
+        
         # Check pairwise overlaps
         for i, file1 in enumerate(file_names):
-            for file2 in file_names[i+1:]:
-                set1 = file_value_sets[file1]
-                set2 = file_value_sets[file2]
-                intersection = set1 & set2
-                union = set1 | set2
+            for j in range(i + 1, len(file_names)):
+                file2 = file_names[j]
+                intersection_size = int(shared_counts[i, j])
+                union_size = int(file_sizes[i] + file_sizes[j]) - intersection_size
                 
-                if len(union) > 0:
-                    overlap_pct = len(intersection) / len(union) * 100
+                if union_size > 0:
+                    overlap_pct = intersection_size / union_size * 100
                 else:
                     overlap_pct = 0
                 
+                in_both = np.flatnonzero(shared[:, i] & shared[:, j])[:10]
                 overlaps[col_name][f"{file1} <-> {file2}"] = {
-                    'intersection_size': len(intersection),
-                    'union_size': len(union),
+                    'intersection_size': intersection_size,
+                    'union_size': union_size,
                     'overlap_percentage': overlap_pct,
-                    'sample_intersection': list(intersection)[:10]
+                    'sample_intersection': shared_values[in_both].tolist()
                 }
     
     return overlaps
@@ -210,13 +422,15 @@ def main():
     print(f"Found {len(parquet_files)} parquet files")
     print()
     
-    # Analyze each file
+    # Analyze each file (independent parquet decodes, run concurrently; map()
+    # preserves file order so the log below reads the same as a serial run)
     print("Analyzing files...")
-    analysis_results = []
-    for file_path in parquet_files:
+    with ThreadPoolExecutor(max_workers=min(32, max(1, len(parquet_files)))) as executor:
+        analysis_results = list(executor.map(analyze_parquet_file_cached, parquet_files))
+    if _id_cache_enabled():
+        evict_id_cache()
+    for file_path, result in zip(parquet_files, analysis_results):
         print(f"  Analyzing: {file_path.name}")
-        result = analyze_parquet_file(file_path)
-        analysis_results.append(result)
         if 'error' in result:
             print(f"    ERROR: {result['error']}")
         else:
@@ -311,35 +525,26 @@ def main():
     # Save results to JSON
     output_file = "id_standardization_report.json"
     report = {
-        'analysis_results': analysis_results,
+        # unique_values are working arrays for the overlap check, not report content
+        'analysis_results': [
+            {k: v for k, v in result.items() if k != 'unique_values'}
+            for result in analysis_results
+        ],
         'comparisons': comparisons,
         'overlaps': overlaps
     }
     
-    # Convert to JSON-serializable format
-    def make_serializable(obj):
-        if isinstance(obj, (dict, list)):
-            if isinstance(obj, dict):
-                return {k: make_serializable(v) for k, v in obj.items()}
-            else:
-                return [make_serializable(item) for item in obj]
-        elif isinstance(obj, (pd.Timestamp, datetime.date, datetime.datetime)):
-            return str(obj)
-        elif isinstance(obj, np.integer):
-            return int(obj)
-        elif isinstance(obj, np.floating):
-            return float(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif hasattr(obj, 'item'):  # numpy scalar types
-            return obj.item()
-        else:
-            return obj
-    
-    report_serializable = make_serializable(report)
-    
-    with open(output_file, 'w') as f:
-        json.dump(report_serializable, f, indent=2)
+    if HAS_ORJSON:
+        # Dates go through _json_default (str(), as before) rather than
+        # orjson's ISO format; numpy values are serialized natively
+        options = (
+            orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        Path(output_file).write_bytes(orjson.dumps(report, default=_json_default, option=options))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(report, f, indent=2, default=_json_default)
     
     print()
     print("=" * 80)
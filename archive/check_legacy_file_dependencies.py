@@ -1,49 +1,50 @@
 """Check which scripts depend on legacy wide format files."""
 
 from pathlib import Path
-import re
+from concurrent.futures import ProcessPoolExecutor
+import mmap
+
+LEGACY_FILES = [
+    'prices_daily.parquet',
+    'marketcap_daily.parquet',
+    'volume_daily.parquet'
+]
+
+# Quoted-literal references ('"x"' / "'x'") are just the bare name with
+# quotes, so a byte search for the bare name covers them
+LEGACY_FILES_BYTES = [f.encode() for f in LEGACY_FILES]
+
+def scan_one(py_file):
+    """Return the legacy files referenced by one source file (empty if unreadable)."""
+    try:
+        # Search the mapped bytes directly; nothing is decoded or copied
+        # into a Python string
+        with open(py_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [legacy.decode() for legacy in LEGACY_FILES_BYTES if mm.find(legacy) != -1]
+    except Exception:
+        # includes empty files, which cannot be mapped
+        return []
 
 def check_file_dependencies():
     """Check which Python files reference the legacy wide format files."""
     
-    legacy_files = [
-        'prices_daily.parquet',
-        'marketcap_daily.parquet',
-        'volume_daily.parquet'
-    ]
-    
     repo_root = Path(__file__).parent
     
     # Files to check
-    files_to_check = list(repo_root.rglob('*.py'))
-    
-    dependencies = {}
+    files_to_check = [
+        py_file for py_file in repo_root.rglob('*.py')
+        if 'venv' not in str(py_file) and '__pycache__' not in str(py_file)
+    ]
     
-    for py_file in files_to_check:
-        if 'venv' in str(py_file) or '__pycache__' in str(py_file):
-            continue
-        
-        try:
-            content = py_file.read_text()
-            file_deps = []
-            
-            for legacy_file in legacy_files:
-                # Check for references to the file
-                patterns = [
-                    rf'"{legacy_file}"',  # String literal
-                    rf"'{legacy_file}'",  # String literal
-                    rf'{legacy_file}',     # Variable reference
-                ]
-                
-                for pattern in patterns:
-                    if re.search(pattern, content):
-                        file_deps.append(legacy_file)
-                        break
-            
-            if file_deps:
-                dependencies[str(py_file.relative_to(repo_root))] = file_deps
-        except Exception as e:
-            pass
+    # Files are independent; scan them across processes, in chunks to
+    # amortize the per-task IPC
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(scan_one, files_to_check, chunksize=64)
+        dependencies = {
+            str(py_file.relative_to(repo_root)): file_deps
+            for py_file, file_deps in zip(files_to_check, results)
+            if file_deps
+        }
     
     return dependencies
 
@@ -1,15 +1,34 @@
 import polars as pl
+from pathlib import Path
 
-bt = pl.read_csv('reports/majors_alts/bt_daily_pnl.csv')
+# Lazy scan with projection pushdown: only the columns used below are read.
+# Prefer the typed parquet copy; fall back to the CSV for older report directories
+if Path('reports/majors_alts/bt_daily_pnl.parquet').exists():
+    lf = pl.scan_parquet('reports/majors_alts/bt_daily_pnl.parquet')
+else:
+    lf = pl.scan_csv('reports/majors_alts/bt_daily_pnl.csv')
+lf = lf.select(['date', 'alt_gross', 'major_gross', 'total_gross'])
+
+# Both queries run in one pass of the engine over the shared scan
+stats, sample = pl.collect_all([
+    lf.select(
+        pl.col('major_gross').mean().alias('mean'),
+        pl.col('major_gross').min().alias('min'),
+        pl.col('major_gross').max().alias('max'),
+        pl.col('major_gross').unique().sort().implode().alias('values'),
+    ),
+    lf.head(3),
+], engine='streaming')
+stats = stats.row(0, named=True)
 
 print("Major gross analysis:")
-print(f"  Mean: {bt['major_gross'].mean():.3f}")
-print(f"  Min: {bt['major_gross'].min():.3f}")
-print(f"  Max: {bt['major_gross'].max():.3f}")
-print(f"  All values: {sorted(bt['major_gross'].unique().to_list())}")
+print(f"  Mean: {stats['mean']:.3f}")
+print(f"  Min: {stats['min']:.3f}")
+print(f"  Max: {stats['max']:.3f}")
+print(f"  All values: {stats['values']}")
 
 print("\nSample rows:")
-for row in bt.head(3).iter_rows(named=True):
+for row in sample.iter_rows(named=True):
     print(f"  {row['date']}: ALT={row['alt_gross']:.3f}, Major={row['major_gross']:.3f}, Total={row['total_gross']:.3f}")
 
 print("\nIssue: Major gross should be 0.5 (50%), but it's showing as 1.0 (100%)")
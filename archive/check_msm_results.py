@@ -1,6 +1,13 @@
 import pandas as pd
+from pathlib import Path
 
-df = pd.read_csv('reports/msm_funding_v0/msm_v0_feb2024_onwards/msm_timeseries.csv')
+RUN_DIR = Path('reports/msm_funding_v0/msm_v0_feb2024_onwards')
+
+# Only the printed columns are parsed from the (wide) timeseries
+df = pd.read_csv(
+    RUN_DIR / 'msm_timeseries.csv',
+    usecols=['decision_date', 'F_tk', 'label_v0_0', 'label_v0_1', 'y'],
+)
 print(f'Total weeks: {len(df)}')
 print(f'label_v0_0 non-NA: {df["label_v0_0"].notna().sum()}')
 print(f'label_v0_1 non-NA: {df["label_v0_1"].notna().sum()}')
@@ -8,12 +15,13 @@ print(f'\nFirst 5 rows:')
 print(df[['decision_date', 'F_tk', 'label_v0_0', 'label_v0_1', 'y']].head(5).to_string())
 
 print(f'\nSummary by label v0_0:')
-summary_v0_0 = pd.read_csv('reports/msm_funding_v0/msm_v0_feb2024_onwards/summary_by_label_v0_0.csv')
+summary_v0_0 = pd.read_csv(RUN_DIR / 'summary_by_label_v0_0.csv')
 print(summary_v0_0.to_string())
 
 print(f'\nSummary by label v0_1:')
-try:
-    summary_v0_1 = pd.read_csv('reports/msm_funding_v0/msm_v0_feb2024_onwards/summary_by_label_v0_1.csv')
+summary_v0_1_path = RUN_DIR / 'summary_by_label_v0_1.csv'
+if summary_v0_1_path.exists():
+    summary_v0_1 = pd.read_csv(summary_v0_1_path)
     print(summary_v0_1.to_string())
-except:
+else:
     print('No v0_1 summary (insufficient history for 52-week window)')
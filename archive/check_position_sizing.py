@@ -1,8 +1,13 @@
 import polars as pl
-import numpy as np
+from pathlib import Path
 
-# Load backtest results
-bt = pl.read_csv('reports/majors_alts/bt_daily_pnl.csv').sort('date')
+# Lazy scan with projection pushdown: only the columns used below are read.
+# Prefer the typed parquet copy; fall back to the CSV for older report directories
+if Path('reports/majors_alts/bt_daily_pnl.parquet').exists():
+    lf = pl.scan_parquet('reports/majors_alts/bt_daily_pnl.parquet')
+else:
+    lf = pl.scan_csv('reports/majors_alts/bt_daily_pnl.csv')
+bt = lf.select(['date', 'regime', 'pnl', 'cost', 'funding', 'r_ls_net', 'alt_turnover', 'major_turnover']).sort('date').collect(engine='streaming')
 
 # Check position sizes and returns
 print("Position sizing analysis:")
@@ -38,32 +43,47 @@ print(f"    Count: {len(mismatch)}")
 if len(mismatch) > 0:
     print(f"    Example: {mismatch.head(3).select(['date', 'pnl', 'r_ls_net'])}")
 
+# Equity curve, drawdown and their summaries in one lazy plan over the
+# returns (no NumPy cumprod/accumulate passes)
+r = pl.col('r_ls_net')
+equity = pl.col('equity')
+dd = pl.col('dd')
+in_deep_dd = dd < -0.5
+eq = (
+    bt.lazy()
+    .with_columns((1.0 + r).cum_prod().alias('equity'))
+    .with_columns((equity / equity.cum_max() - 1.0).alias('dd'))
+    .select(
+        r.first().alias('first_return'),
+        equity.first().alias('first_equity'),
+        equity.last().alias('final_equity'),
+        equity.max().alias('max_equity'),
+        equity.min().alias('min_equity'),
+        in_deep_dd.sum().alias('deep_dd_count'),
+        pl.col('date').filter(in_deep_dd).min().alias('deep_dd_start'),
+        pl.col('date').filter(in_deep_dd).max().alias('deep_dd_end'),
+        dd.filter(in_deep_dd).min().alias('deep_dd_worst'),
+    )
+    .collect(engine='streaming')
+    .row(0, named=True)
+)
+
 # Check equity curve calculation
-returns = bt['r_ls_net'].to_numpy()
-equity = np.cumprod(1.0 + returns)
 print(f"\nEquity curve check:")
-print(f"  First return: {returns[0]:.4f}")
-print(f"  First equity: {equity[0]:.4f} (should be 1.0 + first return)")
-print(f"  If starting equity was 1.0, first equity should be: {1.0 + returns[0]:.4f}")
+print(f"  First return: {eq['first_return']:.4f}")
+print(f"  First equity: {eq['first_equity']:.4f} (should be 1.0 + first return)")
+print(f"  If starting equity was 1.0, first equity should be: {1.0 + eq['first_return']:.4f}")
 
 # Check if there's a compounding issue
 print(f"\nCompounding check:")
 print(f"  If we start at 1.0 and compound:")
-equity_from_1 = np.cumprod(1.0 + returns)
-print(f"    Final equity: {equity_from_1[-1]:.4f}")
-print(f"    Max equity: {equity_from_1.max():.4f}")
-print(f"    Min equity: {equity_from_1.min():.4f}")
+print(f"    Final equity: {eq['final_equity']:.4f}")
+print(f"    Max equity: {eq['max_equity']:.4f}")
+print(f"    Min equity: {eq['min_equity']:.4f}")
 
 # Check the period around max drawdown
-bt_with_equity = bt.with_columns([
-    pl.Series('equity', equity_from_1),
-])
-bt_with_equity = bt_with_equity.with_columns([
-    (pl.col('equity') / pl.col('equity').cum_max() - 1.0).alias('dd')
-])
-max_dd_period = bt_with_equity.filter(pl.col('dd') < -0.5).sort('date')
 print(f"\nPeriods with >50% drawdown:")
-print(f"  Count: {len(max_dd_period)}")
-if len(max_dd_period) > 0:
-    print(f"  Date range: {max_dd_period['date'].min()} to {max_dd_period['date'].max()}")
-    print(f"  Worst DD: {max_dd_period['dd'].min():.4f}")
+print(f"  Count: {eq['deep_dd_count']}")
+if eq['deep_dd_count'] > 0:
+    print(f"  Date range: {eq['deep_dd_start']} to {eq['deep_dd_end']}")
+    print(f"  Worst DD: {eq['deep_dd_worst']:.4f}")
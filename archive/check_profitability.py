@@ -1,12 +1,107 @@
 import polars as pl
 import numpy as np
+from pathlib import Path
 
-bt = pl.read_csv('reports/majors_alts/bt_daily_pnl.csv').sort('date')
-returns = bt['r_ls_net'].to_numpy()
-equity = np.cumprod(1.0 + returns)
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
-total_return = equity[-1] / equity[0] - 1.0
-n_days = len(returns)
+
+def _return_stats(returns):
+    """
+    Equity, drawdown and return moments in one pass over returns.
+
+    Returns (start_eq, final_eq, max_dd, mean, std, downside_std, hit_rate,
+    best, worst); std and downside_std are population (ddof=0) values, as
+    np.std gives, accumulated with Welford updates.
+    """
+    n = returns.shape[0]
+    eq = 1.0
+    start_eq = 1.0
+    peak = 1.0
+    max_dd = 0.0
+    mean = 0.0
+    m2 = 0.0
+    n_down = 0
+    down_mean = 0.0
+    down_m2 = 0.0
+    n_up = 0
+    best = -np.inf
+    worst = np.inf
+    for i in range(n):
+        r = returns[i]
+        eq *= 1.0 + r
+        if i == 0:
+            start_eq = eq
+        if i == 0 or eq > peak:
+            peak = eq
+        dd = (eq - peak) / peak
+        if dd < max_dd:
+            max_dd = dd
+        delta = r - mean
+        mean += delta / (i + 1)
+        m2 += delta * (r - mean)
+        if r < 0:
+            n_down += 1
+            down_delta = r - down_mean
+            down_mean += down_delta / n_down
+            down_m2 += down_delta * (r - down_mean)
+        elif r > 0:
+            n_up += 1
+        if r > best:
+            best = r
+        if r < worst:
+            worst = r
+    std = np.sqrt(m2 / n)
+    downside_std = np.sqrt(down_m2 / n_down) if n_down > 0 else 0.0
+    return start_eq, eq, max_dd, mean, std, downside_std, n_up / n, best, worst
+
+
+if HAS_NUMBA:
+    return_stats = njit(cache=True)(_return_stats)
+else:
+    def return_stats(returns):
+        equity = np.cumprod(1.0 + returns)
+        running_max = np.maximum.accumulate(equity)
+        downside = returns[returns < 0]
+        return (
+            equity[0], equity[-1], np.min((equity - running_max) / running_max),
+            np.mean(returns), np.std(returns), np.std(downside) if len(downside) > 0 else 0.0,
+            np.mean(returns > 0), np.max(returns), np.min(returns),
+        )
+
+
+# Lazy scan with projection pushdown: only the columns used below are read.
+# Prefer the typed parquet copy; fall back to the CSV for older report directories
+if Path('reports/majors_alts/bt_daily_pnl.parquet').exists():
+    lf = pl.scan_parquet('reports/majors_alts/bt_daily_pnl.parquet')
+else:
+    lf = pl.scan_csv('reports/majors_alts/bt_daily_pnl.csv')
+bt = (
+    lf.select(['date', 'r_ls_net', 'alt_gross', 'major_gross', 'total_gross'])
+    .sort('date')
+    .collect(engine='streaming')
+)
+
+# Return statistics come from a single compiled loop over the returns; the
+# exposure averages and date range are one Polars select
+stats = dict(zip(
+    ['start_eq', 'final_eq', 'max_dd', 'mean_ret', 'std_ret', 'downside_std', 'hit_rate', 'best', 'worst'],
+    return_stats(bt['r_ls_net'].to_numpy()),
+))
+stats['n_days'] = bt.height
+stats.update(bt.select(
+    pl.col('alt_gross').mean(),
+    pl.col('major_gross').mean(),
+    pl.col('total_gross').mean(),
+    pl.col('date').min().alias('date_min'),
+    pl.col('date').max().alias('date_max'),
+).row(0, named=True))
+
+total_return = stats['final_eq'] / stats['start_eq'] - 1.0
+n_days = stats['n_days']
 cagr = (1.0 + total_return) ** (252.0 / n_days) - 1.0
 
 print("=" * 60)
@@ -15,42 +110,39 @@ print("=" * 60)
 print(f"\nPROFITABILITY:")
 print(f"   Total Return: {total_return*100:.2f}%")
 print(f"   CAGR: {cagr*100:.2f}%")
-print(f"   Final Equity: {equity[-1]:.4f}")
-print(f"   Starting Equity: {equity[0]:.4f}")
-print(f"   Profitable: {'YES' if equity[-1] > equity[0] else 'NO'}")
+print(f"   Final Equity: {stats['final_eq']:.4f}")
+print(f"   Starting Equity: {stats['start_eq']:.4f}")
+print(f"   Profitable: {'YES' if stats['final_eq'] > stats['start_eq'] else 'NO'}")
 
 print(f"\nRISK-ADJUSTED METRICS:")
-mean_ret = np.mean(returns)
-std_ret = np.std(returns)
+mean_ret = stats['mean_ret']
+std_ret = stats['std_ret']
 sharpe = (mean_ret / std_ret * np.sqrt(252)) if std_ret > 0 else 0.0
-downside = returns[returns < 0]
-downside_std = np.std(downside) if len(downside) > 0 else 0.0
+downside_std = stats['downside_std']
 sortino = (mean_ret / downside_std * np.sqrt(252)) if downside_std > 0 else 0.0
 print(f"   Sharpe Ratio: {sharpe:.4f}")
 print(f"   Sortino Ratio: {sortino:.4f}")
 
 print(f"\nDRAWDOWN ANALYSIS:")
-running_max = np.maximum.accumulate(equity)
-drawdown = (equity - running_max) / running_max
-max_dd = np.min(drawdown)
+max_dd = stats['max_dd']
 print(f"   Max Drawdown: {max_dd*100:.2f}%")
 print(f"   Calmar Ratio: {cagr / abs(max_dd) if max_dd != 0 else 0.0:.4f}")
 
 print(f"\nTRADING STATS:")
-print(f"   Hit Rate: {np.mean(returns > 0)*100:.2f}%")
-print(f"   Average Daily Return: {np.mean(returns)*100:.4f}%")
-print(f"   Volatility (annualized): {np.std(returns) * (252**0.5)*100:.2f}%")
-print(f"   Best Day: {np.max(returns)*100:.2f}%")
-print(f"   Worst Day: {np.min(returns)*100:.2f}%")
+print(f"   Hit Rate: {stats['hit_rate']*100:.2f}%")
+print(f"   Average Daily Return: {mean_ret*100:.4f}%")
+print(f"   Volatility (annualized): {std_ret * (252**0.5)*100:.2f}%")
+print(f"   Best Day: {stats['best']*100:.2f}%")
+print(f"   Worst Day: {stats['worst']*100:.2f}%")
 
 print(f"\nPOSITION SIZING:")
-print(f"   ALT Gross: {bt['alt_gross'].mean()*100:.1f}%")
-print(f"   Major Gross: {bt['major_gross'].mean()*100:.1f}%")
-print(f"   Total Gross: {bt['total_gross'].mean()*100:.1f}%")
-print(f"   Net Exposure: {(bt['major_gross'].mean() - bt['alt_gross'].mean())*100:.1f}% (net long)")
+print(f"   ALT Gross: {stats['alt_gross']*100:.1f}%")
+print(f"   Major Gross: {stats['major_gross']*100:.1f}%")
+print(f"   Total Gross: {stats['total_gross']*100:.1f}%")
+print(f"   Net Exposure: {(stats['major_gross'] - stats['alt_gross'])*100:.1f}% (net long)")
 
 print(f"\nPERIOD:")
-print(f"   Trading Days: {len(bt)}")
-print(f"   Date Range: {bt['date'].min()} to {bt['date'].max()}")
+print(f"   Trading Days: {n_days}")
+print(f"   Date Range: {stats['date_min']} to {stats['date_max']}")
 
 print("\n" + "=" * 60)
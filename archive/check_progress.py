@@ -2,10 +2,33 @@
 """Check progress of data fetch script."""
 
 import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from pathlib import Path
 import time
 import os
 
+
+def summarize_parquet(path):
+    """
+    Row count, date range and distinct asset count without decoding the file.
+
+    Rows and the date range come from the footer (row-group min/max
+    statistics); only asset_id is read to count distinct assets. Falls back
+    to reading the date column when statistics are missing.
+    """
+    meta = pq.ParquetFile(path).metadata
+    date_idx = meta.schema.names.index("date")
+    stats = [meta.row_group(i).column(date_idx).statistics for i in range(meta.num_row_groups)]
+    if stats and all(st is not None and st.has_min_max for st in stats):
+        date_min = min(st.min for st in stats)
+        date_max = max(st.max for st in stats)
+    else:
+        dates = pd.read_parquet(path, columns=["date"])["date"]
+        date_min, date_max = dates.min(), dates.max()
+    assets = pq.read_table(path, columns=["asset_id"]).column("asset_id")
+    return meta.num_rows, date_min, date_max, pc.count_distinct(assets).as_py()
+
 print("=" * 70)
 print("DATA FETCH PROGRESS CHECK")
 print("=" * 70)
@@ -13,14 +36,14 @@ print("=" * 70)
 # Check funding data
 funding_path = Path("data/curated/data_lake/fact_funding.parquet")
 if funding_path.exists():
-    df = pd.read_parquet(funding_path)
+    n_rows, date_min, date_max, n_assets = summarize_parquet(funding_path)
     mtime = funding_path.stat().st_mtime
     age_minutes = (time.time() - mtime) / 60
     
     print(f"\n[OK] Funding file exists")
-    print(f"  Records: {len(df):,}")
-    print(f"  Date range: {df['date'].min()} to {df['date'].max()}")
-    print(f"  Assets: {df['asset_id'].nunique()}")
+    print(f"  Records: {n_rows:,}")
+    print(f"  Date range: {date_min} to {date_max}")
+    print(f"  Assets: {n_assets}")
     print(f"  Last modified: {age_minutes:.1f} minutes ago")
     if age_minutes < 5:
         print("  Status: [ACTIVE] Recently updated - script is active")
@@ -34,14 +57,14 @@ else:
 # Check OI data
 oi_path = Path("data/curated/data_lake/fact_open_interest.parquet")
 if oi_path.exists():
-    df2 = pd.read_parquet(oi_path)
+    n_rows2, date_min2, date_max2, n_assets2 = summarize_parquet(oi_path)
     mtime2 = oi_path.stat().st_mtime
     age_minutes2 = (time.time() - mtime2) / 60
     
     print(f"\n[OK] OI file exists")
-    print(f"  Records: {len(df2):,}")
-    print(f"  Date range: {df2['date'].min()} to {df2['date'].max()}")
-    print(f"  Assets: {df2['asset_id'].nunique()}")
+    print(f"  Records: {n_rows2:,}")
+    print(f"  Date range: {date_min2} to {date_max2}")
+    print(f"  Assets: {n_assets2}")
     print(f"  Last modified: {age_minutes2:.1f} minutes ago")
     if age_minutes2 < 5:
         print("  Status: [ACTIVE] Recently updated - script is active")
@@ -1,8 +1,13 @@
 import polars as pl
-import numpy as np
+from pathlib import Path
 
-# Load backtest results
-bt = pl.read_csv('reports/majors_alts/bt_daily_pnl.csv').sort('date')
+# Lazy scan with projection pushdown: only the columns used below are read.
+# Prefer the typed parquet copy; fall back to the CSV for older report directories
+if Path('reports/majors_alts/bt_daily_pnl.parquet').exists():
+    lf = pl.scan_parquet('reports/majors_alts/bt_daily_pnl.parquet')
+else:
+    lf = pl.scan_csv('reports/majors_alts/bt_daily_pnl.csv')
+bt = lf.select(['date', 'pnl', 'cost', 'funding', 'r_ls_net', 'major_turnover']).sort('date').collect(engine='streaming')
 
 print("=== ROOT CAUSE ANALYSIS ===\n")
 
@@ -70,17 +75,24 @@ if abs(calc - worst_day['r_ls_net']) < 0.0001:
 else:
     print("   ⚠️  Formula doesn't match - there's a bug in the calculation\n")
 
-# Check equity curve
-returns = bt['r_ls_net'].to_numpy()
-equity = np.cumprod(1.0 + returns)
+# Check equity curve (cumulative product and its extremes in one plan)
+r = pl.col('r_ls_net')
+equity = (1.0 + r).cum_prod()
+eq = bt.select(
+    r.first().alias('first_return'),
+    equity.first().alias('start'),
+    equity.last().alias('final'),
+    equity.max().alias('max'),
+    equity.min().alias('min'),
+).row(0, named=True)
 print(f"\n6. EQUITY CURVE:")
-print(f"   Starting equity: {equity[0]:.4f} (should be 1.0)")
-print(f"   Final equity: {equity[-1]:.4f}")
-print(f"   Max equity: {equity.max():.4f}")
-print(f"   Min equity: {equity.min():.4f}")
-if abs(equity[0] - 1.0) > 0.01:
+print(f"   Starting equity: {eq['start']:.4f} (should be 1.0)")
+print(f"   Final equity: {eq['final']:.4f}")
+print(f"   Max equity: {eq['max']:.4f}")
+print(f"   Min equity: {eq['min']:.4f}")
+if abs(eq['start'] - 1.0) > 0.01:
     print(f"   PROBLEM: Equity doesn't start at 1.0!")
-    print(f"   First return: {returns[0]:.4f}")
-    print(f"   If we start at 1.0: 1.0 * (1 + {returns[0]:.4f}) = {1.0 + returns[0]:.4f}")
+    print(f"   First return: {eq['first_return']:.4f}")
+    print(f"   If we start at 1.0: 1.0 * (1 + {eq['first_return']:.4f}) = {1.0 + eq['first_return']:.4f}")
 else:
     print("   Equity starts correctly at 1.0")
@@ -1,26 +1,31 @@
-import pandas as pd
+import polars as pl
+import pyarrow.parquet as pq
 
 # Check allowlist
-allowlist = pd.read_csv('data/perp_allowlist.csv')
+allowlist = pl.read_csv('data/perp_allowlist.csv', columns=['symbol'])
 print(f"=== ALLOWLIST (Full Universe) ===")
 print(f"Total coins in allowlist: {len(allowlist)}")
-print(f"\nCoins: {', '.join(allowlist['symbol'].tolist())}")
+print(f"\nCoins: {', '.join(allowlist['symbol'].to_list())}")
 
-# Check downloaded price data
-prices = pd.read_parquet('data/curated/prices_daily.parquet')
+# Check downloaded price data (column labels only: read from the schema, as
+# pandas would restore them, without decoding the wide file)
+price_coins = pq.read_schema('data/curated/prices_daily.parquet').empty_table().to_pandas().columns
 print(f"\n=== DOWNLOADED DATA ===")
-print(f"Coins with price data: {len(prices.columns)}")
-print(f"Coins: {', '.join(sorted(prices.columns.tolist()))}")
+print(f"Coins with price data: {len(price_coins)}")
+print(f"Coins: {', '.join(sorted(price_coins.tolist()))}")
 
-# Check snapshots
-snapshots = pd.read_parquet('data/curated/universe_snapshots.parquet')
+# Check snapshots: per-date basket sizes and the unique coins in one lazy
+# pass over the two columns used, instead of re-filtering per date
+snapshots = pl.scan_parquet('data/curated/universe_snapshots.parquet').select(['rebalance_date', 'symbol'])
+per_date, coins = pl.collect_all([
+    snapshots.group_by('rebalance_date').agg(pl.len().alias('n_coins')).sort('rebalance_date'),
+    snapshots.select(pl.col('symbol').drop_nulls().unique().sort()),
+], engine='streaming')
 print(f"\n=== SNAPSHOTS (Selected Baskets) ===")
-print(f"Total snapshots: {snapshots['rebalance_date'].nunique()}")
+print(f"Total snapshots: {per_date['rebalance_date'].drop_nulls().len()}")
 print(f"\nCoins per snapshot:")
-for date in sorted(snapshots['rebalance_date'].unique()):
-    snapshot_coins = snapshots[snapshots['rebalance_date'] == date]['symbol'].tolist()
-    print(f"  {date}: {len(snapshot_coins)} coins")
-
-print(f"\nUnique coins across all snapshots: {snapshots['symbol'].nunique()}")
-print(f"All unique coins in baskets: {', '.join(sorted(snapshots['symbol'].unique()))}")
+for date, n_coins in per_date.drop_nulls('rebalance_date').iter_rows():
+    print(f"  {date}: {n_coins} coins")
 
+print(f"\nUnique coins across all snapshots: {len(coins)}")
+print(f"All unique coins in baskets: {', '.join(coins['symbol'].to_list())}")
@@ -1,4 +1,5 @@
 import pandas as pd
+import pyarrow.parquet as pq
 from pathlib import Path
 
 # Check wide format files
@@ -7,11 +8,17 @@ prices_wide = curated_dir / 'prices_daily.parquet'
 mcaps_wide = curated_dir / 'marketcap_daily.parquet'
 
 if prices_wide.exists():
-    df = pd.read_parquet(prices_wide)
-    print(f'prices_daily.parquet: {len(df)} rows, {len(df.columns)} columns')
+    # Row count and column names come from the footer; only the ETH/BTC
+    # columns (plus the stored date index) of the ~2.7k-column file are decoded
+    pf = pq.ParquetFile(prices_wide)
+    pandas_meta = pf.schema_arrow.pandas_metadata or {}
+    index_cols = {c for c in pandas_meta.get('index_columns', []) if isinstance(c, str)}
+    columns = [name for name in pf.schema_arrow.names if name not in index_cols]
+    df = pd.read_parquet(prices_wide, columns=[c for c in ['ETH', 'BTC'] if c in columns])
+    print(f'prices_daily.parquet: {pf.metadata.num_rows} rows, {len(columns)} columns')
     
     # Check if ETH column exists
-    eth_cols = [col for col in df.columns if 'ETH' in str(col).upper()]
+    eth_cols = [col for col in columns if 'ETH' in str(col).upper()]
     print(f'\nETH-like columns in prices_daily: {eth_cols[:10]}')
     
     if 'ETH' in df.columns:
@@ -1,48 +1,52 @@
 import polars as pl
 from datetime import date
 
-# Load prices
-prices = pl.read_parquet('data/curated/data_lake/fact_price.parquet')
+from _parquet_cache import read_date_range
+
+FACT_PRICE_PATH = 'data/curated/data_lake/fact_price.parquet'
 
 # Worst day: 2024-11-07
 worst_date = date(2024, 11, 7)
 prev_date = date(2024, 11, 6)
 
-# Get prices
-prices_prev = prices.filter(pl.col('date') == pl.date(prev_date.year, prev_date.month, prev_date.day))
-prices_curr = prices.filter(pl.col('date') == pl.date(worst_date.year, worst_date.month, worst_date.day))
+# Only the two days' asset_id/date/close are decoded: row groups whose footer
+# date statistics exclude [prev_date, worst_date] are skipped
+prices = read_date_range(FACT_PRICE_PATH, prev_date, worst_date, columns=['asset_id', 'date', 'close'])
 
-# Join to compute returns
+# One-day return per asset in a single windowed pass (assets need both days)
 returns = (
-    prices_prev.select(['asset_id', 'close']).rename({'close': 'close_prev'})
-    .join(
-        prices_curr.select(['asset_id', 'close']).rename({'close': 'close_curr'}),
-        on='asset_id', how='inner'
-    )
+    prices.sort(['asset_id', 'date'])
     .with_columns([
-        ((pl.col('close_curr') / pl.col('close_prev')) - 1.0).alias('ret')
+        ((pl.col('close') / pl.col('close').shift(1).over('asset_id')) - 1.0).alias('ret'),
+        pl.col('date').shift(1).over('asset_id').alias('prev_day'),
     ])
+    .filter((pl.col('date') == worst_date) & (pl.col('prev_day') == prev_date))
+    .select(['asset_id', 'ret'])
     .sort('ret', descending=True)
 )
 
+
+def print_moves(moves: pl.DataFrame) -> None:
+    """Print one '  ASSET: x.xx%' line per row with a single print call."""
+    if len(moves):
+        print("\n".join(f"  {asset_id}: {ret*100:.2f}%" for asset_id, ret in moves.select(['asset_id', 'ret']).iter_rows()))
+
+
+is_major = pl.col('asset_id').is_in(['BTC', 'ETH'])
+alt_returns = returns.filter(~is_major)
+majors = returns.filter(is_major)
+
 print(f"Price moves on {worst_date}:")
 print(f"\nTop 10 ALT movers (likely in basket):")
-top_alts = returns.filter(~pl.col('asset_id').is_in(['BTC', 'ETH'])).head(10)
-for row in top_alts.iter_rows(named=True):
-    print(f"  {row['asset_id']}: {row['ret']*100:.2f}%")
+print_moves(alt_returns.head(10))
 
 print(f"\nBottom 10 ALT movers:")
-bottom_alts = returns.filter(~pl.col('asset_id').is_in(['BTC', 'ETH'])).tail(10)
-for row in bottom_alts.iter_rows(named=True):
-    print(f"  {row['asset_id']}: {row['ret']*100:.2f}%")
+print_moves(alt_returns.tail(10))
 
 print(f"\nMajor moves:")
-majors = returns.filter(pl.col('asset_id').is_in(['BTC', 'ETH']))
-for row in majors.iter_rows(named=True):
-    print(f"  {row['asset_id']}: {row['ret']*100:.2f}%")
+print_moves(majors)
 
 # Calculate average ALT return (cap-weighted would be better, but simple avg for now)
-alt_returns = returns.filter(~pl.col('asset_id').is_in(['BTC', 'ETH']))
 avg_alt_ret = alt_returns['ret'].mean()
 print(f"\nAverage ALT return: {avg_alt_ret*100:.2f}%")
 print(f"Median ALT return: {alt_returns['ret'].median()*100:.2f}%")
@@ -5,6 +5,10 @@ Comprehensive event study and correlation analysis for Chiliz (CHZ) around major
 
 import pandas as pd
 import numpy as np
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
@@ -19,6 +23,20 @@ except ImportError:
     HAS_CCXT = False
     print("[WARN] CCXT not installed. Will use CoinGecko API instead.")
 
+# Optional JIT for the small closed-form regressions
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# SciPy is only needed for the Wilcoxon tests
+try:
+    from scipy import stats
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
 # Try to import CoinGecko provider from codebase
 HAS_COINGECKO_PROVIDER = False
 try:
@@ -69,6 +87,27 @@ EVENTS = {
     },
 }
 
+# Assets fetched by main(): name -> (CCXT symbol, CoinGecko id)
+FETCH_ASSETS = {
+    "chz": ("CHZ/USDT", "chiliz"),
+    "btc": ("BTC/USDT", "bitcoin"),
+    "eth": ("ETH/USDT", "ethereum"),
+}
+
+# CoinGecko's public API is rate-limited per client; concurrent fetches
+# take turns on it
+COINGECKO_SEMAPHORE = threading.Semaphore(1)
+
+# On-disk cache of fetched price frames, shared across runs (outside outputs/)
+PRICE_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "chz_prices"
+PRICE_CACHE_MAX_AGE_HOURS = 24.0
+
+# Annualization factor for daily volatility
+SQRT_252 = np.sqrt(252)
+
+# Market-model estimation window (days relative to event start)
+ESTIMATION_WINDOW = (-180, -60)
+
 # Window definitions (days relative to event start)
 WINDOWS = {
     "pre_120_90": (-120, -90),
@@ -138,12 +177,12 @@ def fetch_coingecko_data(symbol: str, coingecko_id: str, start_date: date, end_d
         try:
             prices, mcaps, volumes = fetch_price_history(coingecko_id, start_date, end_date)
             
-            # Convert to DataFrame
-            dates = sorted(prices.keys())
+            # Convert to DataFrame (volumes aligned to the price dates)
+            close = pd.Series(prices, dtype=float).sort_index()
             df = pd.DataFrame({
-                'date': dates,
-                'close': [prices[d] for d in dates],
-                'volume': [volumes.get(d, np.nan) for d in dates],
+                'date': close.index.to_numpy(),
+                'close': close.to_numpy(),
+                'volume': pd.Series(volumes, dtype=float).reindex(close.index).to_numpy(),
             })
             df['open'] = df['close'].shift(1).fillna(df['close'])
             df['high'] = df['close']
@@ -171,17 +210,14 @@ def fetch_coingecko_data(symbol: str, coingecko_id: str, start_date: date, end_d
         raise Exception(f"CoinGecko API error: {resp.status_code}")
     
     data = resp.json()
-    prices_data = data.get("prices", [])
     
-    dates = []
-    closes = []
-    for ts_ms, price in prices_data:
-        d = datetime.fromtimestamp(ts_ms / 1000.0).date()
-        if start_date <= d <= end_date:
-            dates.append(d)
-            closes.append(float(price))
+    # [timestamp_ms, price] pairs -> UTC calendar dates in one vectorized
+    # conversion, as src.providers.coingecko does
+    prices_data = np.asarray(data.get("prices", []), dtype=np.float64).reshape(-1, 2)
+    dates = pd.to_datetime(prices_data[:, 0], unit='ms').date
+    in_range = (dates >= start_date) & (dates <= end_date)
     
-    df = pd.DataFrame({'date': dates, 'close': closes})
+    df = pd.DataFrame({'date': dates[in_range], 'close': prices_data[in_range, 1]})
     df = df.sort_values('date').reset_index(drop=True)
     df['open'] = df['close'].shift(1).fillna(df['close'])
     df['high'] = df['close']
@@ -191,17 +227,50 @@ def fetch_coingecko_data(symbol: str, coingecko_id: str, start_date: date, end_d
     return df
 
 
+def _price_cache_path(symbol: str, start_date: date, end_date: date) -> Path:
+    """Cache file for one (symbol, start, end) request."""
+    return PRICE_CACHE_DIR / f"{symbol.replace('/', '_')}_{start_date}_{end_date}.parquet"
+
+
+def _price_cache_is_fresh(path: Path, max_age_hours: float = PRICE_CACHE_MAX_AGE_HOURS) -> bool:
+    if not path.exists():
+        return False
+    return time.time() - path.stat().st_mtime <= max_age_hours * 3600.0
+
+
 def fetch_price_data(symbol: str, start_date: date, end_date: date, 
                      coingecko_id: Optional[str] = None) -> pd.DataFrame:
     """
     Fetch price data, trying CCXT first, then CoinGecko.
     
+    Results are cached as parquet under PRICE_CACHE_DIR, keyed by symbol and
+    date range; a cached frame younger than PRICE_CACHE_MAX_AGE_HOURS is
+    returned without any network call.
+    
     Args:
         symbol: Trading symbol (e.g., "CHZ/USDT")
         start_date: Start date
         end_date: End date
         coingecko_id: CoinGecko ID (e.g., "chiliz")
     """
+    cache_path = _price_cache_path(symbol, start_date, end_date)
+    if _price_cache_is_fresh(cache_path):
+        print(f"  Loading {symbol} from cache ({cache_path.name})...")
+        return pd.read_parquet(cache_path)
+    
+    df = _fetch_price_data_uncached(symbol, start_date, end_date, coingecko_id)
+    
+    PRICE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".parquet.tmp")
+    df.to_parquet(tmp_path, index=False, compression='zstd', compression_level=3)
+    os.replace(tmp_path, cache_path)
+    
+    return df
+
+
+def _fetch_price_data_uncached(symbol: str, start_date: date, end_date: date,
+                               coingecko_id: Optional[str] = None) -> pd.DataFrame:
+    """Network fetch behind fetch_price_data()."""
     # Try CCXT first
     if HAS_CCXT:
         try:
@@ -212,8 +281,9 @@ def fetch_price_data(symbol: str, start_date: date, end_date: date,
     
     # Fallback to CoinGecko
     if coingecko_id:
-        print(f"  Fetching {coingecko_id} from CoinGecko...")
-        return fetch_coingecko_data(symbol, coingecko_id, start_date, end_date)
+        with COINGECKO_SEMAPHORE:
+            print(f"  Fetching {coingecko_id} from CoinGecko...")
+            return fetch_coingecko_data(symbol, coingecko_id, start_date, end_date)
     else:
         raise ValueError(f"Cannot fetch data for {symbol}: need coingecko_id if CCXT unavailable")
 
@@ -222,30 +292,156 @@ def compute_returns(df: pd.DataFrame) -> pd.DataFrame:
     """Compute daily returns and cumulative returns."""
     df = df.copy()
     df['return'] = df['close'].pct_change()
-    df['cum_return'] = (1 + df['return']).cumprod() - 1
+    
+    # Cumulative return from summed log returns (NaN rows skipped but kept
+    # NaN, as pandas cumprod does)
+    returns = df['return'].to_numpy(dtype=float)
+    cum_return = np.expm1(cumulative_log_returns(returns))
+    cum_return[np.isnan(returns)] = np.nan
+    df['cum_return'] = cum_return
     return df
 
 
-def compute_window_metrics(df: pd.DataFrame, window_start: int, window_end: int, 
-                          event_start_date: date) -> Dict:
+def build_return_panel(frames: Dict[str, pd.DataFrame]) -> Tuple[np.ndarray, Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """
+    Align each asset's daily returns to one shared date axis.
+    
+    Args:
+        frames: Asset name -> DataFrame with date and return columns
+    
+    Returns:
+        (dates, returns, present): the sorted datetime64[D] union of all
+        dates; per-asset float64 returns on that axis (NaN where the asset
+        has no row); per-asset masks of the dates each asset actually has
+    """
+    asset_dates = {name: np.asarray(df['date'], dtype='datetime64[D]') for name, df in frames.items()}
+    dates = np.unique(np.concatenate(list(asset_dates.values())))
+    
+    returns = {}
+    present = {}
+    for name, df in frames.items():
+        idx = np.searchsorted(dates, asset_dates[name])
+        returns[name] = np.full(len(dates), np.nan)
+        returns[name][idx] = df['return'].to_numpy(dtype=float)
+        present[name] = np.zeros(len(dates), dtype=bool)
+        present[name][idx] = True
+    
+    return dates, returns, present
+
+
+def cumulative_log_returns(returns: np.ndarray) -> np.ndarray:
+    """Running sum of log(1 + r) over a return series; missing returns add 0."""
+    return np.cumsum(np.log1p(np.nan_to_num(returns, nan=0.0)))
+
+
+def window_bounds(dates: np.ndarray, event_starts: List[date]) -> np.ndarray:
+    """
+    Row ranges of every (event, window) pair on a sorted date axis.
+    
+    Args:
+        dates: Sorted datetime64[D] array of trading dates
+        event_starts: Event start dates
+    
+    Returns:
+        int array of shape (len(event_starts), len(WINDOWS), 2) holding
+        [lo, hi) so that dates[lo:hi] spans the window inclusive of both ends
+    """
+    starts = np.asarray(event_starts, dtype='datetime64[D]')
+    offsets = np.array(list(WINDOWS.values()), dtype='int64').astype('timedelta64[D]')
+    date_bounds = starts[:, None, None] + offsets[None, :, :]
+    return np.stack([
+        np.searchsorted(dates, date_bounds[..., 0], side='left'),
+        np.searchsorted(dates, date_bounds[..., 1], side='right'),
+    ], axis=-1)
+
+
+def _window_stats(window_returns, window_log):
+    """
+    Single pass over one window: (total return, max drawdown, daily
+    volatility, peak return).
+    
+    The cumulative return on each day is expm1(window_log). Days with a
+    NaN return are skipped but their cumulative return is NaN, matching
+    pandas cumprod. Volatility is the ddof=1 standard deviation of the
+    non-NaN returns (Welford), NaN with fewer than two of them.
+    """
+    total = np.nan
+    running_max = np.nan
+    max_drawdown = np.nan
+    peak = np.nan
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(window_returns.size):
+        r = window_returns[i]
+        if np.isnan(r):
+            total = np.nan
+            continue
+        
+        cum = np.expm1(window_log[i])
+        total = cum
+        if np.isnan(running_max) or cum > running_max:
+            running_max = cum
+        drawdown = cum - running_max
+        if np.isnan(max_drawdown) or drawdown < max_drawdown:
+            max_drawdown = drawdown
+        if np.isnan(peak) or cum > peak:
+            peak = cum
+        
+        count += 1
+        delta = r - mean
+        mean += delta / count
+        m2 += delta * (r - mean)
+    
+    daily_vol = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+    return total, max_drawdown, daily_vol, peak
+
+
+if HAS_NUMBA:
+    window_stats = njit(cache=True)(_window_stats)
+else:
+    def window_stats(window_returns, window_log):
+        # Missing returns are skipped by the product but stay NaN
+        # themselves, matching pandas cumprod
+        cum_return = np.expm1(window_log)
+        cum_return[np.isnan(window_returns)] = np.nan
+        drawdown = cum_return - np.fmax.accumulate(cum_return)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return (cum_return[-1], np.nanmin(drawdown),
+                    np.nanstd(window_returns, ddof=1), np.nanmax(cum_return))
+
+
+def compute_window_metrics(returns: np.ndarray, lo: int, hi: int,
+                           present: Optional[np.ndarray] = None,
+                           cum_log: Optional[np.ndarray] = None) -> Dict:
     """
     Compute metrics for a specific window relative to event start.
     
     Args:
-        df: DataFrame with date and return columns
-        window_start: Days before/after event start (negative = before)
-        window_end: Days before/after event start
-        event_start_date: Event start date
+        returns: Daily returns on a sorted date axis
+        lo, hi: Row range [lo, hi) of the window, from window_bounds()
+        present: Optional mask of the dates the asset has data for (from
+            build_return_panel); all dates count when omitted
+        cum_log: Optional cumulative_log_returns(returns), computed once
+            per series and shared by every window
     
     Returns:
         Dictionary of metrics
     """
-    start_date = event_start_date + timedelta(days=window_start)
-    end_date = event_start_date + timedelta(days=window_end)
+    window_returns = returns[lo:hi]
     
-    window_df = df[(df['date'] >= start_date) & (df['date'] <= end_date)].copy()
+    # Growth since the window opened, from the series' prefix log-sums
+    if cum_log is not None:
+        window_log = cum_log[lo:hi] - (cum_log[lo - 1] if lo > 0 else 0.0)
+    else:
+        window_log = cumulative_log_returns(window_returns)
     
-    if len(window_df) == 0:
+    if present is not None:
+        window_returns = window_returns[present[lo:hi]]
+        window_log = window_log[present[lo:hi]]
+    
+    if len(window_returns) == 0:
         return {
             'return': np.nan,
             'cum_return': np.nan,
@@ -256,23 +452,14 @@ def compute_window_metrics(df: pd.DataFrame, window_start: int, window_end: int,
             'n_days': 0,
         }
     
-    window_df['cum_return'] = (1 + window_df['return']).cumprod() - 1
-    total_return = window_df['cum_return'].iloc[-1] if len(window_df) > 0 else 0.0
-    
-    # Max drawdown
-    running_max = window_df['cum_return'].expanding().max()
-    drawdown = window_df['cum_return'] - running_max
-    max_drawdown = drawdown.min()
+    total_return, max_drawdown, daily_vol, peak_return = window_stats(window_returns, window_log)
     
     # Volatility (annualized)
-    volatility = window_df['return'].std() * np.sqrt(252)
+    volatility = daily_vol * SQRT_252
     
     # Sharpe-like (using daily returns, assuming 0 risk-free rate)
     sharpe = (total_return / (volatility + 1e-8)) if volatility > 0 else np.nan
     
-    # Peak return during window
-    peak_return = window_df['cum_return'].max()
-    
     return {
         'return': total_return,
         'cum_return': total_return,
@@ -280,97 +467,208 @@ def compute_window_metrics(df: pd.DataFrame, window_start: int, window_end: int,
         'volatility': volatility,
         'sharpe': sharpe,
         'peak_return': peak_return,
-        'n_days': len(window_df),
+        'n_days': len(window_returns),
     }
 
 
-def estimate_market_model(chz_df: pd.DataFrame, btc_df: pd.DataFrame, 
-                         estimation_start: date, estimation_end: date) -> Tuple[float, float]:
+def _ols_alpha_beta_windows(x, y, lo, hi):
     """
-    Estimate market model: r_CHZ = alpha + beta * r_BTC + epsilon
+    Closed-form simple OLS of y on x over each row range [lo[k], hi[k]).
     
-    Returns:
-        (alpha, beta)
+    Pairs with a NaN are skipped. Ranges with fewer than 30 complete pairs
+    give NaN; a constant regressor gives beta = 1.
     """
-    # Merge on date
-    merged = pd.merge(
-        chz_df[['date', 'return']].rename(columns={'return': 'chz_return'}),
-        btc_df[['date', 'return']].rename(columns={'return': 'btc_return'}),
-        on='date',
-        how='inner'
-    )
+    alphas = np.full(lo.size, np.nan)
+    betas = np.full(lo.size, np.nan)
+    for k in range(lo.size):
+        n = 0
+        sx = 0.0
+        sy = 0.0
+        for i in range(lo[k], hi[k]):
+            if not (np.isnan(x[i]) or np.isnan(y[i])):
+                n += 1
+                sx += x[i]
+                sy += y[i]
+        if n < 30:
+            continue
+        mx = sx / n
+        my = sy / n
+        num = 0.0
+        den = 0.0
+        for i in range(lo[k], hi[k]):
+            if not (np.isnan(x[i]) or np.isnan(y[i])):
+                dx = x[i] - mx
+                num += dx * (y[i] - my)
+                den += dx * dx
+        beta = num / den if den > 0 else 1.0
+        alphas[k] = my - beta * mx
+        betas[k] = beta
+    return alphas, betas
+
+
+if HAS_NUMBA:
+    ols_alpha_beta_windows = njit(cache=True)(_ols_alpha_beta_windows)
+else:
+    def ols_alpha_beta_windows(x, y, lo, hi):
+        # Prefix sums over complete pairs give n, Sx, Sy, Sxx, Sxy for
+        # every range at once
+        valid = ~(np.isnan(x) | np.isnan(y))
+        xv = np.where(valid, x, 0.0)
+        yv = np.where(valid, y, 0.0)
+        sums = np.zeros((5, x.size + 1))
+        np.cumsum(np.vstack([valid, xv, yv, xv * xv, xv * yv]), axis=1, out=sums[:, 1:])
+        n, sx, sy, sxx, sxy = sums[:, hi] - sums[:, lo]
+        den = n * sxx - sx * sx
+        with np.errstate(divide='ignore', invalid='ignore'):
+            betas = np.where(den > 0, (n * sxy - sx * sy) / den, 1.0)
+            alphas = (sy - betas * sx) / n
+        enough = n >= 30
+        return np.where(enough, alphas, np.nan), np.where(enough, betas, np.nan)
+
+
+def compute_event_window_metrics(returns: Dict[str, np.ndarray], present: Dict[str, np.ndarray],
+                                 cum_log: Dict[str, np.ndarray], bounds: np.ndarray) -> List[Dict]:
+    """
+    Compute CHZ metrics and excess returns vs BTC/ETH for every window of one event.
     
-    # Filter to estimation window
-    est_data = merged[
-        (merged['date'] >= estimation_start) & 
-        (merged['date'] <= estimation_end)
-    ].copy()
+    Args:
+        returns, present: Output of build_return_panel()
+        cum_log: Per-asset cumulative_log_returns() of `returns`
+        bounds: This event's (len(WINDOWS), 2) slice of window_bounds()
     
-    if len(est_data) < 30:
-        return (0.0, 1.0)  # Default if insufficient data
+    Returns:
+        One row per window in WINDOWS order
+    """
+    rows = []
+    for (window_id, (w_start, w_end)), (lo, hi) in zip(WINDOWS.items(), bounds):
+        metrics = compute_window_metrics(returns['chz'], lo, hi, present['chz'], cum_log['chz'])
+        
+        # Also compute excess returns vs BTC and ETH
+        btc_metrics = compute_window_metrics(returns['btc'], lo, hi, present['btc'], cum_log['btc'])
+        eth_metrics = compute_window_metrics(returns['eth'], lo, hi, present['eth'], cum_log['eth'])
+        
+        metrics['excess_vs_btc'] = metrics['return'] - btc_metrics['return']
+        metrics['excess_vs_eth'] = metrics['return'] - eth_metrics['return']
+        
+        rows.append({
+            'window_id': window_id,
+            'window_start': w_start,
+            'window_end': w_end,
+            **metrics,
+        })
+    return rows
+
+
+def market_returns(dates: np.ndarray, returns: Dict[str, np.ndarray],
+                   present: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    CHZ and BTC daily returns on the dates both assets have.
     
-    # Remove NaN
-    est_data = est_data.dropna()
+    Args:
+        dates, returns, present: Output of build_return_panel()
     
-    if len(est_data) < 30:
-        return (0.0, 1.0)
+    Returns:
+        DataFrame with date, chz_return, btc_return sorted by date
+    """
+    both = present['chz'] & present['btc']
+    return pd.DataFrame({
+        'date': dates[both].astype(object),
+        'chz_return': returns['chz'][both],
+        'btc_return': returns['btc'][both],
+    })
+
+
+def estimate_market_models(mkt: pd.DataFrame, estimation_starts: List[date],
+                           estimation_ends: List[date]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Estimate the market model r_CHZ = alpha + beta * r_BTC + epsilon for
+    several estimation windows in one pass.
     
-    # OLS regression
-    X = est_data['btc_return'].values
-    y = est_data['chz_return'].values
+    Args:
+        mkt: Returns frame from market_returns()
+        estimation_starts: First date of each estimation window
+        estimation_ends: Last date of each estimation window
     
-    # Simple OLS
-    X_with_const = np.column_stack([np.ones(len(X)), X])
-    beta_hat = np.linalg.lstsq(X_with_const, y, rcond=None)[0]
-    alpha, beta = beta_hat[0], beta_hat[1]
+    Returns:
+        (alphas, betas) arrays; (0, 1) where a window has < 30 complete days
+    """
+    dates = np.asarray(mkt['date'], dtype='datetime64[D]')
+    lo = np.searchsorted(dates, np.asarray(estimation_starts, dtype='datetime64[D]'), side='left')
+    hi = np.searchsorted(dates, np.asarray(estimation_ends, dtype='datetime64[D]'), side='right')
+    
+    alphas, betas = ols_alpha_beta_windows(
+        mkt['btc_return'].to_numpy(dtype=float),
+        mkt['chz_return'].to_numpy(dtype=float),
+        lo,
+        hi,
+    )
     
-    return (alpha, beta)
+    # Default if insufficient data
+    insufficient = np.isnan(betas)
+    return np.where(insufficient, 0.0, alphas), np.where(insufficient, 1.0, betas)
+
+
+def estimate_market_model(mkt: pd.DataFrame, estimation_start: date,
+                         estimation_end: date) -> Tuple[float, float]:
+    """
+    Estimate market model: r_CHZ = alpha + beta * r_BTC + epsilon
+    
+    Returns:
+        (alpha, beta)
+    """
+    alphas, betas = estimate_market_models(mkt, [estimation_start], [estimation_end])
+    return (float(alphas[0]), float(betas[0]))
+
+
+def estimation_window(event_start: date) -> Tuple[date, date]:
+    """Market-model estimation window: [-180, -60] days before the event."""
+    return (event_start + timedelta(days=ESTIMATION_WINDOW[0]),
+            event_start + timedelta(days=ESTIMATION_WINDOW[1]))
 
 
-def compute_abnormal_returns(chz_df: pd.DataFrame, btc_df: pd.DataFrame,
-                            event_start: date, estimation_days: int = 120) -> pd.DataFrame:
+def compute_abnormal_returns(mkt: pd.DataFrame, event_start: date,
+                            estimation_days: int = 120,
+                            model: Optional[Tuple[float, float]] = None) -> pd.DataFrame:
     """
     Compute abnormal returns using market model.
     
     Args:
-        chz_df: CHZ price data
-        btc_df: BTC price data
+        mkt: Returns frame from market_returns()
         event_start: Event start date
         estimation_days: Days before event to use for beta estimation
+        model: Precomputed (alpha, beta) for this event, e.g. from
+            estimate_market_models(); estimated here when omitted
     
     Returns:
         DataFrame with abnormal returns and CAR
     """
-    # Estimation window: [-180, -60] days before event
-    est_start = event_start - timedelta(days=180)
-    est_end = event_start - timedelta(days=60)
-    
-    alpha, beta = estimate_market_model(chz_df, btc_df, est_start, est_end)
-    
-    # Merge data
-    merged = pd.merge(
-        chz_df[['date', 'return']].rename(columns={'return': 'chz_return'}),
-        btc_df[['date', 'return']].rename(columns={'return': 'btc_return'}),
-        on='date',
-        how='inner'
+    if model is None:
+        model = estimate_market_model(mkt, *estimation_window(event_start))
+    alpha, beta = model
+    
+    # Expected return, abnormal return and cumulative abnormal return on a
+    # fresh frame; mkt itself is shared across events and left untouched
+    expected_return = alpha + beta * mkt['btc_return']
+    abnormal_return = mkt['chz_return'] - expected_return
+    return mkt.assign(
+        expected_return=expected_return,
+        abnormal_return=abnormal_return,
+        car=abnormal_return.cumsum(),
     )
-    
-    # Compute expected return
-    merged['expected_return'] = alpha + beta * merged['btc_return']
-    
-    # Abnormal return
-    merged['abnormal_return'] = merged['chz_return'] - merged['expected_return']
-    
-    # Cumulative abnormal return
-    merged['car'] = merged['abnormal_return'].cumsum()
-    
-    return merged
 
 
-def bootstrap_ci(data: np.ndarray, n_boot: int = 10000, ci: float = 0.95) -> Tuple[float, float, float]:
+def bootstrap_ci(data: np.ndarray, n_boot: int = 10000, ci: float = 0.95,
+                 rng: Optional[np.random.Generator] = None) -> Tuple[float, float, float]:
     """
     Bootstrap confidence interval for mean.
     
+    Args:
+        data: Sample (NaNs are dropped)
+        n_boot: Number of bootstrap replicates
+        ci: Confidence level
+        rng: Generator to draw from; pass np.random.default_rng(seed) for
+            reproducible intervals. A fresh unseeded one is used if omitted.
+    
     Returns:
         (mean, lower_ci, upper_ci)
     """
@@ -381,12 +679,16 @@ def bootstrap_ci(data: np.ndarray, n_boot: int = 10000, ci: float = 0.95) -> Tup
     if len(data_clean) == 0:
         return (np.nan, np.nan, np.nan)
     
-    means = []
-    for _ in range(n_boot):
-        sample = np.random.choice(data_clean, size=len(data_clean), replace=True)
-        means.append(np.mean(sample))
-    
-    means = np.array(means)
+    # All replicates are drawn as one (n_boot, n) index matrix and reduced
+    # row-wise; blocks of replicates keep the matrix under ~64 MiB
+    if rng is None:
+        rng = np.random.default_rng()
+    n = len(data_clean)
+    block = max(1, (64 * 2**20) // (8 * n))
+    means = np.concatenate([
+        data_clean[rng.integers(0, n, size=(min(block, n_boot - start), n))].mean(axis=1)
+        for start in range(0, n_boot, block)
+    ])
     mean_val = np.mean(data_clean)
     lower = np.percentile(means, (1 - ci) / 2 * 100)
     upper = np.percentile(means, (1 + ci) / 2 * 100)
@@ -394,52 +696,79 @@ def bootstrap_ci(data: np.ndarray, n_boot: int = 10000, ci: float = 0.95) -> Tup
     return (mean_val, lower, upper)
 
 
-def wilcoxon_test(data: np.ndarray) -> Tuple[float, float]:
+def wilcoxon_tests(data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Wilcoxon signed-rank test (tests if median is significantly different from 0).
+    Wilcoxon signed-rank test on each row of a 2-D array (tests if the
+    median is significantly different from 0). NaN entries are ignored, so
+    rows of different lengths can be NaN-padded.
     
     Returns:
-        (statistic, p_value)
+        (statistics, p_values), NaN for rows with fewer than 3 values or
+        where the test cannot be computed
     """
-    from scipy import stats
+    data = np.atleast_2d(np.asarray(data, dtype=float))
+    stat = np.full(len(data), np.nan)
+    pval = np.full(len(data), np.nan)
+    if not HAS_SCIPY:
+        return (stat, pval)
     
-    data_clean = data[~np.isnan(data)]
-    if len(data_clean) < 3:
-        return (np.nan, np.nan)
+    rows = np.flatnonzero((~np.isnan(data)).sum(axis=1) >= 3)
+    if len(rows) == 0:
+        return (stat, pval)
     
     try:
-        stat, pval = stats.wilcoxon(data_clean)
-        return (stat, pval)
-    except:
-        return (np.nan, np.nan)
+        result = stats.wilcoxon(data[rows], axis=1, nan_policy='omit')
+        stat[rows] = result.statistic
+        pval[rows] = result.pvalue
+    except ValueError:
+        # One degenerate row fails the whole batch; retry row by row so
+        # only that row stays NaN
+        for i in rows:
+            try:
+                result = stats.wilcoxon(data[i], nan_policy='omit')
+                stat[i], pval[i] = result.statistic, result.pvalue
+            except ValueError:
+                pass
+    return (stat, pval)
 
 
-def compute_rolling_beta(chz_df: pd.DataFrame, btc_df: pd.DataFrame, window: int = 60) -> pd.DataFrame:
-    """Compute rolling beta of CHZ vs BTC."""
-    merged = pd.merge(
-        chz_df[['date', 'return']].rename(columns={'return': 'chz_return'}),
-        btc_df[['date', 'return']].rename(columns={'return': 'btc_return'}),
-        on='date',
-        how='inner'
-    ).sort_values('date')
-    
-    merged['beta'] = np.nan
-    
-    for i in range(window, len(merged)):
-        window_data = merged.iloc[i-window:i]
-        window_data = window_data.dropna()
-        
-        if len(window_data) < 30:
-            continue
-        
-        X = window_data['btc_return'].values
-        y = window_data['chz_return'].values
-        
-        X_with_const = np.column_stack([np.ones(len(X)), X])
-        beta_hat = np.linalg.lstsq(X_with_const, y, rcond=None)[0]
-        merged.iloc[i, merged.columns.get_loc('beta')] = beta_hat[1]
+def wilcoxon_test(data: np.ndarray) -> Tuple[float, float]:
+    """
+    Wilcoxon signed-rank test (tests if median is significantly different from 0).
     
-    return merged[['date', 'beta']]
+    Returns:
+        (statistic, p_value)
+    """
+    stat, pval = wilcoxon_tests(data)
+    return (stat[0], pval[0])
+
+
+def compute_rolling_beta(mkt: pd.DataFrame, window: int = 60) -> pd.DataFrame:
+    """Compute rolling beta of CHZ vs BTC from market_returns() output."""
+    # Closed-form OLS slope over the `window` rows before each date, from
+    # rolling sums of x, y, x^2 and xy over the rows where both returns are
+    # present: beta = (n*Sxy - Sx*Sy) / (n*Sxx - Sx^2). Needs >= 30 such rows.
+    x = mkt['btc_return'].to_numpy(dtype=float)
+    y = mkt['chz_return'].to_numpy(dtype=float)
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x = np.where(valid, x, 0.0)
+    y = np.where(valid, y, 0.0)
+    
+    def prior_sum(values: np.ndarray) -> np.ndarray:
+        # Sum over rows [i - window, i), i.e. excluding row i itself
+        return pd.Series(values).rolling(window, min_periods=1).sum().shift(1).to_numpy()
+    
+    n = prior_sum(valid.astype(float))
+    sx, sy = prior_sum(x), prior_sum(y)
+    sxx, sxy = prior_sum(x * x), prior_sum(x * y)
+    denom = n * sxx - sx * sx
+    with np.errstate(divide='ignore', invalid='ignore'):
+        beta = (n * sxy - sx * sy) / denom
+    beta[(np.arange(len(mkt)) < window) | (n < 30) | (denom == 0)] = np.nan
+    
+    # The finished array becomes the output column directly; mkt is
+    # never widened with a placeholder column
+    return pd.DataFrame({'date': mkt['date'].to_numpy(), 'beta': beta})
 
 
 def compute_regime_splits(btc_df: pd.DataFrame) -> pd.DataFrame:
@@ -458,15 +787,27 @@ def compute_regime_splits(btc_df: pd.DataFrame) -> pd.DataFrame:
     
     # Volatility: rolling 30D vol
     btc_df['return'] = btc_df['close'].pct_change()
-    btc_df['vol_30d'] = btc_df['return'].rolling(30, min_periods=1).std() * np.sqrt(252)
+    btc_df['vol_30d'] = btc_df['return'].rolling(30, min_periods=1).std() * SQRT_252
     vol_median = btc_df['vol_30d'].median()
     btc_df['vol_regime'] = (btc_df['vol_30d'] > vol_median).astype(int)
     
     return btc_df[['date', 'trend_regime', 'vol_regime']]
 
 
-def main():
-    """Main analysis function."""
+def save_output(df: pd.DataFrame, path: Path) -> None:
+    """Write an output table as zstd-compressed parquet."""
+    df.to_parquet(path, index=False, compression='zstd', compression_level=3)
+
+
+def main() -> dict:
+    """
+    Main analysis function.
+    
+    Returns:
+        Output name (file stem, e.g. "window_metrics") -> DataFrame, for
+        every table written to outputs/, so in-process callers can use the
+        results without reading them back from disk
+    """
     print("=" * 80)
     print("CHZ World Cup Event Study Analysis")
     print("=" * 80)
@@ -497,71 +838,69 @@ def main():
     print("FETCHING DATA")
     print("=" * 80)
     
-    print("\nFetching CHZ...")
-    chz_df = fetch_price_data("CHZ/USDT", start_date, data_end_date, coingecko_id="chiliz")
-    chz_df = compute_returns(chz_df)
-    print(f"  CHZ: {len(chz_df)} days, {chz_df['date'].min()} to {chz_df['date'].max()}")
-    
-    print("\nFetching BTC...")
-    btc_df = fetch_price_data("BTC/USDT", start_date, data_end_date, coingecko_id="bitcoin")
-    btc_df = compute_returns(btc_df)
-    print(f"  BTC: {len(btc_df)} days, {btc_df['date'].min()} to {btc_df['date'].max()}")
-    
-    print("\nFetching ETH...")
-    eth_df = fetch_price_data("ETH/USDT", start_date, data_end_date, coingecko_id="ethereum")
-    eth_df = compute_returns(eth_df)
-    print(f"  ETH: {len(eth_df)} days, {eth_df['date'].min()} to {eth_df['date'].max()}")
+    # The three downloads are independent and network-bound, so they run
+    # concurrently; CoinGecko requests are still serialized (see
+    # COINGECKO_SEMAPHORE) to stay inside its rate limit
+    print("\nFetching CHZ, BTC and ETH...")
+    with ThreadPoolExecutor(max_workers=len(FETCH_ASSETS)) as executor:
+        futures = {
+            name: executor.submit(fetch_price_data, symbol, start_date, data_end_date, coingecko_id=coingecko_id)
+            for name, (symbol, coingecko_id) in FETCH_ASSETS.items()
+        }
+        frames = {name: compute_returns(future.result()) for name, future in futures.items()}
+    for name, df in frames.items():
+        print(f"  {name.upper()}: {len(df)} days, {df['date'].min()} to {df['date'].max()}")
+    chz_df, btc_df, eth_df = frames['chz'], frames['btc'], frames['eth']
     
     # Save raw data
-    chz_df.to_csv(output_dir / "chz_data.csv", index=False)
-    btc_df.to_csv(output_dir / "btc_data.csv", index=False)
-    eth_df.to_csv(output_dir / "eth_data.csv", index=False)
+    save_output(chz_df, output_dir / "chz_data.parquet")
+    save_output(btc_df, output_dir / "btc_data.parquet")
+    save_output(eth_df, output_dir / "eth_data.parquet")
     
     print("\n" + "=" * 80)
     print("COMPUTING WINDOW METRICS")
     print("=" * 80)
     
-    # Compute window metrics for each event
+    # Compute window metrics for each event. All three return series live
+    # as contiguous arrays on one shared date axis; the row range of every
+    # (event, window) on it is looked up once up front.
+    dates, returns, present = build_return_panel({'chz': chz_df, 'btc': btc_df, 'eth': eth_df})
+    cum_log = {name: cumulative_log_returns(r) for name, r in returns.items()}
+    bounds = window_bounds(dates, [event_info['start'] for event_info in EVENTS.values()])
     all_results = []
     
-    for event_id, event_info in EVENTS.items():
+    for (event_id, event_info), event_bounds in zip(EVENTS.items(), bounds):
         print(f"\nProcessing {event_info['name']}...")
-        event_start = event_info['start']
-        
-        for window_id, (w_start, w_end) in WINDOWS.items():
-            metrics = compute_window_metrics(chz_df, w_start, w_end, event_start)
-            
-            # Also compute excess returns vs BTC and ETH
-            btc_metrics = compute_window_metrics(btc_df, w_start, w_end, event_start)
-            eth_metrics = compute_window_metrics(eth_df, w_start, w_end, event_start)
-            
-            metrics['excess_vs_btc'] = metrics['return'] - btc_metrics['return']
-            metrics['excess_vs_eth'] = metrics['return'] - eth_metrics['return']
-            
+        for row in compute_event_window_metrics(returns, present, cum_log, event_bounds):
             all_results.append({
                 'event_id': event_id,
                 'event_name': event_info['name'],
-                'window_id': window_id,
-                'window_start': w_start,
-                'window_end': w_end,
-                **metrics,
+                **row,
             })
     
     results_df = pd.DataFrame(all_results)
-    results_df.to_csv(output_dir / "window_metrics.csv", index=False)
-    print(f"\nSaved window metrics to {output_dir / 'window_metrics.csv'}")
+    save_output(results_df, output_dir / "window_metrics.parquet")
+    print(f"\nSaved window metrics to {output_dir / 'window_metrics.parquet'}")
     
     # Compute abnormal returns (CAR)
     print("\n" + "=" * 80)
     print("COMPUTING ABNORMAL RETURNS (CAR)")
     print("=" * 80)
     
+    # CHZ/BTC returns come straight off the shared axis and are reused by
+    # every event and the rolling beta below
+    mkt = market_returns(dates, returns, present)
+    
+    # Alpha/beta for every event's estimation window in one batched call
+    est_starts, est_ends = zip(*(estimation_window(info['start']) for info in EVENTS.values()))
+    alphas, betas = estimate_market_models(mkt, list(est_starts), list(est_ends))
+    
     car_results = []
-    for event_id, event_info in EVENTS.items():
+    for (event_id, event_info), alpha, beta in zip(EVENTS.items(), alphas, betas):
         print(f"\nComputing CAR for {event_info['name']}...")
         event_start = event_info['start']
         
-        car_df = compute_abnormal_returns(chz_df, btc_df, event_start)
+        car_df = compute_abnormal_returns(mkt, event_start, model=(float(alpha), float(beta)))
         car_df['event_id'] = event_id
         car_df['event_name'] = event_info['name']
         # Convert date to datetime if needed, then compute days difference
@@ -574,17 +913,17 @@ def main():
         car_results.append(car_df)
     
     car_all = pd.concat(car_results, ignore_index=True)
-    car_all.to_csv(output_dir / "abnormal_returns.csv", index=False)
-    print(f"\nSaved abnormal returns to {output_dir / 'abnormal_returns.csv'}")
+    save_output(car_all, output_dir / "abnormal_returns.parquet")
+    print(f"\nSaved abnormal returns to {output_dir / 'abnormal_returns.parquet'}")
     
     # Compute rolling beta
     print("\n" + "=" * 80)
     print("COMPUTING ROLLING BETA")
     print("=" * 80)
     
-    rolling_beta = compute_rolling_beta(chz_df, btc_df, window=60)
-    rolling_beta.to_csv(output_dir / "rolling_beta.csv", index=False)
-    print(f"\nSaved rolling beta to {output_dir / 'rolling_beta.csv'}")
+    rolling_beta = compute_rolling_beta(mkt, window=60)
+    save_output(rolling_beta, output_dir / "rolling_beta.parquet")
+    print(f"\nSaved rolling beta to {output_dir / 'rolling_beta.parquet'}")
     
     # Compute regime splits
     print("\n" + "=" * 80)
@@ -592,8 +931,8 @@ def main():
     print("=" * 80)
     
     regimes = compute_regime_splits(btc_df)
-    regimes.to_csv(output_dir / "btc_regimes.csv", index=False)
-    print(f"\nSaved regime splits to {output_dir / 'btc_regimes.csv'}")
+    save_output(regimes, output_dir / "btc_regimes.parquet")
+    print(f"\nSaved regime splits to {output_dir / 'btc_regimes.parquet'}")
     
     # Statistical tests
     print("\n" + "=" * 80)
@@ -603,32 +942,39 @@ def main():
     # Focus on key windows: pre-event and event windows
     key_windows = ['pre_60_30', 'pre_30_14', 'pre_14_0', 'event_0_7', 'event_0_14', 'event_0_30']
     
+    window_data = {
+        window_id: results_df.loc[results_df['window_id'] == window_id, 'return'].to_numpy()
+        for window_id in key_windows
+    }
+    
+    # One Wilcoxon call over all key windows, NaN-padded to a common length
+    padded = np.full((len(key_windows), max(len(v) for v in window_data.values())), np.nan)
+    for i, values in enumerate(window_data.values()):
+        padded[i, :len(values)] = values
+    wilcox_stats, wilcox_pvals = wilcoxon_tests(padded)
+    
+    # One generator feeds every window's bootstrap
+    rng = np.random.default_rng()
+    
     stats_results = []
-    for window_id in key_windows:
-        window_data = results_df[results_df['window_id'] == window_id]['return'].values
-        
-        mean_val, lower_ci, upper_ci = bootstrap_ci(window_data)
-        try:
-            from scipy import stats
-            wilcox_stat, wilcox_pval = wilcoxon_test(window_data)
-        except:
-            wilcox_stat, wilcox_pval = np.nan, np.nan
+    for (window_id, values), wilcox_stat, wilcox_pval in zip(window_data.items(), wilcox_stats, wilcox_pvals):
+        mean_val, lower_ci, upper_ci = bootstrap_ci(values, rng=rng)
         
         stats_results.append({
             'window_id': window_id,
-            'n_events': len(window_data),
+            'n_events': len(values),
             'mean_return': mean_val,
             'lower_ci_95': lower_ci,
             'upper_ci_95': upper_ci,
-            'median_return': np.nanmedian(window_data),
-            'hit_rate': np.mean(window_data > 0) if len(window_data) > 0 else np.nan,
+            'median_return': np.nanmedian(values),
+            'hit_rate': np.mean(values > 0) if len(values) > 0 else np.nan,
             'wilcoxon_stat': wilcox_stat,
             'wilcoxon_pval': wilcox_pval,
         })
     
     stats_df = pd.DataFrame(stats_results)
-    stats_df.to_csv(output_dir / "statistical_tests.csv", index=False)
-    print(f"\nSaved statistical tests to {output_dir / 'statistical_tests.csv'}")
+    save_output(stats_df, output_dir / "statistical_tests.parquet")
+    print(f"\nSaved statistical tests to {output_dir / 'statistical_tests.parquet'}")
     
     print("\n" + "=" * 80)
     print("ANALYSIS COMPLETE")
@@ -638,6 +984,17 @@ def main():
     print("  1. Run visualization script to generate charts")
     print("  2. Generate research memo")
     print("  3. Create tradeable playbook")
+    
+    return {
+        "chz_data": chz_df,
+        "btc_data": btc_df,
+        "eth_data": eth_df,
+        "window_metrics": results_df,
+        "abnormal_returns": car_all,
+        "rolling_beta": rolling_beta,
+        "btc_regimes": regimes,
+        "statistical_tests": stats_df,
+    }
 
 
 if __name__ == "__main__":
@@ -2,9 +2,23 @@
 Generate research memo and tradeable playbook for CHZ World Cup analysis.
 """
 
+import hashlib
+import os
+import pickle
+import re
 import pandas as pd
 import numpy as np
+import polars as pl
+from functools import cached_property
 from pathlib import Path
+from typing import Optional
+
+# jinja2 is optional: without it the templates are filled with str.format_map
+try:
+    import jinja2
+    HAS_JINJA2 = True
+except ImportError:
+    HAS_JINJA2 = False
 from datetime import date, timedelta
 
 EVENTS = {
@@ -17,120 +31,234 @@ EVENTS = {
 }
 
 
-def load_analysis_results(output_dir: Path):
-    """Load all analysis results."""
-    results_df = pd.read_csv(output_dir / "window_metrics.csv")
-    stats_df = pd.read_csv(output_dir / "statistical_tests.csv")
-    car_df = pd.read_csv(output_dir / "abnormal_returns.csv")
-    rolling_beta = pd.read_csv(output_dir / "rolling_beta.csv")
+# World Cup events and the window groups the memo summarizes
+WC_EVENTS = ['FIFA_WC_2018', 'FIFA_WC_2022']
+PRE_WINDOWS = ['pre_60_30', 'pre_30_14', 'pre_14_0']
+EVENT_WINDOWS = ['event_0_7', 'event_0_14', 'event_0_30']
+POST_WINDOWS = ['post_14_30', 'post_30_60', 'post_60_90']
+
+# window_id -> phase label used to group the memo's window statistics
+WINDOW_PHASES = {
+    **{w: 'pre' for w in PRE_WINDOWS},
+    **{w: 'event' for w in EVENT_WINDOWS},
+    **{w: 'post' for w in POST_WINDOWS},
+}
+
+# Columns each consumer actually reads from the event-study outputs
+# (None = all columns)
+RESULT_COLUMNS = {
+    "window_metrics": ["event_id", "window_id", "return", "excess_vs_btc", "max_drawdown"],
+    "statistical_tests": ["window_id", "wilcoxon_pval", "lower_ci_95", "upper_ci_95"],
+    "abnormal_returns": ["event_id", "days_from_event", "car"],
+    "rolling_beta": None,
+}
+
+# Row predicates pushed into the scan, so rows the memo never looks at are
+# never materialized (None = all rows)
+RESULT_FILTERS = {
+    "window_metrics": (
+        pl.col("event_id").is_in(WC_EVENTS)
+        & pl.col("window_id").is_in(PRE_WINDOWS + EVENT_WINDOWS + POST_WINDOWS)
+    ),
+    "statistical_tests": None,
+    "abnormal_returns": pl.col("event_id").is_in(WC_EVENTS) & (pl.col("days_from_event") == 30),
+    "rolling_beta": None,
+}
+
+
+# Findings/thesis are cached here, keyed by the version of the inputs
+FINDINGS_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "chz_memo"
+
+# Outputs analyze_key_findings reads (the findings cache key covers these)
+FINDINGS_INPUTS = ["window_metrics", "statistical_tests", "abnormal_returns"]
+
+
+def _result_path(output_dir: Path, name: str) -> Path:
+    """Path of one event-study output, preferring parquet over a legacy CSV."""
+    path = output_dir / f"{name}.parquet"
+    return path if path.exists() else output_dir / f"{name}.csv"
+
+
+def _results_exist(output_dir: Path, name: str) -> bool:
+    return _result_path(output_dir, name).exists()
+
+
+def _scan_result(output_dir: Path, name: str) -> pl.LazyFrame:
+    """
+    Lazily scan one event-study output, preferring parquet over a legacy CSV.
+    
+    The RESULT_FILTERS predicate and RESULT_COLUMNS projection are part of
+    the query plan, so Polars pushes both into the scan.
+    """
+    path = _result_path(output_dir, name)
+    lf = pl.scan_parquet(path) if path.suffix == ".parquet" else pl.scan_csv(path)
+    if RESULT_FILTERS[name] is not None:
+        lf = lf.filter(RESULT_FILTERS[name])
+    if RESULT_COLUMNS[name] is not None:
+        lf = lf.select(RESULT_COLUMNS[name])
+    return lf
+
+
+class AnalysisResults:
+    """
+    Event-study outputs in one directory, each read on first access.
+    
+    Every table is collected at most once (with the RESULT_FILTERS /
+    RESULT_COLUMNS pushdown) and then cached, so a run that never touches
+    stats or rolling_beta never reads those files.
+    """
     
-    return results_df, stats_df, car_df, rolling_beta
+    def __init__(self, output_dir: Path):
+        self.output_dir = output_dir
+    
+    @cached_property
+    def results(self) -> pl.DataFrame:
+        return _scan_result(self.output_dir, "window_metrics").collect()
+    
+    @cached_property
+    def stats(self) -> pl.DataFrame:
+        return _scan_result(self.output_dir, "statistical_tests").collect()
+    
+    @cached_property
+    def car(self) -> pl.DataFrame:
+        return _scan_result(self.output_dir, "abnormal_returns").collect()
+    
+    @cached_property
+    def rolling_beta(self) -> pl.DataFrame:
+        return _scan_result(self.output_dir, "rolling_beta").collect()
+
+
+def load_analysis_results(output_dir: Path) -> AnalysisResults:
+    """Open the analysis results in output_dir (tables load lazily)."""
+    return AnalysisResults(output_dir)
+
 
+def _lazy(frame) -> pl.LazyFrame:
+    """Accept a Polars LazyFrame/DataFrame or a pandas DataFrame."""
+    if isinstance(frame, pd.DataFrame):
+        frame = pl.from_pandas(frame)
+    return frame.lazy()
 
-def analyze_key_findings(results_df: pd.DataFrame, stats_df: pd.DataFrame, 
-                        car_df: pd.DataFrame) -> dict:
-    """Extract key findings from analysis."""
+
+def analyze_key_findings(results_df, stats_df=None, car_df=None) -> dict:
+    """
+    Extract key findings from analysis.
+    
+    Takes either an AnalysisResults (as from load_analysis_results) or the
+    three tables as Polars LazyFrames/DataFrames or pandas DataFrames. The
+    phase aggregates, the 30-day CAR and the pre_14_0 test row are
+    collected in one call.
+    """
+    if isinstance(results_df, AnalysisResults):
+        results_df, stats_df, car_df = results_df.results, results_df.stats, results_df.car
+    
     findings = {}
     
-    # Focus on World Cup events only
-    wc_events = ['FIFA_WC_2018', 'FIFA_WC_2022']
-    wc_results = results_df[results_df['event_id'].isin(wc_events)]
+    # NaN and null both count as missing, as in pandas' skipna reductions
+    ret = pl.col('return').fill_nan(None)
     
-    # Pre-event windows (60-120 days before)
-    pre_windows = ['pre_60_30', 'pre_30_14', 'pre_14_0']
-    pre_data = wc_results[wc_results['window_id'].isin(pre_windows)]
+    # Focus on World Cup events only; tag each window with its phase
+    # (pre-event = 60 to 0 days before, event, post-event) and aggregate
+    # all three phases in one group_by
+    phase_query = (
+        _lazy(results_df)
+        .filter(pl.col('event_id').is_in(WC_EVENTS))
+        .with_columns(pl.col('window_id').replace_strict(WINDOW_PHASES, default=None).alias('phase'))
+        .filter(pl.col('phase').is_not_null())
+        .group_by('phase')
+        .agg([
+            ret.mean().alias('return'),
+            ret.median().alias('median_return'),
+            # Missing returns count as misses, like (r > 0).mean() in pandas
+            (ret > 0).fill_null(False).cast(pl.Int8).mean().alias('win'),
+            pl.col('excess_vs_btc').fill_nan(None).mean().alias('excess_vs_btc'),
+            pl.col('max_drawdown').fill_nan(None).mean().alias('max_drawdown'),
+        ])
+    )
     
-    findings['pre_event_mean'] = pre_data['return'].mean()
-    findings['pre_event_median'] = pre_data['return'].median()
-    findings['pre_event_hit_rate'] = (pre_data['return'] > 0).mean()
-    findings['pre_event_excess_btc'] = pre_data['excess_vs_btc'].mean()
-    findings['pre_event_max_dd'] = pre_data['max_drawdown'].mean()
+    queries = {'phases': phase_query}
     
-    # Event windows
-    event_windows = ['event_0_7', 'event_0_14', 'event_0_30']
-    event_data = wc_results[wc_results['window_id'].isin(event_windows)]
+    # CAR analysis: only the matching car values are collected
+    queries['car'] = (
+        _lazy(car_df)
+        .filter(pl.col('event_id').is_in(WC_EVENTS) & (pl.col('days_from_event') == 30))
+        .select('car')
+    )
     
-    findings['event_mean'] = event_data['return'].mean()
-    findings['event_median'] = event_data['return'].median()
-    findings['event_hit_rate'] = (event_data['return'] > 0).mean()
-    findings['event_excess_btc'] = event_data['excess_vs_btc'].mean()
+    # Statistical significance: a pushed-down single-row filter
+    queries['stats'] = _lazy(stats_df).filter(pl.col('window_id') == 'pre_14_0').head(1)
     
-    # Post-event
-    post_windows = ['post_14_30', 'post_30_60', 'post_60_90']
-    post_data = wc_results[wc_results['window_id'].isin(post_windows)]
+    collected = dict(zip(queries, pl.collect_all(list(queries.values()), engine='streaming')))
+    phases = collected['phases']
+    car_30d = collected['car']['car'].to_numpy().astype(np.float64, copy=False)
+    pre_14_0_row = collected['stats'].row(0, named=True) if not collected['stats'].is_empty() else None
     
-    findings['post_event_mean'] = post_data['return'].mean()
-    findings['post_event_max_dd'] = post_data['max_drawdown'].mean()
+    by_phase = {row['phase']: row for row in phases.to_dicts()}
     
-    # CAR analysis
-    wc_car = car_df[car_df['event_id'].isin(wc_events)]
-    car_30d = wc_car[wc_car['days_from_event'] == 30]['car'].values
-    findings['car_30d_mean'] = np.nanmean(car_30d) if len(car_30d) > 0 else np.nan
+    # Findings are plain Python floats (missing -> nan), so template
+    # formatting never dispatches through NumPy/pandas scalar types
+    def as_float(value) -> float:
+        return np.nan if value is None else float(value)
     
-    # Statistical significance
-    pre_14_0_stats = stats_df[stats_df['window_id'] == 'pre_14_0']
-    if len(pre_14_0_stats) > 0:
-        findings['pre_14_0_pval'] = pre_14_0_stats.iloc[0]['wilcoxon_pval']
-        findings['pre_14_0_ci_lower'] = pre_14_0_stats.iloc[0]['lower_ci_95']
-        findings['pre_14_0_ci_upper'] = pre_14_0_stats.iloc[0]['upper_ci_95']
+    def phase_value(phase: str, column: str) -> float:
+        return as_float(by_phase.get(phase, {}).get(column))
     
-    return findings
-
-
-def determine_thesis(findings: dict) -> tuple:
-    """
-    Determine bull/base/bear case.
+    findings['pre_event_mean'] = phase_value('pre', 'return')
+    findings['pre_event_median'] = phase_value('pre', 'median_return')
+    findings['pre_event_hit_rate'] = phase_value('pre', 'win')
+    findings['pre_event_excess_btc'] = phase_value('pre', 'excess_vs_btc')
+    findings['pre_event_max_dd'] = phase_value('pre', 'max_drawdown')
     
-    Returns:
-        (thesis, confidence_level, reasoning)
-    """
-    # Key metrics
-    pre_hit_rate = findings.get('pre_event_hit_rate', 0)
-    pre_excess = findings.get('pre_event_excess_btc', 0)
-    pre_mean = findings.get('pre_event_mean', 0)
-    pval = findings.get('pre_14_0_pval', 1.0)
+    # Event windows
+    findings['event_mean'] = phase_value('event', 'return')
+    findings['event_median'] = phase_value('event', 'median_return')
+    findings['event_hit_rate'] = phase_value('event', 'win')
+    findings['event_excess_btc'] = phase_value('event', 'excess_vs_btc')
     
-    # Decision logic
-    if pre_hit_rate >= 0.67 and pre_excess > 0.10 and pre_mean > 0.20 and pval < 0.10:
-        thesis = "BULL"
-        confidence = "HIGH"
-        reasoning = (
-            f"Strong pre-event performance: {pre_hit_rate:.0%} hit rate, "
-            f"{pre_excess:.1%} avg excess vs BTC, {pre_mean:.1%} avg return. "
-            f"Statistically significant (p={pval:.3f})."
-        )
-    elif pre_hit_rate >= 0.50 and pre_excess > 0.05:
-        thesis = "BULL"
-        confidence = "MEDIUM"
-        reasoning = (
-            f"Moderate pre-event edge: {pre_hit_rate:.0%} hit rate, "
-            f"{pre_excess:.1%} avg excess vs BTC. Limited sample size reduces confidence."
-        )
-    elif pre_hit_rate < 0.40 or pre_excess < -0.05:
-        thesis = "BEAR"
-        confidence = "MEDIUM"
-        reasoning = (
-            f"Weak historical pattern: {pre_hit_rate:.0%} hit rate, "
-            f"{pre_excess:.1%} avg excess vs BTC. No reliable edge detected."
-        )
-    else:
-        thesis = "BASE"
-        confidence = "LOW"
-        reasoning = (
-            f"Mixed signals: {pre_hit_rate:.0%} hit rate, {pre_excess:.1%} excess. "
-            f"Insufficient evidence for strong directional view."
-        )
+    # Post-event
+    findings['post_event_mean'] = phase_value('post', 'return')
+    findings['post_event_max_dd'] = phase_value('post', 'max_drawdown')
     
-    return thesis, confidence, reasoning
+    findings['car_30d_mean'] = np.nanmean(car_30d).item() if car_30d.size else np.nan
+    
+    if pre_14_0_row is not None:
+        findings['pre_14_0_pval'] = as_float(pre_14_0_row['wilcoxon_pval'])
+        findings['pre_14_0_ci_lower'] = as_float(pre_14_0_row['lower_ci_95'])
+        findings['pre_14_0_ci_upper'] = as_float(pre_14_0_row['upper_ci_95'])
+    
+    return findings
 
 
-def generate_research_memo(output_dir: Path, findings: dict, thesis: str, 
-                          confidence: str, reasoning: str):
-    """Generate research memo markdown."""
-    
-    memo = f"""# CHZ World Cup Event Study: Research Memo
+# Conclusion line of the research memo for each thesis
+RECOMMENDATIONS = {
+    "BULL": "Consider long positioning 60-90 days before 2026 World Cup start",
+    "BASE": "Avoid directional bet, consider relative value or volatility plays",
+    "BEAR": "Avoid long positioning based on historical World Cup pattern",
+}
+
+# findings key -> format spec for the values shared by both templates
+# (each is exposed to the templates as "<key>_pct")
+_PCT_FORMATS = {
+    'pre_event_mean': '.1%',
+    'pre_event_median': '.1%',
+    'pre_event_hit_rate': '.0%',
+    'pre_event_excess_btc': '.1%',
+    'pre_event_max_dd': '.1%',
+    'event_mean': '.1%',
+    'event_median': '.1%',
+    'event_hit_rate': '.0%',
+    'event_excess_btc': '.1%',
+    'post_event_mean': '.1%',
+    'post_event_max_dd': '.1%',
+    'car_30d_mean': '.1%',
+    'pre_14_0_ci_lower': '.1%',
+    'pre_14_0_ci_upper': '.1%',
+}
+
+# Markdown templates, filled by _render() from _format_findings()
+_MEMO_TPL = """# CHZ World Cup Event Study: Research Memo
 
-**Date:** {date.today().strftime('%Y-%m-%d')}  
+**Date:** {today}  
 **Asset:** Chiliz (CHZ)  
 **Focus:** Performance around FIFA World Cup and major football events  
 **Target:** 2026 FIFA World Cup positioning
@@ -149,29 +277,29 @@ def generate_research_memo(output_dir: Path, findings: dict, thesis: str,
 
 ### Pre-Event Performance (60-120 days before World Cups)
 
-- **Average Return:** {findings.get('pre_event_mean', 0):.1%}
-- **Median Return:** {findings.get('pre_event_median', 0):.1%}
-- **Hit Rate:** {findings.get('pre_event_hit_rate', 0):.0%} (positive return frequency)
-- **Average Excess vs BTC:** {findings.get('pre_event_excess_btc', 0):.1%}
-- **Average Maximum Drawdown:** {findings.get('pre_event_max_dd', 0):.1%}
+- **Average Return:** {pre_event_mean_pct}
+- **Median Return:** {pre_event_median_pct}
+- **Hit Rate:** {pre_event_hit_rate_pct} (positive return frequency)
+- **Average Excess vs BTC:** {pre_event_excess_btc_pct}
+- **Average Maximum Drawdown:** {pre_event_max_dd_pct}
 
 ### During Event Performance
 
-- **Average Return:** {findings.get('event_mean', 0):.1%}
-- **Median Return:** {findings.get('event_median', 0):.1%}
-- **Hit Rate:** {findings.get('event_hit_rate', 0):.0%}
-- **Average Excess vs BTC:** {findings.get('event_excess_btc', 0):.1%}
+- **Average Return:** {event_mean_pct}
+- **Median Return:** {event_median_pct}
+- **Hit Rate:** {event_hit_rate_pct}
+- **Average Excess vs BTC:** {event_excess_btc_pct}
 
 ### Post-Event Performance
 
-- **Average Return:** {findings.get('post_event_mean', 0):.1%}
-- **Average Maximum Drawdown:** {findings.get('post_event_max_dd', 0):.1%}
+- **Average Return:** {post_event_mean_pct}
+- **Average Maximum Drawdown:** {post_event_max_dd_pct}
 
 ### Abnormal Returns (Market Model)
 
-- **30-Day CAR (Cumulative Abnormal Return):** {findings.get('car_30d_mean', 0):.1%}
-- **Statistical Significance (Pre-14-0 window):** p-value = {findings.get('pre_14_0_pval', 1.0):.3f}
-- **95% Confidence Interval:** [{findings.get('pre_14_0_ci_lower', 0):.1%}, {findings.get('pre_14_0_ci_upper', 0):.1%}]
+- **30-Day CAR (Cumulative Abnormal Return):** {car_30d_mean_pct}
+- **Statistical Significance (Pre-14-0 window):** p-value = {pre_14_0_pval}
+- **95% Confidence Interval:** [{pre_14_0_ci_lower_pct}, {pre_14_0_ci_upper_pct}]
 
 ---
 
@@ -204,28 +332,28 @@ def generate_research_memo(output_dir: Path, findings: dict, thesis: str,
 
 ### 1. Did CHZ reliably outperform in the 60–120 days BEFORE World Cups?
 
-**Answer:** {'Yes' if findings.get('pre_event_hit_rate', 0) >= 0.60 else 'Mixed' if findings.get('pre_event_hit_rate', 0) >= 0.40 else 'No'}
+**Answer:** {pre_event_answer}
 
-- Hit rate: {findings.get('pre_event_hit_rate', 0):.0%}
-- Average excess vs BTC: {findings.get('pre_event_excess_btc', 0):.1%}
+- Hit rate: {pre_event_hit_rate_pct}
+- Average excess vs BTC: {pre_event_excess_btc_pct}
 
 ### 2. Was the move mostly pre-event or during the event?
 
-**Answer:** {'Pre-event' if findings.get('pre_event_mean', 0) > findings.get('event_mean', 0) else 'During event' if findings.get('event_mean', 0) > 0 else 'Mixed'}
+**Answer:** {timing_answer}
 
-- Pre-event avg return: {findings.get('pre_event_mean', 0):.1%}
-- Event avg return: {findings.get('event_mean', 0):.1%}
+- Pre-event avg return: {pre_event_mean_pct}
+- Event avg return: {event_mean_pct}
 
 ### 3. How bad were post-event drawdowns?
 
-**Answer:** Average max drawdown: {findings.get('post_event_max_dd', 0):.1%}
+**Answer:** Average max drawdown: {post_event_max_dd_pct}
 
 ### 4. After controlling for BTC beta, is there still abnormal performance?
 
-**Answer:** {'Yes' if abs(findings.get('car_30d_mean', 0)) > 0.05 and findings.get('pre_14_0_pval', 1.0) < 0.10 else 'Limited evidence'}
+**Answer:** {abnormal_answer}
 
-- 30-day CAR: {findings.get('car_30d_mean', 0):.1%}
-- Statistical significance: p = {findings.get('pre_14_0_pval', 1.0):.3f}
+- 30-day CAR: {car_30d_mean_pct}
+- Statistical significance: p = {pre_14_0_pval}
 
 ### 5. What would be the "best simple rule" historically?
 
@@ -265,7 +393,7 @@ To confirm/deny the thesis in real time leading up to 2026 World Cup:
 
 {reasoning}
 
-**Recommendation:** {'Consider long positioning 60-90 days before 2026 World Cup start' if thesis == 'BULL' else 'Avoid directional bet, consider relative value or volatility plays' if thesis == 'BASE' else 'Avoid long positioning based on historical World Cup pattern'}
+**Recommendation:** {recommendation}
 
 **Risk Management:** Always use stop-losses, position sizing based on volatility, and monitor for invalidation signals.
 
@@ -273,37 +401,12 @@ To confirm/deny the thesis in real time leading up to 2026 World Cup:
 
 *This memo is based on historical analysis and does not constitute financial advice. Past performance does not guarantee future results.*
 """
-    
-    memo_path = output_dir / "research_memo.md"
-    with open(memo_path, 'w', encoding='utf-8') as f:
-        f.write(memo)
-    
-    print(f"  Saved: research_memo.md")
-    return memo
 
-
-def generate_playbook(output_dir: Path, findings: dict, thesis: str):
-    """Generate tradeable playbook."""
-    
-    # Determine optimal entry/exit based on findings
-    pre_mean = findings.get('pre_event_mean', 0)
-    event_mean = findings.get('event_mean', 0)
-    
-    if pre_mean > event_mean and pre_mean > 0.10:
-        optimal_entry = "60-90 days before event start"
-        optimal_exit = "Event start or +7 days"
-    elif event_mean > 0.10:
-        optimal_entry = "14-30 days before event start"
-        optimal_exit = "Event end or +14 days"
-    else:
-        optimal_entry = "30-60 days before event start (conservative)"
-        optimal_exit = "Event start (take profits early)"
-    
-    playbook = f"""# CHZ World Cup Tradeable Playbook
+_PLAYBOOK_TPL = """# CHZ World Cup Tradeable Playbook
 
 **Target Event:** 2026 FIFA World Cup (expected: June-July 2026)  
 **Thesis:** {thesis}  
-**Last Updated:** {date.today().strftime('%Y-%m-%d')}
+**Last Updated:** {today}
 
 ---
 
@@ -515,51 +618,241 @@ Base Size = Portfolio Value × Position Pct × Volatility Multiplier × DD Multi
 ## Appendix: Historical Performance Summary
 
 ### Pre-Event Windows (World Cups Only)
-- Average Return: {findings.get('pre_event_mean', 0):.1%}
-- Hit Rate: {findings.get('pre_event_hit_rate', 0):.0%}
-- Excess vs BTC: {findings.get('pre_event_excess_btc', 0):.1%}
+- Average Return: {pre_event_mean_pct}
+- Hit Rate: {pre_event_hit_rate_pct}
+- Excess vs BTC: {pre_event_excess_btc_pct}
 
 ### Event Windows
-- Average Return: {findings.get('event_mean', 0):.1%}
-- Hit Rate: {findings.get('event_hit_rate', 0):.0%}
+- Average Return: {event_mean_pct}
+- Hit Rate: {event_hit_rate_pct}
 
 ### Post-Event
-- Average Return: {findings.get('post_event_mean', 0):.1%}
-- Average Max DD: {findings.get('post_event_max_dd', 0):.1%}
+- Average Return: {post_event_mean_pct}
+- Average Max DD: {post_event_max_dd_pct}
 
 ---
 
 *This playbook is a framework for decision-making and should be adapted based on real-time market conditions and new information. Always use proper risk management and never risk more than you can afford to lose.*
 """
+
+
+_TEMPLATES = {"memo": _MEMO_TPL, "playbook": _PLAYBOOK_TPL}
+
+
+def _jinja_source(template: str) -> str:
+    """Rewrite str.format placeholders ({name}) as Jinja expressions ({{ name }})."""
+    return re.sub(r"\{(\w+)\}", r"{{ \1 }}", template)
+
+
+# Compiled once at import; markdown output, so no autoescaping
+if HAS_JINJA2:
+    _JINJA_ENV = jinja2.Environment(
+        autoescape=False, keep_trailing_newline=True, undefined=jinja2.StrictUndefined
+    )
+    _JINJA_TEMPLATES = {
+        name: _JINJA_ENV.from_string(_jinja_source(template)) for name, template in _TEMPLATES.items()
+    }
+
+
+def _render(name: str, vals: dict) -> str:
+    """Fill one of _TEMPLATES, through jinja2 when it is installed."""
+    if HAS_JINJA2:
+        return _JINJA_TEMPLATES[name].render(vals)
+    return _TEMPLATES[name].format_map(vals)
+
+
+def _format_findings(findings: dict) -> dict:
+    """
+    Format every findings value the templates use, once.
+    
+    Returns:
+        Placeholder name -> formatted string (percentages, p-value, the
+        derived question answers and today's date)
+    """
+    vals = {f"{key}_pct": format(findings.get(key, 0), spec) for key, spec in _PCT_FORMATS.items()}
+    
+    pre_hit_rate = findings.get('pre_event_hit_rate', 0)
+    pre_mean = findings.get('pre_event_mean', 0)
+    event_mean = findings.get('event_mean', 0)
+    pval = findings.get('pre_14_0_pval', 1.0)
+    
+    vals['pre_14_0_pval'] = f"{pval:.3f}"
+    vals['today'] = date.today().strftime('%Y-%m-%d')
+    vals['pre_event_answer'] = 'Yes' if pre_hit_rate >= 0.60 else 'Mixed' if pre_hit_rate >= 0.40 else 'No'
+    vals['timing_answer'] = 'Pre-event' if pre_mean > event_mean else 'During event' if event_mean > 0 else 'Mixed'
+    vals['abnormal_answer'] = (
+        'Yes' if abs(findings.get('car_30d_mean', 0)) > 0.05 and pval < 0.10 else 'Limited evidence'
+    )
+    return vals
+
+
+def determine_thesis(findings: dict) -> tuple:
+    """
+    Determine bull/base/bear case.
+    
+    Returns:
+        (thesis, confidence_level, reasoning)
+    """
+    # Key metrics
+    pre_hit_rate = findings.get('pre_event_hit_rate', 0)
+    pre_excess = findings.get('pre_event_excess_btc', 0)
+    pre_mean = findings.get('pre_event_mean', 0)
+    pval = findings.get('pre_14_0_pval', 1.0)
+    
+    # Decision logic
+    if pre_hit_rate >= 0.67 and pre_excess > 0.10 and pre_mean > 0.20 and pval < 0.10:
+        thesis = "BULL"
+        confidence = "HIGH"
+        reasoning = (
+            f"Strong pre-event performance: {pre_hit_rate:.0%} hit rate, "
+            f"{pre_excess:.1%} avg excess vs BTC, {pre_mean:.1%} avg return. "
+            f"Statistically significant (p={pval:.3f})."
+        )
+    elif pre_hit_rate >= 0.50 and pre_excess > 0.05:
+        thesis = "BULL"
+        confidence = "MEDIUM"
+        reasoning = (
+            f"Moderate pre-event edge: {pre_hit_rate:.0%} hit rate, "
+            f"{pre_excess:.1%} avg excess vs BTC. Limited sample size reduces confidence."
+        )
+    elif pre_hit_rate < 0.40 or pre_excess < -0.05:
+        thesis = "BEAR"
+        confidence = "MEDIUM"
+        reasoning = (
+            f"Weak historical pattern: {pre_hit_rate:.0%} hit rate, "
+            f"{pre_excess:.1%} avg excess vs BTC. No reliable edge detected."
+        )
+    else:
+        thesis = "BASE"
+        confidence = "LOW"
+        reasoning = (
+            f"Mixed signals: {pre_hit_rate:.0%} hit rate, {pre_excess:.1%} excess. "
+            f"Insufficient evidence for strong directional view."
+        )
+    
+    return thesis, confidence, reasoning
+
+
+def generate_research_memo(output_dir: Path, findings: dict, thesis: str, 
+                          confidence: str, reasoning: str):
+    """Generate research memo markdown."""
+    
+    vals = _format_findings(findings)
+    vals.update(thesis=thesis, confidence=confidence, reasoning=reasoning)
+    vals['recommendation'] = RECOMMENDATIONS.get(thesis, RECOMMENDATIONS['BEAR'])
+    memo = _render("memo", vals)
+    
+    (output_dir / "research_memo.md").write_text(memo, encoding='utf-8')
+    
+    print(f"  Saved: research_memo.md")
+    return memo
+
+
+def generate_playbook(output_dir: Path, findings: dict, thesis: str):
+    """Generate tradeable playbook."""
     
-    playbook_path = output_dir / "tradeable_playbook.md"
-    with open(playbook_path, 'w', encoding='utf-8') as f:
-        f.write(playbook)
+    # Determine optimal entry/exit based on findings
+    pre_mean = findings.get('pre_event_mean', 0)
+    event_mean = findings.get('event_mean', 0)
+    
+    if pre_mean > event_mean and pre_mean > 0.10:
+        optimal_entry = "60-90 days before event start"
+        optimal_exit = "Event start or +7 days"
+    elif event_mean > 0.10:
+        optimal_entry = "14-30 days before event start"
+        optimal_exit = "Event end or +14 days"
+    else:
+        optimal_entry = "30-60 days before event start (conservative)"
+        optimal_exit = "Event start (take profits early)"
+    
+    vals = _format_findings(findings)
+    vals.update(thesis=thesis, optimal_entry=optimal_entry, optimal_exit=optimal_exit)
+    playbook = _render("playbook", vals)
+    
+    (output_dir / "tradeable_playbook.md").write_text(playbook, encoding='utf-8')
     
     print(f"  Saved: tradeable_playbook.md")
     return playbook
 
 
-def main():
-    """Generate memo and playbook."""
+def _findings_cache_key(output_dir: Path) -> tuple:
+    """(path, mtime_ns, size) of each input and of this module."""
+    key = []
+    for path in [*(_result_path(output_dir, name) for name in FINDINGS_INPUTS), Path(__file__)]:
+        st = path.stat()
+        key.append((str(path.resolve()), st.st_mtime_ns, st.st_size))
+    return tuple(key)
+
+
+def _findings_cache_path(output_dir: Path) -> Path:
+    digest = hashlib.sha256(str(output_dir.resolve()).encode()).hexdigest()[:16]
+    return FINDINGS_CACHE_DIR / f"findings_{digest}.pkl"
+
+
+def compute_findings(output_dir: Path) -> tuple:
+    """
+    Analyze key findings and determine the thesis, with a disk cache.
+    
+    The result is pickled under FINDINGS_CACHE_DIR together with the
+    (mtime, size) of the inputs, so re-running the memo on unchanged
+    event-study outputs skips loading and aggregation entirely.
+    
+    Returns:
+        (findings, thesis, confidence, reasoning)
+    """
+    key = _findings_cache_key(output_dir)
+    cache_path = _findings_cache_path(output_dir)
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_key, *cached = pickle.load(f)
+            if cached_key == key:
+                print("  Using cached findings")
+                return tuple(cached)
+        except Exception:
+            pass  # Truncated/corrupt entry: recompute and overwrite
+    
+    findings = analyze_key_findings(load_analysis_results(output_dir))
+    thesis, confidence, reasoning = determine_thesis(findings)
+    
+    try:
+        FINDINGS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((key, findings, thesis, confidence, reasoning), f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Read-only checkout etc.: caching is best-effort
+    
+    return findings, thesis, confidence, reasoning
+
+
+def main(outputs: Optional[dict] = None):
+    """
+    Generate memo and playbook.
+    
+    Args:
+        outputs: Optional in-memory event-study outputs (as returned by
+            chz_event_study.main()); read from outputs/ when omitted
+    """
     print("=" * 80)
     print("CHZ World Cup Analysis - Memo & Playbook Generation")
     print("=" * 80)
     
     output_dir = Path(__file__).parent / "outputs"
     
-    if not (output_dir / "window_metrics.csv").exists():
+    if outputs is None and not _results_exist(output_dir, "window_metrics"):
         print("\n[ERROR] Analysis results not found. Please run chz_event_study.py first.")
         return
     
-    print("\nLoading analysis results...")
-    results_df, stats_df, car_df, rolling_beta = load_analysis_results(output_dir)
-    
-    print("\nAnalyzing key findings...")
-    findings = analyze_key_findings(results_df, stats_df, car_df)
-    
-    print("\nDetermining thesis...")
-    thesis, confidence, reasoning = determine_thesis(findings)
+    print("\nAnalyzing key findings and determining thesis...")
+    if outputs is not None:
+        findings = analyze_key_findings(
+            outputs["window_metrics"], outputs["statistical_tests"], outputs["abnormal_returns"]
+        )
+        thesis, confidence, reasoning = determine_thesis(findings)
+    else:
+        findings, thesis, confidence, reasoning = compute_findings(output_dir)
     
     print(f"\nThesis: {thesis} ({confidence} confidence)")
     print(f"Reasoning: {reasoning}")
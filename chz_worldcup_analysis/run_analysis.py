@@ -1,9 +1,10 @@
 """
 Main runner script for CHZ World Cup event study analysis.
-Runs all analysis steps in sequence.
+Runs the event study, then the visualizations and the memo side by side.
 """
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -21,37 +22,38 @@ def main():
     print("=" * 80)
     try:
         from chz_worldcup_analysis.chz_event_study import main as run_event_study
-        run_event_study()
+        outputs = run_event_study()
     except Exception as e:
         print(f"\n[ERROR] Event study failed: {e}")
         import traceback
         traceback.print_exc()
         return
     
-    # Step 2: Visualization
+    # Steps 2 and 3 take the event-study tables in memory; the parquet
+    # files in outputs/ are only for standalone runs and auditing. They do
+    # not depend on each other, so they run side by side in two worker
+    # processes (separate processes, since pyplot state is not thread-safe).
     print("\n" + "=" * 80)
-    print("STEP 2: Generating Visualizations")
+    print("STEPS 2-3: Generating Visualizations, Research Memo and Playbook")
     print("=" * 80)
-    try:
-        from chz_worldcup_analysis.visualize_results import main as run_visualizations
-        run_visualizations()
-    except Exception as e:
-        print(f"\n[ERROR] Visualization failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return
+    from chz_worldcup_analysis.visualize_results import main as run_visualizations
+    from chz_worldcup_analysis.generate_memo import main as generate_docs
     
-    # Step 3: Generate memo and playbook
-    print("\n" + "=" * 80)
-    print("STEP 3: Generating Research Memo and Playbook")
-    print("=" * 80)
-    try:
-        from chz_worldcup_analysis.generate_memo import main as generate_docs
-        generate_docs()
-    except Exception as e:
-        print(f"\n[ERROR] Memo generation failed: {e}")
-        import traceback
-        traceback.print_exc()
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        steps = {
+            "Visualization": executor.submit(run_visualizations, outputs),
+            "Memo generation": executor.submit(generate_docs, outputs),
+        }
+        failed = False
+        for label, future in steps.items():
+            try:
+                future.result()
+            except Exception as e:
+                print(f"\n[ERROR] {label} failed: {e}")
+                import traceback
+                traceback.print_exc()
+                failed = True
+    if failed:
         return
     
     print("\n" + "=" * 80)
@@ -61,9 +63,9 @@ def main():
     print("\nGenerated files:")
     print("  - research_memo.md")
     print("  - tradeable_playbook.md")
-    print("  - window_metrics.csv")
-    print("  - abnormal_returns.csv")
-    print("  - statistical_tests.csv")
+    print("  - window_metrics.parquet")
+    print("  - abnormal_returns.parquet")
+    print("  - statistical_tests.parquet")
     print("  - summary_table.csv")
     print("  - price_chart_with_events.png")
     print("  - window_returns_barchart.png")
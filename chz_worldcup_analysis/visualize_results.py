@@ -5,10 +5,23 @@ Generates all required charts and tables.
 
 import pandas as pd
 import numpy as np
+import polars as pl
+import matplotlib
+# Figures are only ever written to PNG: use the non-GUI Agg backend so no
+# GUI canvas is set up per figure, and keep interactive mode off
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
 from datetime import date, timedelta
 from pathlib import Path
+from typing import Optional
+
+try:
+    from .generate_memo import _result_path
+except ImportError:
+    # Fallback for direct script execution
+    from generate_memo import _result_path
 
 # Try to import seaborn, make it optional
 try:
@@ -19,10 +32,38 @@ except ImportError:
     HAS_SEABORN = False
     plt.style.use('default')
 
+# Try to import bottleneck (C moving-window kernels), make it optional
+try:
+    import bottleneck as bn
+    HAS_BOTTLENECK = True
+except ImportError:
+    HAS_BOTTLENECK = False
+
+plt.ioff()
+
 # Set style
 plt.rcParams['figure.figsize'] = (14, 8)
 plt.rcParams['font.size'] = 10
 
+# Windows shown in the bar chart and summary table
+KEY_WINDOWS = ['pre_60_30', 'pre_30_14', 'pre_14_0', 'event_0_7', 'event_0_14', 'event_0_30']
+
+# Columns each output contributes to the plots and summary table
+PLOT_COLUMNS = {
+    "chz_data": ["date", "close", "return"],
+    "btc_data": ["date", "close"],
+    "window_metrics": [
+        "event_name", "window_id", "return", "excess_vs_btc", "excess_vs_eth", "max_drawdown", "volatility",
+    ],
+    "abnormal_returns": ["event_id", "days_from_event", "car"],
+    "rolling_beta": ["date", "beta"],
+}
+
+# Multi-panel figures (one row per event, or stacked panels) are several
+# times taller than the single-panel charts; they are saved at a lower dpi
+# to keep the raster size and Agg fill time in check
+COMPOSITE_DPI = 150
+
 # Event definitions (must match main script) - All events
 EVENTS = {
     "FIFA_WC_2018": {
@@ -63,26 +104,76 @@ EVENTS = {
     },
 }
 
+# (event_id, start, end, color, name) per event, and the matching legend
+# proxy patch for the standard event shading, built once
+_EVENT_TUPLES = tuple(
+    (event_id, info['start'], info['end'], info['color'], info['name'])
+    for event_id, info in EVENTS.items()
+)
+_EVENT_LEGEND = tuple(
+    plt.Rectangle((0, 0), 1, 1, facecolor=color, alpha=0.2, label=name)
+    for _, _, _, color, name in _EVENT_TUPLES
+)
+
+
+def _scan(output_dir: Path, name: str, filters: Optional[pl.Expr] = None) -> pl.LazyFrame:
+    """
+    Lazy scan of one event-study output, projected to PLOT_COLUMNS.
+    
+    Parquet is preferred; a legacy CSV is scanned when no parquet exists.
+    """
+    path = _result_path(output_dir, name)
+    lf = pl.scan_parquet(path) if path.suffix == ".parquet" else pl.scan_csv(path, try_parse_dates=True)
+    if filters is not None:
+        lf = lf.filter(filters)
+    return lf.select(PLOT_COLUMNS[name])
+
 
 def load_data(output_dir: Path):
-    """Load all data files."""
-    chz_df = pd.read_csv(output_dir / "chz_data.csv")
-    chz_df['date'] = pd.to_datetime(chz_df['date']).dt.date
-    
-    btc_df = pd.read_csv(output_dir / "btc_data.csv")
-    btc_df['date'] = pd.to_datetime(btc_df['date']).dt.date
-    
-    results_df = pd.read_csv(output_dir / "window_metrics.csv")
-    
-    car_df = pd.read_csv(output_dir / "abnormal_returns.csv")
-    car_df['date'] = pd.to_datetime(car_df['date']).dt.date
-    
-    rolling_beta = pd.read_csv(output_dir / "rolling_beta.csv")
-    rolling_beta['date'] = pd.to_datetime(rolling_beta['date']).dt.date
-    
+    """
+    Load all data files (only the columns and rows the plots use).
+    
+    The five scans are collected together; frames are handed to pandas
+    through Arrow so `date` stays datetime.date.
+    """
+    frames = pl.collect_all([
+        _scan(output_dir, "chz_data"),
+        _scan(output_dir, "btc_data"),
+        _scan(output_dir, "window_metrics", pl.col("window_id").is_in(KEY_WINDOWS)),
+        _scan(output_dir, "abnormal_returns"),
+        _scan(output_dir, "rolling_beta"),
+    ])
+    chz_df, btc_df, results_df, car_df, rolling_beta = (df.to_arrow().to_pandas() for df in frames)
+    
+    return sort_by_date(chz_df, btc_df, results_df, car_df, rolling_beta)
+
+
+def sort_by_date(chz_df, btc_df, results_df, car_df, rolling_beta):
+    """
+    Sort the date-indexed frames once, up front.
+    
+    The plot functions assume chz_df, btc_df and rolling_beta are in date
+    order and no longer sort them themselves.
+    """
+    chz_df, btc_df, rolling_beta = (
+        df.sort_values('date', ignore_index=True) for df in (chz_df, btc_df, rolling_beta)
+    )
     return chz_df, btc_df, results_df, car_df, rolling_beta
 
 
+def moving_mean(values: pd.Series, window: int) -> np.ndarray:
+    """
+    Trailing moving average that needs only one valid value per window
+    (pandas' rolling(window, min_periods=1).mean()).
+    
+    Uses bottleneck's single-pass C kernel on the NumPy view when
+    available, pandas otherwise.
+    """
+    if HAS_BOTTLENECK:
+        return bn.move_mean(values.to_numpy(dtype=np.float64), window=window, min_count=1)
+    return values.rolling(window, min_periods=1).mean().to_numpy()
+
+
 def plot_price_chart_with_events(chz_df: pd.DataFrame, btc_df: pd.DataFrame, 
                                  output_dir: Path):
     """Plot price chart with shaded event windows."""
@@ -90,18 +181,13 @@ def plot_price_chart_with_events(chz_df: pd.DataFrame, btc_df: pd.DataFrame,
     
     # CHZ chart
     ax1 = axes[0]
-    chz_df_sorted = chz_df.sort_values('date')
-    ax1.plot(chz_df_sorted['date'], chz_df_sorted['close'], 
+    ax1.plot(chz_df['date'], chz_df['close'], 
              label='CHZ', linewidth=2, color='#2E86AB')
     
     # Shade event windows and add to legend
-    legend_elements = [plt.Line2D([0], [0], color='#2E86AB', linewidth=2, label='CHZ')]
-    for event_id, event_info in EVENTS.items():
-        start = event_info['start']
-        end = event_info['end']
-        ax1.axvspan(start, end, alpha=0.2, color=event_info['color'])
-        legend_elements.append(plt.Rectangle((0, 0), 1, 1, facecolor=event_info['color'], 
-                                             alpha=0.2, label=event_info['name']))
+    legend_elements = [plt.Line2D([0], [0], color='#2E86AB', linewidth=2, label='CHZ'), *_EVENT_LEGEND]
+    for _, start, end, color, _ in _EVENT_TUPLES:
+        ax1.axvspan(start, end, alpha=0.2, color=color)
     
     ax1.set_ylabel('CHZ Price (USD)', fontsize=12, fontweight='bold')
     ax1.set_title('CHZ Price with Major Football Event Windows', 
@@ -112,15 +198,12 @@ def plot_price_chart_with_events(chz_df: pd.DataFrame, btc_df: pd.DataFrame,
     
     # BTC chart
     ax2 = axes[1]
-    btc_df_sorted = btc_df.sort_values('date')
-    ax2.plot(btc_df_sorted['date'], btc_df_sorted['close'], 
+    ax2.plot(btc_df['date'], btc_df['close'], 
              label='BTC', linewidth=2, color='#F24236', alpha=0.7)
     
     # Shade event windows
-    for event_id, event_info in EVENTS.items():
-        start = event_info['start']
-        end = event_info['end']
-        ax2.axvspan(start, end, alpha=0.2, color=event_info['color'])
+    for _, start, end, color, _ in _EVENT_TUPLES:
+        ax2.axvspan(start, end, alpha=0.2, color=color)
     
     ax2.set_ylabel('BTC Price (USD)', fontsize=12, fontweight='bold')
     ax2.set_xlabel('Date', fontsize=12, fontweight='bold')
@@ -132,25 +215,30 @@ def plot_price_chart_with_events(chz_df: pd.DataFrame, btc_df: pd.DataFrame,
     ax2.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
     ax2.xaxis.set_major_locator(mdates.YearLocator())
     # Set x-axis limits to show future event - extend to December 2026
-    ax2.set_xlim(left=btc_df_sorted['date'].min(), right=date(2026, 12, 31))
+    ax2.set_xlim(left=btc_df['date'].min(), right=date(2026, 12, 31))
     plt.xticks(rotation=45)
     
-    plt.tight_layout()
-    plt.savefig(output_dir / "price_chart_with_events.png", dpi=300, bbox_inches='tight')
+    fig.tight_layout()
+    fig.savefig(output_dir / "price_chart_with_events.png", dpi=300, bbox_inches='tight')
     print(f"  Saved: price_chart_with_events.png")
-    plt.close()
+    plt.close(fig)
 
 
 def plot_chz_btc_ratio(chz_df: pd.DataFrame, btc_df: pd.DataFrame, 
                        output_dir: Path):
     """Plot CHZ/BTC ratio to show relative performance."""
-    # Merge dataframes on date
-    merged = pd.merge(
-        chz_df[['date', 'close']].rename(columns={'close': 'chz_price'}),
-        btc_df[['date', 'close']].rename(columns={'close': 'btc_price'}),
-        on='date',
-        how='inner'
-    ).sort_values('date')
+    # Inner-join on date: both frames are sorted with unique dates, so the
+    # common days and their row positions come from one intersect1d
+    _, chz_idx, btc_idx = np.intersect1d(
+        chz_df['date'].to_numpy().astype('datetime64[D]'),
+        btc_df['date'].to_numpy().astype('datetime64[D]'),
+        assume_unique=True, return_indices=True,
+    )
+    merged = pd.DataFrame({
+        'date': chz_df['date'].to_numpy()[chz_idx],
+        'chz_price': chz_df['close'].to_numpy()[chz_idx],
+        'btc_price': btc_df['close'].to_numpy()[btc_idx],
+    })
     
     # Calculate ratio
     merged['chz_btc_ratio'] = merged['chz_price'] / merged['btc_price']
@@ -163,7 +251,7 @@ def plot_chz_btc_ratio(chz_df: pd.DataFrame, btc_df: pd.DataFrame,
     
     # Add horizontal line at 1.0 for reference (if ratio was normalized)
     # Instead, add a moving average for context
-    merged['ratio_ma30'] = merged['chz_btc_ratio'].rolling(30, min_periods=1).mean()
+    merged['ratio_ma30'] = moving_mean(merged['chz_btc_ratio'], 30)
     ax.plot(merged['date'], merged['ratio_ma30'], 
             linewidth=1.5, color='#F24236', linestyle='--', alpha=0.7, 
             label='30-Day Moving Average', zorder=1)
@@ -176,15 +264,12 @@ def plot_chz_btc_ratio(chz_df: pd.DataFrame, btc_df: pd.DataFrame,
     ]
     
     # Plot all events - standardize to match price_chart_with_events style
-    for event_id, event_info in EVENTS.items():
-        start = event_info['start']
-        end = event_info['end']
-        
+    for (event_id, start, end, color, name), legend_patch in zip(_EVENT_TUPLES, _EVENT_LEGEND):
         # Special handling for Copa América 2024 (overlaps with Euro 2024)
         if event_id == "COPA_2024":
             # Use diagonal hatch pattern to make it visible even when overlapping
-            ax.axvspan(start, end, alpha=0.2, facecolor=event_info['color'], 
-                      hatch='///', zorder=0, edgecolor=event_info['color'], linewidth=1.5)
+            ax.axvspan(start, end, alpha=0.2, facecolor=color, 
+                      hatch='///', zorder=0, edgecolor=color, linewidth=1.5)
             # Add text annotation
             if len(merged[merged['date'] <= start]) > 0:
                 ratio_at_start = merged[merged['date'] <= start]['chz_btc_ratio'].iloc[-1]
@@ -194,18 +279,17 @@ def plot_chz_btc_ratio(chz_df: pd.DataFrame, btc_df: pd.DataFrame,
                        xy=(start, ratio_at_start), 
                        xytext=(10, 20), textcoords='offset points',
                        fontsize=8, fontweight='bold',
-                       bbox=dict(boxstyle='round,pad=0.3', facecolor=event_info['color'], 
-                                alpha=0.3, edgecolor=event_info['color'], linewidth=1.5),
-                       arrowprops=dict(arrowstyle='->', color=event_info['color'], lw=1.5),
+                       bbox=dict(boxstyle='round,pad=0.3', facecolor=color, 
+                                alpha=0.3, edgecolor=color, linewidth=1.5),
+                       arrowprops=dict(arrowstyle='->', color=color, lw=1.5),
                        zorder=10)
-            legend_elements.append(plt.Rectangle((0, 0), 1, 1, facecolor=event_info['color'], 
+            legend_elements.append(plt.Rectangle((0, 0), 1, 1, facecolor=color, 
                                                  alpha=0.2, hatch='///',
-                                                 label=event_info['name']))
+                                                 label=name))
         else:
             # Standard shading for all other events - match price chart (alpha=0.2)
-            ax.axvspan(start, end, alpha=0.2, color=event_info['color'], zorder=0)
-            legend_elements.append(plt.Rectangle((0, 0), 1, 1, facecolor=event_info['color'], 
-                                                 alpha=0.2, label=event_info['name']))
+            ax.axvspan(start, end, alpha=0.2, color=color, zorder=0)
+            legend_elements.append(legend_patch)
     
     ax.set_ylabel('CHZ/BTC Ratio', fontsize=12, fontweight='bold')
     ax.set_xlabel('Date', fontsize=12, fontweight='bold')
@@ -223,16 +307,16 @@ def plot_chz_btc_ratio(chz_df: pd.DataFrame, btc_df: pd.DataFrame,
     
     # Remove vertical lines - keep it simple like price chart
     
-    plt.tight_layout()
-    plt.savefig(output_dir / "chz_btc_ratio_chart.png", dpi=300, bbox_inches='tight')
+    fig.tight_layout()
+    fig.savefig(output_dir / "chz_btc_ratio_chart.png", dpi=300, bbox_inches='tight')
     print(f"  Saved: chz_btc_ratio_chart.png")
-    plt.close()
+    plt.close(fig)
 
 
 def plot_window_returns(results_df: pd.DataFrame, output_dir: Path):
     """Plot bar chart of returns by window for each event."""
     # Focus on key windows
-    key_windows = ['pre_60_30', 'pre_30_14', 'pre_14_0', 'event_0_7', 'event_0_14', 'event_0_30']
+    key_windows = KEY_WINDOWS
     key_results = results_df[results_df['window_id'].isin(key_windows)].copy()
     
     # Pivot for easier plotting
@@ -274,83 +358,93 @@ def plot_window_returns(results_df: pd.DataFrame, output_dir: Path):
     ax.axhline(y=0, color='black', linestyle='--', linewidth=0.8)
     ax.grid(True, alpha=0.3, axis='y')
     
-    plt.tight_layout()
-    plt.savefig(output_dir / "window_returns_barchart.png", dpi=300, bbox_inches='tight')
+    fig.tight_layout()
+    fig.savefig(output_dir / "window_returns_barchart.png", dpi=300, bbox_inches='tight')
     print(f"  Saved: window_returns_barchart.png")
-    plt.close()
+    plt.close(fig)
 
 
 def plot_car_by_event(car_df: pd.DataFrame, output_dir: Path):
     """Plot Cumulative Abnormal Returns (CAR) for each event."""
-    fig, axes = plt.subplots(len(EVENTS), 1, figsize=(14, 4 * len(EVENTS)), sharex=True)
+    fig, axes = plt.subplots(len(EVENTS), 1, figsize=(14, 4 * len(EVENTS)), sharex=True, facecolor='white')
     
     if len(EVENTS) == 1:
         axes = [axes]
     
-    for idx, (event_id, event_info) in enumerate(EVENTS.items()):
-        ax = axes[idx]
-        
+    for ax, (event_id, event_start, event_end, color, name) in zip(axes, _EVENT_TUPLES):
         event_car = car_df[car_df['event_id'] == event_id].sort_values('days_from_event')
         
         ax.plot(event_car['days_from_event'], event_car['car'], 
-               linewidth=2, color=event_info['color'], label='CAR')
+               linewidth=2, color=color, label='CAR')
         ax.axhline(y=0, color='black', linestyle='--', linewidth=0.8)
         ax.axvline(x=0, color='red', linestyle='--', linewidth=1, alpha=0.7, label='Event Start')
         
         # Shade event period
-        event_start = event_info['start']
-        event_end = event_info['end']
         event_days = (event_end - event_start).days
-        ax.axvspan(0, event_days, alpha=0.1, color=event_info['color'])
+        ax.axvspan(0, event_days, alpha=0.1, color=color).set_rasterized(True)
         
         ax.set_ylabel('CAR', fontsize=11, fontweight='bold')
-        ax.set_title(f"{event_info['name']} - Cumulative Abnormal Returns", 
+        ax.set_title(f"{name} - Cumulative Abnormal Returns", 
                     fontsize=12, fontweight='bold')
         ax.legend(loc='best', fontsize=9)
         ax.grid(True, alpha=0.3)
     
     axes[-1].set_xlabel('Days from Event Start', fontsize=12, fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig(output_dir / "car_by_event.png", dpi=300, bbox_inches='tight')
+    fig.tight_layout()
+    fig.savefig(output_dir / "car_by_event.png", dpi=COMPOSITE_DPI, bbox_inches='tight')
     print(f"  Saved: car_by_event.png")
-    plt.close()
+    plt.close(fig)
+
+
+def add_event_start_lines(ax, label: str = None):
+    """
+    Mark every event start with a dotted full-height line in its color.
+    
+    All markers are one LineCollection (x in data, y in axes coordinates,
+    like axvline) so the axes draws them in a single call. It does not
+    change the data limits; callers set the x range themselves.
+    """
+    starts = mdates.date2num([start for _, start, _, _, _ in _EVENT_TUPLES])
+    lines = LineCollection(
+        [[(x, 0), (x, 1)] for x in starts],
+        colors=[color for _, _, _, color, _ in _EVENT_TUPLES],
+        linestyles=':', linewidths=1, alpha=0.5,
+        transform=ax.get_xaxis_transform(), label=label,
+    )
+    ax.add_collection(lines, autolim=False)
+    return lines
 
 
 def plot_rolling_beta(rolling_beta: pd.DataFrame, chz_df: pd.DataFrame, 
                       output_dir: Path):
     """Plot rolling beta of CHZ vs BTC."""
-    fig, axes = plt.subplots(2, 1, figsize=(14, 10), sharex=True)
+    fig, axes = plt.subplots(2, 1, figsize=(14, 10), sharex=True, facecolor='white')
     
     # Beta chart
     ax1 = axes[0]
-    rolling_beta_sorted = rolling_beta.sort_values('date')
-    ax1.plot(rolling_beta_sorted['date'], rolling_beta_sorted['beta'], 
+    ax1.plot(rolling_beta['date'], rolling_beta['beta'], 
             linewidth=2, color='#2E86AB', label='Rolling 60D Beta (CHZ vs BTC)')
     ax1.axhline(y=1.0, color='red', linestyle='--', linewidth=1, alpha=0.7, label='Beta = 1.0')
     
     # Mark event starts
-    for event_id, event_info in EVENTS.items():
-        ax1.axvline(x=event_info['start'], color=event_info['color'], 
-                   linestyle=':', linewidth=1, alpha=0.5)
+    add_event_start_lines(ax1)
     
     ax1.set_ylabel('Beta', fontsize=12, fontweight='bold')
     ax1.set_title('Rolling Beta: CHZ vs BTC (60-day window)', 
                  fontsize=14, fontweight='bold')
-    ax1.legend(loc='best', fontsize=9)
+    # Pinned: loc='best' does not avoid the event-start collection the way
+    # it avoided individual axvlines, and would move the legend
+    ax1.legend(loc='upper left', fontsize=9)
     ax1.grid(True, alpha=0.3)
     
     # CHZ price for context
     ax2 = axes[1]
-    chz_df_sorted = chz_df.sort_values('date')
-    ax2.plot(chz_df_sorted['date'], chz_df_sorted['close'], 
+    ax2.plot(chz_df['date'], chz_df['close'], 
             linewidth=2, color='#2E86AB', label='CHZ Price')
     
     # Mark event starts
-    for event_id, event_info in EVENTS.items():
-        ax2.axvline(x=event_info['start'], color=event_info['color'], 
-                   linestyle=':', linewidth=1, alpha=0.5, label=event_info['name'] 
-                   if event_id == list(EVENTS.keys())[0] else "")
+    add_event_start_lines(ax2, label=_EVENT_TUPLES[0][4])
     
     ax2.set_ylabel('CHZ Price (USD)', fontsize=12, fontweight='bold')
     ax2.set_xlabel('Date', fontsize=12, fontweight='bold')
@@ -362,95 +456,118 @@ def plot_rolling_beta(rolling_beta: pd.DataFrame, chz_df: pd.DataFrame,
     ax2.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
     ax2.xaxis.set_major_locator(mdates.YearLocator())
     # Set x-axis limits to show future event - extend to December 2026
-    if chz_df_sorted['date'].max() < date(2026, 12, 31):
-        ax2.set_xlim(left=chz_df_sorted['date'].min(), right=date(2026, 12, 31))
+    if chz_df['date'].max() < date(2026, 12, 31):
+        ax2.set_xlim(left=chz_df['date'].min(), right=date(2026, 12, 31))
     plt.xticks(rotation=45)
     
-    plt.tight_layout()
-    plt.savefig(output_dir / "rolling_beta.png", dpi=300, bbox_inches='tight')
+    fig.tight_layout()
+    fig.savefig(output_dir / "rolling_beta.png", dpi=COMPOSITE_DPI, bbox_inches='tight')
     print(f"  Saved: rolling_beta.png")
-    plt.close()
+    plt.close(fig)
 
 
 def plot_drawdown_curves(chz_df: pd.DataFrame, output_dir: Path):
     """Plot drawdown curves around events."""
-    fig, axes = plt.subplots(len(EVENTS), 1, figsize=(14, 4 * len(EVENTS)), sharex=True)
+    fig, axes = plt.subplots(len(EVENTS), 1, figsize=(14, 4 * len(EVENTS)), sharex=True, facecolor='white')
     
     if len(EVENTS) == 1:
         axes = [axes]
     
-    for idx, (event_id, event_info) in enumerate(EVENTS.items()):
-        ax = axes[idx]
-        
-        event_start = event_info['start']
+    # chz_df is in date order (see sort_by_date), so each event window is a
+    # contiguous row range found by binary search
+    dates = chz_df['date'].to_numpy().astype('datetime64[D]')
+    
+    for ax, (_, event_start, event_end, _, name) in zip(axes, _EVENT_TUPLES):
         window_start = event_start - timedelta(days=120)
         window_end = event_start + timedelta(days=90)
         
-        window_df = chz_df[
-            (chz_df['date'] >= window_start) & 
-            (chz_df['date'] <= window_end)
-        ].copy().sort_values('date')
-        
-        if len(window_df) == 0:
+        lo = np.searchsorted(dates, np.datetime64(window_start, 'D'), side='left')
+        hi = np.searchsorted(dates, np.datetime64(window_end, 'D'), side='right')
+        if lo == hi:
             continue
+        window_df = chz_df.iloc[lo:hi]
         
-        # Compute drawdown
-        window_df['cum_return'] = (1 + window_df['return']).cumprod() - 1
-        running_max = window_df['cum_return'].expanding().max()
-        drawdown = window_df['cum_return'] - running_max
+        # Compute drawdown in one NumPy pass. Missing returns are skipped
+        # by the product and stay missing, as with pandas' cumprod();
+        # fmax.accumulate ignores them like expanding().max().
+        r = window_df['return'].to_numpy(dtype=np.float64)
+        cum_return = np.nancumprod(1.0 + r) - 1.0
+        cum_return[np.isnan(r)] = np.nan
+        running_max = np.fmax.accumulate(cum_return)
+        drawdown = cum_return - running_max
         
-        # Days from event
-        if isinstance(window_df['date'].iloc[0], date):
-            window_df['days_from_event'] = window_df['date'].apply(lambda x: (x - event_start).days)
-        else:
-            window_df['date'] = pd.to_datetime(window_df['date']).dt.date
-            window_df['days_from_event'] = window_df['date'].apply(lambda x: (x - event_start).days)
+        # Days from event, straight off the datetime64[D] axis
+        days_from_event = (dates[lo:hi] - np.datetime64(event_start, 'D')).astype(np.int32)
         
-        ax.fill_between(window_df['days_from_event'], 0, drawdown, 
+        ax.fill_between(days_from_event, 0, drawdown, 
                        alpha=0.3, color='red', label='Drawdown')
-        ax.plot(window_df['days_from_event'], drawdown, 
+        ax.plot(days_from_event, drawdown, 
                linewidth=2, color='red', label='Drawdown')
         ax.axhline(y=0, color='black', linestyle='--', linewidth=0.8)
         ax.axvline(x=0, color='blue', linestyle='--', linewidth=1, alpha=0.7, label='Event Start')
         
         # Shade event period
-        event_days = (event_info['end'] - event_info['start']).days
-        ax.axvspan(0, event_days, alpha=0.1, color='blue')
+        event_days = (event_end - event_start).days
+        ax.axvspan(0, event_days, alpha=0.1, color='blue').set_rasterized(True)
         
         ax.set_ylabel('Drawdown', fontsize=11, fontweight='bold')
-        ax.set_title(f"{event_info['name']} - Drawdown Curve", 
+        ax.set_title(f"{name} - Drawdown Curve", 
                     fontsize=12, fontweight='bold')
         ax.legend(loc='best', fontsize=9)
         ax.grid(True, alpha=0.3)
     
     axes[-1].set_xlabel('Days from Event Start', fontsize=12, fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig(output_dir / "drawdown_curves.png", dpi=300, bbox_inches='tight')
+    fig.tight_layout()
+    fig.savefig(output_dir / "drawdown_curves.png", dpi=COMPOSITE_DPI, bbox_inches='tight')
     print(f"  Saved: drawdown_curves.png")
-    plt.close()
+    plt.close(fig)
 
 
 def create_summary_table(results_df: pd.DataFrame, output_dir: Path):
     """Create summary table of key metrics."""
-    key_windows = ['pre_60_30', 'pre_30_14', 'pre_14_0', 'event_0_7', 'event_0_14', 'event_0_30']
-    key_results = results_df[results_df['window_id'].isin(key_windows)].copy()
+    # All metrics for all key windows in one group_by. NaN is treated as
+    # missing (pandas' skipna) and missing returns count as misses in the
+    # hit rate; the left join keeps empty windows and the rows are put
+    # back in KEY_WINDOWS order by position.
+    ret = pl.col('return').fill_nan(None)
+    metrics = (
+        pl.from_pandas(results_df[list(PLOT_COLUMNS['window_metrics'])])
+        .lazy()
+        .filter(pl.col('window_id').is_in(KEY_WINDOWS))
+        .group_by('window_id')
+        .agg([
+            pl.len().alias('n'),
+            ret.mean().alias('mean_return'),
+            ret.median().alias('median_return'),
+            (ret > 0).fill_null(False).mean().alias('hit_rate'),
+            *(pl.col(c).fill_nan(None).mean() for c in ('excess_vs_btc', 'excess_vs_eth', 'max_drawdown', 'volatility')),
+        ])
+    )
+    rows = (
+        pl.LazyFrame({'window_id': KEY_WINDOWS})
+        .with_row_index('order')
+        .join(metrics, on='window_id', how='left')
+        .sort('order')
+        .with_columns(pl.col('n').fill_null(0))
+        .collect()
+        .to_dicts()
+    )
     
-    summary = []
-    for window_id in key_windows:
-        window_data = key_results[key_results['window_id'] == window_id]
-        
-        summary.append({
-            'Window': window_id,
-            'N Events': len(window_data),
-            'Mean Return': f"{window_data['return'].mean():.2%}",
-            'Median Return': f"{window_data['return'].median():.2%}",
-            'Hit Rate': f"{window_data['return'].gt(0).mean():.1%}",
-            'Mean Excess vs BTC': f"{window_data['excess_vs_btc'].mean():.2%}",
-            'Mean Excess vs ETH': f"{window_data['excess_vs_eth'].mean():.2%}",
-            'Mean Max DD': f"{window_data['max_drawdown'].mean():.2%}",
-            'Mean Volatility': f"{window_data['volatility'].mean():.1%}",
-        })
+    def pct(value, spec: str) -> str:
+        return format(np.nan if value is None else value, spec)
+    
+    summary = [{
+        'Window': row['window_id'],
+        'N Events': row['n'],
+        'Mean Return': pct(row['mean_return'], '.2%'),
+        'Median Return': pct(row['median_return'], '.2%'),
+        'Hit Rate': pct(row['hit_rate'], '.1%'),
+        'Mean Excess vs BTC': pct(row['excess_vs_btc'], '.2%'),
+        'Mean Excess vs ETH': pct(row['excess_vs_eth'], '.2%'),
+        'Mean Max DD': pct(row['max_drawdown'], '.2%'),
+        'Mean Volatility': pct(row['volatility'], '.1%'),
+    } for row in rows]
     
     summary_df = pd.DataFrame(summary)
     summary_df.to_csv(output_dir / "summary_table.csv", index=False)
@@ -466,20 +583,31 @@ def create_summary_table(results_df: pd.DataFrame, output_dir: Path):
         print(f"  Skipped: summary_table.tex (jinja2 not available)")
 
 
-def main():
-    """Main visualization function."""
+def main(outputs: Optional[dict] = None):
+    """
+    Main visualization function.
+    
+    Args:
+        outputs: Optional in-memory event-study outputs (as returned by
+            chz_event_study.main()); read from outputs/ when omitted
+    """
     print("=" * 80)
     print("CHZ World Cup Event Study - Visualization")
     print("=" * 80)
     
     output_dir = Path(__file__).parent / "outputs"
     
-    if not (output_dir / "chz_data.csv").exists():
-        print("\n[ERROR] Data files not found. Please run chz_event_study.py first.")
-        return
-    
-    print("\nLoading data...")
-    chz_df, btc_df, results_df, car_df, rolling_beta = load_data(output_dir)
+    if outputs is not None:
+        chz_df, btc_df, results_df, car_df, rolling_beta = sort_by_date(*(
+            outputs[name] for name in ("chz_data", "btc_data", "window_metrics", "abnormal_returns", "rolling_beta")
+        ))
+    else:
+        if not _result_path(output_dir, "chz_data").exists():
+            print("\n[ERROR] Data files not found. Please run chz_event_study.py first.")
+            return
+        
+        print("\nLoading data...")
+        chz_df, btc_df, results_df, car_df, rolling_beta = load_data(output_dir)
     
     print("\nGenerating visualizations...")
     plot_price_chart_with_events(chz_df, btc_df, output_dir)
@@ -105,6 +105,7 @@ class OutputGenerator:
             })
             empty_equity.write_csv(self.reports_dir / "bt_equity_curve.csv")
             empty_pnl.write_csv(self.reports_dir / "bt_daily_pnl.csv")
+            empty_pnl.write_parquet(self.reports_dir / "bt_daily_pnl.parquet")
             return
         
         # Equity curve - start at 1.0, then compound returns
@@ -119,9 +120,10 @@ class OutputGenerator:
         path = self.reports_dir / "bt_equity_curve.csv"
         equity.write_csv(path)
         
-        # Daily PnL
+        # Daily PnL (CSV for humans; typed parquet copy for the analysis scripts)
         path = self.reports_dir / "bt_daily_pnl.csv"
         backtest_results.write_csv(path)
+        backtest_results.write_parquet(self.reports_dir / "bt_daily_pnl.parquet")
         
         logger.info(f"Wrote backtest results: {path}")
     
@@ -173,7 +173,7 @@ def main() -> int:
                    default=_REPO_ROOT / "outputs" / "writer_race_canonical_slug_mapping.csv",
                    help="Path to canonical slug mapping CSV.")
     p.add_argument("--sleep-seconds", type=float, default=2.0,
-                   help="Sleep between API calls (default 2.0s = ~30 calls/min, Basic-tier safe).")
+                   help="Minimum spacing between API call starts (default 2.0s = ~30 calls/min, Basic-tier safe).")
     p.add_argument("--dry-run", action="store_true",
                    help="Fetch and report counts but do NOT write to fact tables.")
     args = p.parse_args()
@@ -191,7 +191,7 @@ def main() -> int:
     _log(f"Date range: {args.start_date} to {args.end_date} ({(args.end_date - args.start_date).days + 1} days)")
     _log(f"Mapping:    {args.mapping_path}")
     _log(f"Dry-run:    {args.dry_run}")
-    _log(f"Sleep:      {args.sleep_seconds}s between calls")
+    _log(f"Spacing:    {args.sleep_seconds}s between call starts")
 
     mapping = _load_canonical_mapping(args.mapping_path)
     _log(f"Loaded {len(mapping)} canonical slugs to re-fetch (USC excluded; dropped from allowlist)")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+One-shot layout repair: rewrite fact_price.parquet sorted by (asset_id, date).
+
+Single-asset reads (e.g. `asset_id == 'ETH'`) can only skip row groups when each
+group covers a narrow asset_id range in its footer min/max statistics. Appends
+sorted by date leave every group spanning nearly all assets, so this rewrites
+the file clustered by asset with bounded row groups. Rows and schema (including
+pandas metadata) are unchanged; only row order and grouping differ.
+
+Usage:
+    python scripts/repair_fact_price_layout.py
+    python scripts/repair_fact_price_layout.py --row-group-size 100000 --dry-run
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from repo_paths import data_lake_root
+
+
+def describe_layout(path: Path) -> str:
+    """One line per row group: rows and asset_id min/max from the footer."""
+    md = pq.ParquetFile(path).metadata
+    asset_idx = md.schema.names.index("asset_id")
+    lines = []
+    for i in range(md.num_row_groups):
+        rg = md.row_group(i)
+        stats = rg.column(asset_idx).statistics
+        span = f"{stats.min}..{stats.max}" if stats is not None and stats.has_min_max else "no stats"
+        lines.append(f"  row group {i}: {rg.num_rows:,} rows, asset_id {span}")
+    return "\n".join(lines)
+
+
+def repair_layout(path: Path, row_group_size: int, dry_run: bool = False) -> None:
+    """Sort `path` by (asset_id, date) and rewrite it atomically."""
+    print(f"Current layout of {path}:")
+    print(describe_layout(path))
+
+    table = pq.read_table(path)
+    sorted_table = table.sort_by([("asset_id", "ascending"), ("date", "ascending")])
+
+    if dry_run:
+        print(f"\n[DRY RUN] Would rewrite {table.num_rows:,} rows with row_group_size={row_group_size:,}")
+        return
+
+    tmp_path = path.with_suffix(".parquet.tmp")
+    pq.write_table(sorted_table, tmp_path, row_group_size=row_group_size, write_statistics=True)
+    os.replace(tmp_path, path)
+
+    print(f"\nRewrote {sorted_table.num_rows:,} rows. New layout:")
+    print(describe_layout(path))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cluster fact_price.parquet by (asset_id, date) for row-group pruning")
+    parser.add_argument(
+        "--path",
+        type=Path,
+        default=None,
+        help="Parquet file to rewrite (default: <data_lake_root>/fact_price.parquet)",
+    )
+    parser.add_argument("--row-group-size", type=int, default=200_000, help="Rows per row group (default: 200000)")
+    parser.add_argument("--dry-run", action="store_true", help="Report the current layout without rewriting")
+    args = parser.parse_args()
+
+    path = args.path or (data_lake_root() / "fact_price.parquet")
+    if not path.exists():
+        print(f"[ERROR] {path} not found")
+        sys.exit(1)
+
+    repair_layout(path, args.row_group_size, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
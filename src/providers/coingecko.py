@@ -2,6 +2,7 @@
 
 import json
 import os
+import threading
 import time
 import requests
 from datetime import datetime, date, timedelta, timezone
@@ -57,6 +58,47 @@ def _maybe_raise_monthly_credit_exhausted(resp: requests.Response) -> None:
         )
 
 
+class _TokenBucket:
+    """
+    Thread-safe token bucket shared by every `fetch_price_history` call.
+
+    Spacing is measured between request *starts*, so time spent waiting on the
+    HTTP round trip counts toward the budget instead of being followed by a fixed
+    post-response sleep. Back-to-back calls (e.g. the last request of one chunk
+    and the first of the next) therefore only wait for whatever part of the
+    interval the previous request did not already consume.
+
+    `acquire(interval=...)` lets a caller pick its own spacing (faster or slower
+    than `rate`): the call is charged `interval * rate` tokens, so the next start
+    waits exactly `interval` seconds behind it.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, interval: Optional[float] = None) -> None:
+        """Block until one token is available, then consume this call's cost."""
+        cost = 1.0 if interval is None else max(0.0, float(interval)) * self.rate
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            wait = (1.0 - self._tokens) / self.rate if self._tokens < 1.0 else 0.0
+            # Reserve the cost now (balance may go negative) so concurrent
+            # callers queue behind us instead of racing for the same refill.
+            self._tokens -= cost
+        if wait > 0:
+            time.sleep(wait)
+
+
+# 240 calls/min: under the 250/min Pro ceiling with headroom to avoid 429s.
+_LIMITER = _TokenBucket(rate=240 / 60.0)
+
+
 def get_coingecko_api_key() -> str:
     """Return the CoinGecko API key from env (empty string if unset)."""
     return str(COINGECKO_API_KEY or "").strip()
@@ -138,7 +180,7 @@ def fetch_price_history(
     coingecko_id: str,
     start_date: date,
     end_date: date,
-    sleep_seconds: float = 0.25,  # min spacing: 240 calls/min (under 250/min Pro ceiling; avoids 429)
+    sleep_seconds: Optional[float] = None,  # min spacing between call starts; default: _LIMITER (240 calls/min)
     max_retries: int = 5,
 ) -> Tuple[Dict[date, float], Dict[date, float], Dict[date, float]]:
     """
@@ -159,10 +201,11 @@ def fetch_price_history(
         "x_cg_pro_api_key": COINGECKO_API_KEY,
     }
     
-    delay = sleep_seconds
+    delay = sleep_seconds if sleep_seconds is not None else 1.0 / _LIMITER.rate
     last_http_status: Optional[int] = None
     for attempt in range(1, max_retries + 1):
         try:
+            _LIMITER.acquire(sleep_seconds)
             # Disable proxy to avoid connection issues
             resp = requests.get(url, params=params, timeout=30, proxies={"http": None, "https": None})
             last_http_status = resp.status_code
@@ -190,7 +233,6 @@ def fetch_price_history(
                     d = datetime.fromtimestamp(ts_ms / 1000.0, tz=timezone.utc).date()
                     volumes[d] = float(vol)
                 
-                time.sleep(sleep_seconds)
                 return prices, market_caps, volumes
             
             elif resp.status_code == 404:
@@ -226,7 +268,6 @@ def fetch_price_history(
                     end_date,
                     f"HTTP_{resp.status_code} body_prefix={snippet!r}",
                 )
-                time.sleep(sleep_seconds)
                 return {}, {}, {}
                 
         except Exception as e:
@@ -290,7 +331,7 @@ def download_all_coins(
     
     total_coins = len(allowlist_df)
     print(f"Downloading data for {total_coins} coins from {start_date} to {end_date}...")
-    # Throttle matches fetch_price_history default sleep (0.25s) ≈ 240 calls/min max
+    # Throttle matches the shared fetch_price_history limiter ≈ 240 calls/min max
     estimated_minutes = (total_coins * 0.25) / 60.0
     print(f"Estimated time: ~{estimated_minutes:.1f} minutes (<=240 calls/min effective, under 250/min cap)\n")
     
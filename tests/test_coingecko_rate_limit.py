@@ -0,0 +1,79 @@
+"""Test CoinGecko call spacing from the shared token bucket."""
+
+import pytest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.providers import coingecko
+from src.providers.coingecko import _TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock that only advances when the code under test sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(coingecko.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(coingecko.time, "sleep", fake.sleep)
+    return fake
+
+
+def _start_times(bucket, clock, n, interval=None):
+    starts = []
+    for _ in range(n):
+        bucket.acquire(interval)
+        starts.append(clock.now)
+    return starts
+
+
+def test_default_spacing_matches_rate(clock):
+    """Back-to-back calls start 1/rate seconds apart; the first is immediate."""
+    bucket = _TokenBucket(rate=4.0)
+    starts = _start_times(bucket, clock, 4)
+
+    assert starts[0] == pytest.approx(1000.0)
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert gaps == pytest.approx([0.25, 0.25, 0.25])
+
+
+def test_elapsed_request_time_counts_toward_spacing(clock):
+    """Time spent on the HTTP round trip is not followed by a full extra wait."""
+    bucket = _TokenBucket(rate=4.0)
+    bucket.acquire()
+    clock.now += 0.1  # request in flight
+    bucket.acquire()
+
+    assert clock.sleeps == pytest.approx([0.15])
+
+
+def test_explicit_interval_is_slower_than_rate(clock):
+    """An explicit interval (e.g. Basic-tier 2.0s) spaces starts by that interval."""
+    bucket = _TokenBucket(rate=4.0)
+    starts = _start_times(bucket, clock, 3, interval=2.0)
+
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert gaps == pytest.approx([2.0, 2.0])
+
+
+def test_explicit_interval_is_faster_than_rate(clock):
+    """An explicit interval below 1/rate (e.g. Analyst-tier 0.12s) is not capped."""
+    bucket = _TokenBucket(rate=4.0)
+    starts = _start_times(bucket, clock, 3, interval=0.12)
+
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert gaps == pytest.approx([0.12, 0.12])